@@ -0,0 +1,137 @@
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+
+class AnomalyRowStore:
+    """
+    Compact store of anomalous rows per (check, column).
+
+    Parameters:
+    - df: pd.DataFrame | Frame the row positions refer to (optional)
+    - frame_loader: callable | Returns that frame on demand when df is not kept (optional)
+
+    Each entry is kept either as sorted row positions or, when more than one
+    row in 32 is flagged, as a packed bitmap -- whichever is smaller. Rows are
+    only materialized when asked for, via `rows`, `page` or `to_csv`.
+    """
+
+    def __init__(self, df: pd.DataFrame = None, frame_loader=None):
+        self._df = df
+        self._frame_loader = frame_loader
+        self._entries = {}
+
+    def add(self, check: str, column, mask):
+        """Record the rows flagged by a boolean mask for a check and column."""
+        mask = np.asarray(mask, dtype=bool)
+        n_rows = len(mask)
+        hits = int(mask.sum())
+        if hits * 32 > n_rows:
+            entry = ('bitmap', np.packbits(mask), n_rows, hits)
+        else:
+            dtype = np.uint32 if n_rows < 2 ** 32 else np.int64
+            entry = ('positions', np.flatnonzero(mask).astype(dtype), n_rows, hits)
+        self._entries.setdefault(check, {})[column] = entry
+
+    def merge(self, other: "AnomalyRowStore"):
+        """Take over the entries of a store built on the same rows (e.g. another column shard)."""
+        for check, columns in other._entries.items():
+            self._entries.setdefault(check, {}).update(columns)
+        return self
+
+    def reorder(self, column_order):
+        """Order the columns of every check to follow column_order."""
+        position = {col: i for i, col in enumerate(column_order)}
+        for check, columns in self._entries.items():
+            self._entries[check] = dict(sorted(columns.items(), key=lambda kv: position.get(kv[0], len(position))))
+
+    def __getstate__(self):
+        # Only the compact entries are pickled, never the frame they refer to
+        state = self.__dict__.copy()
+        state['_df'] = None
+        state['_frame_loader'] = None
+        return state
+
+    def checks(self):
+        return list(self._entries)
+
+    def columns(self, check: str):
+        return list(self._entries.get(check, {}))
+
+    def count(self, check: str, column) -> int:
+        return self._entries[check][column][3]
+
+    def positions(self, check: str, column) -> np.ndarray:
+        kind, data, n_rows, _ = self._entries[check][column]
+        if kind == 'bitmap':
+            return np.flatnonzero(np.unpackbits(data, count=n_rows))
+        return data.astype(np.int64)
+
+    def nbytes(self) -> int:
+        return sum(entry[1].nbytes for columns in self._entries.values() for entry in columns.values())
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        if self._df is None:
+            if self._frame_loader is None:
+                raise ValueError("No frame available to materialize rows from")
+            self._df = self._frame_loader()
+        return self._df
+
+    def rows(self, check: str, column) -> pd.DataFrame:
+        """Materialize every flagged row for a check and column."""
+        return self.frame.iloc[self.positions(check, column)]
+
+    def page(self, check: str, column, page: int = 0, page_size: int = 1000) -> pd.DataFrame:
+        """Materialize one page of flagged rows."""
+        positions = self.positions(check, column)
+        return self.frame.iloc[positions[page * page_size:(page + 1) * page_size]]
+
+    def iter_pages(self, check: str, column, page_size: int = 1000):
+        positions = self.positions(check, column)
+        for start in range(0, len(positions), page_size):
+            yield self.frame.iloc[positions[start:start + page_size]]
+
+    def to_csv(self, path: str, check: str, columns=None, page_size: int = 100_000):
+        """
+        Stream flagged rows to a CSV file page by page.
+
+        Parameters:
+        - path: str | Output file
+        - check: str | Check name, e.g. 'nulls', 'outliers', 'placeholders'
+        - columns: list | Columns to export, defaults to all flagged columns
+        - page_size: int | Rows materialized at a time
+        """
+        header = True
+        for column in (columns if columns is not None else self.columns(check)):
+            for rows in self.iter_pages(check, column, page_size):
+                rows = rows.assign(check=check, column=column)
+                rows.to_csv(path, mode='w' if header else 'a', header=header)
+                header = False
+
+    def view(self, check: str) -> "LazyRowsView":
+        return LazyRowsView(self, check)
+
+
+class LazyRowsView(Mapping):
+    """Read-only dict-of-DataFrames view over one check; rows are built on access."""
+
+    def __init__(self, store: AnomalyRowStore, check: str):
+        self._store = store
+        self._check = check
+
+    def __getitem__(self, column):
+        if column not in self._store.columns(self._check):
+            raise KeyError(column)
+        return self._store.rows(self._check, column)
+
+    def __iter__(self):
+        return iter(self._store.columns(self._check))
+
+    def __len__(self):
+        return len(self._store.columns(self._check))
+
+    def __repr__(self):
+        counts = {col: self._store.count(self._check, col) for col in self}
+        return f"LazyRowsView({self._check!r}, rows={counts})"
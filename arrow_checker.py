@@ -0,0 +1,526 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from anomaly_rows import AnomalyRowStore
+from data_quality_checker import (PLACEHOLDER_PATTERN, DateIndex, compile_placeholder_pattern, is_placeholder,
+                                  is_empty_string, parse_dates, build_date_index, wide_to_long_by_date,
+                                  guess_datetime_format)
+from duplicate_detector import DuplicateDetector, DuplicateReport
+from utils.instrumentation import Instrumentation
+
+# Checks the Arrow backend implements, in the same order as the built-in registry
+ARROW_CHECKS = ("column_summary", "nulls", "outliers", "duplicates", "mixed_types", "outliers_by_date",
+                "placeholder_counts", "placeholder_counts_by_date", "nulls_by_date", "empty_strings_by_date")
+BY_DATE_CHECKS = ("outliers_by_date", "placeholder_counts_by_date", "nulls_by_date", "empty_strings_by_date")
+
+# strftime directives Arrow's strptime does not parse like pandas; such formats fall back to pandas
+_PANDAS_ONLY_DIRECTIVES = ("%f", "%z", "%Z")
+_ROW = "__dq_row__"
+_DATE = "__dq_date__"
+
+
+def is_text_type(arrow_type) -> bool:
+    """String and dictionary-encoded string columns are checked as text."""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type) or \
+        pa.types.is_string_view(arrow_type)
+
+
+def is_numeric_type(arrow_type) -> bool:
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def nan_to_null(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Turn float NaN into nulls, matching how pandas treats both as missing."""
+    if not pa.types.is_floating(values.type):
+        return values
+    return pc.if_else(pc.is_nan(values), pa.scalar(None, values.type), values)
+
+
+def dictionary_indices(encoded: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Indices of a dictionary-encoded ChunkedArray (whose chunks share one dictionary)."""
+    return pa.chunked_array([chunk.indices for chunk in encoded.chunks], type=encoded.type.index_type)
+
+
+def grouped_iqr_bounds(values: np.ndarray, codes: np.ndarray, n_groups: int) -> tuple:
+    """
+    IQR fences of every group from one sort, with linearly interpolated
+    quartiles like Series.quantile; NaN values are skipped.
+
+    Parameters:
+    - values: np.ndarray | float64 values
+    - codes: np.ndarray | Group of every value, 0 to n_groups - 1
+    - n_groups: int | Number of groups
+
+    Returns:
+    - (np.ndarray, np.ndarray, np.ndarray) | Lower and upper fences (NaN for
+      groups without values) and the non-NaN count per group
+    """
+    present = ~np.isnan(values)
+    values, codes = values[present], codes[present]
+    counts = np.bincount(codes, minlength=n_groups)
+    if not len(values):
+        fences = np.full(n_groups, np.nan)
+        return fences, fences, counts
+    values = values[np.lexsort((values, codes))]
+    starts = np.cumsum(counts) - counts
+    quartiles = []
+    for q in (0.25, 0.75):
+        position = starts + q * np.maximum(counts - 1, 0)
+        # Empty groups point past their start; clip them and drop them below
+        low = np.minimum(np.floor(position).astype(np.int64), len(values) - 1)
+        high = np.minimum(np.ceil(position).astype(np.int64), len(values) - 1)
+        quartile = values[low] + (values[high] - values[low]) * (position - np.floor(position))
+        quartiles.append(np.where(counts > 0, quartile, np.nan))
+    q1, q3 = quartiles
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr, counts
+
+
+def columns_for_checks(schema: pa.Schema, checks=ARROW_CHECKS, date_column: str = None,
+                       duplicate_subset: list = None) -> list:
+    """
+    Columns the given checks read, in schema order, so a Parquet load can skip the rest.
+
+    Parameters:
+    - schema: pa.Schema | Schema of the source, e.g. pyarrow.parquet.read_schema(path)
+    - checks: list | Check names from ARROW_CHECKS (the built-in checks)
+    - date_column: str | Added for the by-date checks
+    - duplicate_subset: list | Key columns of the duplicate check, defaults to all
+
+    Returns:
+    - list | Column names
+    """
+    needed = set()
+    for name in checks:
+        if name in ("column_summary", "nulls", "mixed_types", "nulls_by_date"):
+            needed.update(schema.names)
+        elif name == "duplicates":
+            needed.update(duplicate_subset or schema.names)
+        elif name in ("outliers", "outliers_by_date"):
+            needed.update(field.name for field in schema if is_numeric_type(field.type))
+        elif name in ("placeholder_counts", "placeholder_counts_by_date", "empty_strings_by_date"):
+            needed.update(field.name for field in schema if is_text_type(field.type))
+        else:
+            raise ValueError(f"Check not supported by the Arrow backend: {name}")
+        if name in BY_DATE_CHECKS and date_column:
+            needed.add(date_column)
+    return [col for col in schema.names if col in needed]
+
+
+class ArrowDataQualityChecker:
+    """
+    DataQualityChecker backend running directly on a pyarrow.Table.
+
+    Parameters:
+    - table: pa.Table | Data to check; a pd.DataFrame is converted once
+    - date_column: str | Column used for the by-date breakdowns (optional)
+    - placeholders: list | Regex fragments, defaults to PLACEHOLDERS
+    - date_format: str | strftime format of date_column, inferred when None
+    - duplicate_subset: list | Key columns for the duplicate check
+    - instrumentation: Instrumentation | Records every stage (optional)
+
+    Null, distinct and quantile work runs on pyarrow.compute kernels over the
+    Arrow buffers, so a table read with load_parquet(as_arrow=True) is never
+    converted to pandas; only the small per-column and per-date aggregates
+    are. Results have the same keys and layout as DataQualityChecker.run_all_checks.
+
+    Differences from the pandas checker:
+    - Arrow columns hold a single type, so mixed_types is always empty.
+    - Quantiles are exact (no sketch backend) and distinct counts are exact.
+    - Only the built-in checks run; custom checks registered with
+      register_check need the pandas checker.
+    - Flagged rows are materialized from table.to_pandas() on first access.
+
+    For Parquet files, `from_parquet` only reads the columns the requested
+    checks need and can prune row groups by date. Null counts come from the
+    footer statistics for columns no other check reads; null_rows leaves those
+    columns out.
+    """
+
+    def __init__(self, table, date_column: str = None, placeholders: list = None, date_format: str = None,
+                 duplicate_subset: list = None, instrumentation: Instrumentation = None):
+        if isinstance(table, pd.DataFrame):
+            table = pa.Table.from_pandas(table, preserve_index=False)
+        self.table = table
+        self.date_column = date_column
+        self.date_format = date_format
+        self.duplicate_subset = duplicate_subset
+        self.placeholder_pattern = PLACEHOLDER_PATTERN if placeholders is None else compile_placeholder_pattern(placeholders)
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self._null_masks = None
+        self._encoded_cache = {}
+        self._text_mask_cache = {}
+        self._date_index_cache = None
+        # Checks the loaded columns can answer (narrowed by from_parquet)
+        self.checks = ARROW_CHECKS
+        # column -> null count from the Parquet footer, None for loaded columns (set by from_parquet)
+        self.footer_nulls = None
+        self.anomaly_rows = AnomalyRowStore(frame_loader=self.table.to_pandas)
+
+    @classmethod
+    def from_parquet(cls, path: str, only: list = None, date_column: str = None, date_range: tuple = None,
+                     duplicate_subset: list = None, **kwargs) -> "ArrowDataQualityChecker":
+        """
+        Checker over a Parquet file that only reads what the checks need.
+
+        Parameters:
+        - path: str | Parquet file
+        - only: list | Checks that will be run, defaults to all; only their columns are read
+        - date_column: str | Column used for the by-date breakdowns (optional)
+        - date_range: tuple | (start, end) inclusive, see load_parquet; row groups
+          outside the range are skipped from their footer statistics (null
+          counts are then read from the columns)
+        - duplicate_subset: list | Key columns for the duplicate check
+        - kwargs: extra params passed to ArrowDataQualityChecker
+
+        Returns:
+        - ArrowDataQualityChecker | run_all_checks() then runs the `only` checks
+        """
+        import pyarrow.parquet as pq
+        from file_handlers.load_parquet import load_parquet
+        from file_handlers.parquet_metadata import parquet_null_counts
+
+        checks = ARROW_CHECKS if only is None else tuple(name for name in ARROW_CHECKS if name in only)
+        schema = pq.read_schema(path)
+        footer = {}
+        if "nulls" in checks and date_range is None:
+            # Float statistics do not count NaN, so float columns are read like
+            # the columns whose row groups lack statistics
+            counts = parquet_null_counts(path, scan_missing=False, scan_floats=True)
+            footer = {col: int(count) for col, count in zip(counts['column'], counts['null_count'])
+                      if pd.notna(count)}
+        columns = columns_for_checks(schema, [name for name in checks if name != "nulls" or not footer],
+                                     date_column, duplicate_subset)
+        if footer:
+            needed = set(columns) | {col for col in schema.names if col not in footer}
+            columns = [col for col in schema.names if col in needed]
+        table = load_parquet(path, as_arrow=True, columns=columns, date_column=date_column, date_range=date_range)
+        checker = cls(table, date_column=date_column, duplicate_subset=duplicate_subset, **kwargs)
+        checker.checks = checks
+        if set(footer) - set(columns):
+            checker.footer_nulls = {col: None if col in columns else footer[col] for col in schema.names}
+        return checker
+
+    def run_all_checks(self, only: list = None):
+        """
+        Run the checks and collect the results.
+
+        Parameters:
+        - only: list | Names of the checks to run (from ARROW_CHECKS), defaults to
+          all of them (or those given to from_parquet)
+
+        Returns:
+        - dict | Same layout as DataQualityChecker.run_all_checks
+        """
+        if only is not None:
+            unknown = [name for name in only if name not in ARROW_CHECKS]
+            if unknown:
+                raise ValueError(f"Checks not supported by the Arrow backend: {unknown}")
+            unloaded = [name for name in only if name not in self.checks]
+            if unloaded:
+                raise ValueError(f"Checks whose columns were not loaded: {unloaded}")
+        names = [name for name in self.checks if only is None or name in only]
+
+        results = {}
+        rows = self.table.num_rows
+        for name in names:
+            if name in BY_DATE_CHECKS and not self.date_column:
+                results[name] = pd.DataFrame()
+                continue
+            with self.instrumentation.stage(name, rows=rows):
+                results[name] = getattr(self, f"_{name}")()
+
+        results["null_rows"] = self.null_rows = self.anomaly_rows.view('nulls')
+        results["outlier_rows"] = self.outlier_rows = self.anomaly_rows.view('outliers')
+        results["placeholder_rows"] = self.placeholder_rows = self.anomaly_rows.view('placeholders')
+        results["anomaly_rows"] = self.anomaly_rows
+        if "duplicates" in names:
+            results["duplicate_groups"] = self.duplicate_report.groups
+        results["metrics"] = self.instrumentation.metrics
+        return results
+
+    # Shared intermediates, built once and timed like the pandas checker's
+
+    def _intermediate(self, name, build):
+        with self.instrumentation.stage(name, kind='intermediate', rows=self.table.num_rows):
+            return build()
+
+    def null_masks(self) -> list:
+        # One Arrow boolean mask per column; float NaN counts as null like in pandas
+        if self._null_masks is None:
+            self._null_masks = self._intermediate('null_mask', lambda: [
+                pc.is_null(column, nan_is_null=True) for column in self.table.columns])
+        return self._null_masks
+
+    def text_columns(self) -> list:
+        return [field.name for field in self.table.schema if is_text_type(field.type)]
+
+    def numeric_columns(self) -> list:
+        return [field.name for field in self.table.schema if is_numeric_type(field.type)]
+
+    def _encoded(self, col) -> pa.ChunkedArray:
+        # Dictionary encoding with one dictionary shared by every chunk, so
+        # string predicates run once per distinct value
+        if col not in self._encoded_cache:
+            values = self.table.column(col)
+            if not pa.types.is_dictionary(values.type):
+                values = pc.dictionary_encode(values)
+            self._encoded_cache[col] = values.unify_dictionaries()
+        return self._encoded_cache[col]
+
+    def _text_mask(self, col, kind: str) -> np.ndarray:
+        key = (col, kind)
+        if key not in self._text_mask_cache:
+            predicate = is_placeholder(self.placeholder_pattern) if kind == 'placeholder' else is_empty_string
+            encoded = self._encoded(col)
+            if encoded.num_chunks:
+                dictionary = encoded.chunk(0).dictionary.to_pandas().astype(object)
+                matches = pa.array(np.asarray(predicate(dictionary), dtype=bool))
+                # Null rows have null indices, which take() keeps null; they never match
+                mask = pc.fill_null(pc.take(matches, dictionary_indices(encoded)), False)
+                mask = mask.to_numpy(zero_copy_only=False)
+            else:
+                mask = np.zeros(0, dtype=bool)
+            self._text_mask_cache[key] = mask
+        return self._text_mask_cache[key]
+
+    def date_index(self) -> DateIndex:
+        if self._date_index_cache is None:
+            self._date_index_cache = self._intermediate('date_index', self._build_date_index)
+        return self._date_index_cache
+
+    def _build_date_index(self):
+        values = self.table.column(self.date_column)
+        parsed = self._parse_dates(values)
+        if parsed is None:
+            # Formats or types Arrow cannot parse go through the pandas parser
+            parsed, self.date_format = parse_dates(values.to_pandas(), self.date_format)
+            return build_date_index(parsed)
+
+        if pa.types.is_timestamp(parsed.type) and parsed.type.tz is not None:
+            parsed = pc.local_timestamp(parsed)  # wall-clock day, like tz_localize(None)
+        days = pc.cast(parsed, pa.date32())
+        dates = pc.unique(days.drop_null())
+        dates = pc.take(dates, pc.array_sort_indices(dates))
+        row_codes = pc.fill_null(pc.index_in(days, value_set=dates), -1).to_numpy(zero_copy_only=False)
+        row_codes = row_codes.astype(np.int64)
+        dates = np.asarray(dates.to_pylist(), dtype=object)
+        totals = pd.Series(np.bincount(row_codes[row_codes >= 0], minlength=len(dates)), index=dates)
+        return DateIndex(row_codes, dates, totals)
+
+    def _parse_dates(self, values):
+        # Returns a timestamp/date ChunkedArray, or None to fall back to pandas
+        if pa.types.is_timestamp(values.type) or pa.types.is_date(values.type):
+            return values
+        if not is_text_type(values.type):
+            return None
+        if self.date_format is None:
+            first = values.drop_null().slice(0, 1).to_pylist()
+            self.date_format = guess_datetime_format(first[0]) if first else None
+        if not self.date_format or any(d in self.date_format for d in _PANDAS_ONLY_DIRECTIVES):
+            return None
+        try:
+            if pa.types.is_dictionary(values.type):
+                # Parse each distinct string once
+                encoded = values.unify_dictionaries()
+                if not encoded.num_chunks:
+                    return None
+                parsed = pc.strptime(encoded.chunk(0).dictionary, format=self.date_format, unit='ns',
+                                     error_is_null=True)
+                return pc.take(parsed, dictionary_indices(encoded))
+            return pc.strptime(values, format=self.date_format, unit='ns', error_is_null=True)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return None
+
+    def _sum_by_date(self, masks: dict) -> pd.DataFrame:
+        """Sum Arrow or numpy boolean row masks per date with one Arrow group_by."""
+        date_index = self.date_index()
+        columns = list(masks)
+        if not columns:
+            return pd.DataFrame(index=date_index.dates)
+        # Positional names, so user column names can never clash with the key
+        data = {f"c{i}": masks[col] for i, col in enumerate(columns)}
+        data[_DATE] = date_index.row_codes
+        grouped = pa.table(data).filter(pc.greater_equal(pa.array(date_index.row_codes), 0)) \
+            .group_by(_DATE).aggregate([(f"c{i}", "sum") for i in range(len(columns))]).to_pandas()
+        wide = grouped.set_index(_DATE)[[f"c{i}_sum" for i in range(len(columns))]].fillna(0).astype('int64')
+        wide.columns = columns
+        return wide.reindex(range(len(date_index.dates)), fill_value=0).set_axis(date_index.dates, axis=0)
+
+    # Checks
+
+    def _column_summary(self):
+        null_masks = self.null_masks()
+        total_rows = self.table.num_rows
+        # pandas dtypes of the equivalent frame, from the schema alone
+        dtypes = self.table.schema.empty_table().to_pandas().dtypes
+
+        summary = []
+        for i, (field, column) in enumerate(zip(self.table.schema, self.table.columns)):
+            null_count = pc.sum(null_masks[i]).as_py() or 0
+            uniques = pc.unique(nan_to_null(column).drop_null())
+            dtype = dtypes.iloc[i]
+            if pa.types.is_integer(field.type) and null_count:
+                dtype = np.dtype('float64')  # as to_pandas() stores integers with nulls
+            summary.append({
+                "column": field.name,
+                "dtype": str(dtype),
+                "non_null_count": total_rows - null_count,
+                "null_count": null_count,
+                "null_percentage": null_count / total_rows * 100 if total_rows else np.nan,
+                "unique_values": len(uniques),
+                "sample_values": uniques.slice(0, 3).to_pylist()
+            })
+        return pd.DataFrame(summary)
+
+    def _nulls(self):
+        null_masks = self.null_masks()
+        counts = [pc.sum(mask).as_py() or 0 for mask in null_masks]
+        for col, mask, count in zip(self.table.column_names, null_masks, counts):
+            if count:
+                self.anomaly_rows.add('nulls', col, mask.to_numpy(zero_copy_only=False))
+
+        counts = dict(zip(self.table.column_names, counts))
+        if self.footer_nulls is not None:
+            counts = {col: counts[col] if count is None else count for col, count in self.footer_nulls.items()}
+        nulls = pd.DataFrame({'column': list(counts), 'null_count': np.array(list(counts.values()), dtype=np.int64)})
+        nulls['null_percentage'] = (nulls['null_count'] / self.table.num_rows) * 100 if self.table.num_rows else np.nan
+        return nulls
+
+    def _outliers(self):
+        outlier_data = []
+        total_rows = self.table.num_rows
+        for col in self.numeric_columns():
+            values = self.table.column(col)
+            lower, upper = self._iqr_bounds(values)
+            if lower is None:
+                outlier_mask = np.zeros(total_rows, dtype=bool)
+            else:
+                outside = pc.or_(pc.less(values, lower), pc.greater(values, upper))
+                outlier_mask = pc.fill_null(outside, False).to_numpy(zero_copy_only=False)
+            self.anomaly_rows.add('outliers', col, outlier_mask)
+            outlier_count = int(outlier_mask.sum())
+            outlier_data.append({
+                'column': col,
+                'outlier_count': outlier_count,
+                'total_count': total_rows,
+                'outlier_percentage': (outlier_count / total_rows) * 100 if total_rows else np.nan
+            })
+        return pd.DataFrame(outlier_data)
+
+    @staticmethod
+    def _iqr_bounds(values):
+        # Linear interpolation, as Series.quantile; nulls and NaN are skipped
+        q1, q3 = pc.quantile(values, q=[0.25, 0.75]).to_pylist()
+        if q1 is None:
+            return None, None
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+    def _duplicates(self):
+        keys = list(self.duplicate_subset or self.table.column_names)
+        try:
+            self.duplicate_report = self._group_duplicates(keys)
+        except pa.ArrowNotImplementedError:
+            # Key types Arrow cannot group on (lists, structs, ...) use the hash detector
+            frame = self.table.select(keys).to_pandas()
+            self.duplicate_report = DuplicateDetector().update(frame).finalize()
+        return self.duplicate_report.summary()
+
+    def _group_duplicates(self, keys):
+        n_rows = self.table.num_rows
+        keyed = self.table.select(keys).append_column(_ROW, pa.array(np.arange(n_rows, dtype=np.int64)))
+        # Single-threaded grouping keeps each list of rows in arrival order
+        members = keyed.group_by(keys, use_threads=False).aggregate([(_ROW, "list")]).column(f"{_ROW}_list")
+        sizes = pc.list_value_length(members)
+        duplicated = pc.greater(sizes, 1)
+        members, sizes = members.filter(duplicated), sizes.filter(duplicated).to_numpy().astype(np.int64)
+        rows = pc.list_flatten(members).to_numpy().astype(np.int64)
+
+        first_rows = rows[np.cumsum(sizes) - sizes]
+        order = np.argsort(first_rows, kind='stable')
+        group_ids = np.empty(len(sizes), dtype=np.int64)
+        group_ids[order] = np.arange(len(sizes))
+        row_groups = np.repeat(group_ids, sizes)
+        row_order = np.argsort(row_groups, kind='stable')
+
+        groups = pd.DataFrame({
+            'group_id': np.arange(len(sizes), dtype=np.int64),
+            'size': sizes[order],
+            'first_source': None,
+            'first_row': first_rows[order]
+        })
+        member_rows = pd.DataFrame({
+            'group_id': row_groups[row_order],
+            'source': None,
+            'row': rows[row_order]
+        })
+        return DuplicateReport(n_rows, int((sizes - 1).sum()), 0, groups, member_rows)
+
+    def _mixed_types(self):
+        # Every Arrow column has one type, so no column can mix Python types
+        return pd.DataFrame()
+
+    def _outliers_by_date(self):
+        date_index = self.date_index()
+        codes, unique_dates = date_index.row_codes, date_index.dates
+        numeric_cols = [c for c in self.numeric_columns() if c != self.date_column]
+        if not numeric_cols or not len(unique_dates):
+            return pd.DataFrame()
+
+        # One sort per column gives every date's quartiles at once
+        valid = codes >= 0
+        row_codes = codes[valid]
+        result = []
+        for col in numeric_cols:
+            values = pc.cast(nan_to_null(self.table.column(col)), pa.float64()).to_numpy(zero_copy_only=False)[valid]
+            lower, upper, total_count = grouped_iqr_bounds(values, row_codes, len(unique_dates))
+            outside = (values < lower[row_codes]) | (values > upper[row_codes])
+            outlier_count = np.bincount(row_codes, weights=outside, minlength=len(unique_dates)).astype(np.int64)
+            keep = total_count >= 5
+            if not keep.any():
+                continue
+            result.append(pd.DataFrame({
+                "date_only": unique_dates[keep],
+                "column": col,
+                "outlier_count": outlier_count[keep],
+                "total_count": total_count[keep],
+                "outlier_percentage": (outlier_count[keep] / total_count[keep]) * 100
+            }))
+        return pd.concat(result, ignore_index=True) if result else pd.DataFrame()
+
+    def _placeholder_counts(self):
+        data = []
+        total_rows = self.table.num_rows
+        for col in self.text_columns():
+            placeholder_mask = self._text_mask(col, 'placeholder')
+            placeholder_count = placeholder_mask.sum()
+            self.anomaly_rows.add('placeholders', col, placeholder_mask)
+            data.append({
+                "column": col,
+                "placeholder_count": placeholder_count,
+                "total_rows": total_rows,
+                "placeholder_percentage": (placeholder_count / total_rows) * 100 if total_rows > 0 else 0
+            })
+        return pd.DataFrame(data)
+
+    def _placeholder_counts_by_date(self):
+        date_index = self.date_index()
+        text_cols = [c for c in self.text_columns() if c != self.date_column]
+        wide = self._sum_by_date({col: self._text_mask(col, 'placeholder') for col in text_cols})
+        return wide_to_long_by_date(wide, date_index.totals, 'placeholder', 'total_rows')
+
+    def _nulls_by_date(self):
+        date_index = self.date_index()
+        wide = self._sum_by_date(dict(zip(self.table.column_names, self.null_masks())))
+        return wide_to_long_by_date(wide, date_index.totals, 'null')
+
+    def _empty_strings_by_date(self):
+        date_index = self.date_index()
+        text_cols = [c for c in self.text_columns() if c != self.date_column]
+        wide = self._sum_by_date({col: self._text_mask(col, 'empty') for col in text_cols})
+        return wide_to_long_by_date(wide, date_index.totals, 'empty_string')
@@ -0,0 +1 @@
+from .synthetic import generate_dataset
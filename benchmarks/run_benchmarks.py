@@ -0,0 +1,233 @@
+"""
+Time and measure peak memory of every DataQualityChecker check and every
+file_handlers loader on synthetic data at several scales.
+
+Usage:
+    python -m benchmarks.run_benchmarks --rows 10000 100000 1000000
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --update-baseline
+
+Results are written as JSON; with a baseline, any benchmark slower or more
+memory hungry than `threshold` x its baseline is reported as a regression and
+the process exits with status 1.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_dataset
+from data_quality_checker import DataQualityChecker, CHECK_REGISTRY
+from file_handlers import load_csv, load_excel, load_json, load_parquet, load_txt, load_xml, load_compressed
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_ROWS = [10_000, 100_000]
+
+# Differences below these floors are treated as noise, whatever the ratio
+MIN_SECONDS_DELTA = 0.05
+MIN_PEAK_MB_DELTA = 2.0
+
+
+def measure(func, repeat: int = 3) -> dict:
+    """
+    Best wall time over `repeat` runs, then peak traced memory of one more run.
+
+    Timing and memory are taken in separate runs because tracemalloc slows
+    down allocation-heavy code.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "peak_mb": peak / 1024 ** 2}
+
+
+def checker_benchmarks(df: pd.DataFrame, date_column: str = "event_date") -> dict:
+    """One benchmark per registered check (on a fresh checker, so its intermediates are counted) plus the full run."""
+    benchmarks = {
+        name: (lambda name=name: DataQualityChecker(df, date_column=date_column, copy=False).run_all_checks(only=[name]))
+        for name in CHECK_REGISTRY
+    }
+    benchmarks["run_all_checks"] = lambda: DataQualityChecker(df, date_column=date_column).run_all_checks()
+    benchmarks["outlier_method_comparison"] = lambda: DataQualityChecker(df, copy=False).outlier_method_comparison()
+    return benchmarks
+
+
+def loader_benchmarks(df: pd.DataFrame, directory: str) -> tuple:
+    """
+    Write df in every supported format and return (benchmarks, skipped) where
+    skipped maps a loader to the reason it could not run (e.g. missing engine).
+    """
+    xml_parser = "lxml"
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        xml_parser = "etree"
+
+    writers = {
+        "load_csv": ("data.csv", lambda p: df.to_csv(p, index=False), lambda p: load_csv(p)),
+        "load_txt": ("data.txt", lambda p: df.to_csv(p, sep="\t", index=False), lambda p: load_txt(p)),
+        "load_json": ("data.json", lambda p: df.to_json(p, orient="records"), lambda p: load_json(p, orient="records")),
+        "load_parquet": ("data.parquet", lambda p: df.astype({c: str for c in _mixed(df)}).to_parquet(p),
+                         lambda p: load_parquet(p)),
+        "load_excel": ("data.xlsx", lambda p: df.to_excel(p, index=False), lambda p: load_excel(p, sheet_name=0)),
+        "load_xml": ("data.xml", lambda p: df.to_xml(p, index=False, parser=xml_parser),
+                     lambda p: load_xml(p, parser=xml_parser)),
+        "load_compressed": ("data.zip", lambda p: _write_zip(df, p), lambda p: load_compressed(p)),
+    }
+
+    benchmarks, skipped = {}, {}
+    for name, (filename, write, load) in writers.items():
+        path = os.path.join(directory, filename)
+        try:
+            write(path)
+        except ImportError as e:
+            skipped[name] = str(e)
+            continue
+        benchmarks[name] = lambda load=load, path=path: load(path)
+    return benchmarks, skipped
+
+
+def _mixed(df):
+    return [c for c in df.columns if c.startswith("mixed_")]
+
+
+def _write_zip(df, path):
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        z.writestr("data.csv", df.to_csv(index=False))
+
+
+def run(rows_list, repeat: int = 3, loaders: bool = True, generator_kwargs: dict = None) -> dict:
+    generator_kwargs = generator_kwargs or {}
+    results, skipped = [], {}
+    for rows in rows_list:
+        df = generate_dataset(rows, **generator_kwargs)
+        suites = {"checker": checker_benchmarks(df)}
+        with tempfile.TemporaryDirectory(prefix="dq_bench_") as directory:
+            if loaders:
+                suites["loader"], skipped_here = loader_benchmarks(df, directory)
+                skipped.update(skipped_here)
+            for group, benchmarks in suites.items():
+                for name, func in benchmarks.items():
+                    stats = measure(func, repeat)
+                    stats.update({
+                        "group": group,
+                        "name": name,
+                        "rows": rows,
+                        "rows_per_sec": rows / stats["seconds"] if stats["seconds"] else None
+                    })
+                    results.append(stats)
+                    print(f"{group:8} {name:28} {rows:>10,} rows  {stats['seconds']:8.3f}s  {stats['peak_mb']:9.1f} MB")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": repeat,
+            "generator": generator_kwargs
+        },
+        "results": results,
+        "skipped": skipped
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 1.25) -> list:
+    """
+    Benchmarks whose time or peak memory exceed threshold x the baseline.
+
+    Returns:
+    - list of dict | group, name, rows, metric, baseline, current and ratio
+    """
+    previous = {(r["group"], r["name"], r["rows"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["group"], result["name"], result["rows"]))
+        if before is None:
+            continue
+        for metric, floor in (("seconds", MIN_SECONDS_DELTA), ("peak_mb", MIN_PEAK_MB_DELTA)):
+            old, new = before[metric], result[metric]
+            if new > old * threshold and new - old > floor:
+                regressions.append({
+                    "group": result["group"],
+                    "name": result["name"],
+                    "rows": result["rows"],
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "ratio": new / old if old else float("inf")
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Data quality checker and loader benchmarks")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Dataset sizes to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (best is kept)")
+    parser.add_argument("--no-loaders", action="store_true", help="Only benchmark the checker")
+    parser.add_argument("--output", default=None, help="Results file, defaults to benchmarks/results/<timestamp>.json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Regression ratio against the baseline")
+    parser.add_argument("--generator", type=json.loads, default={},
+                        help='Extra generate_dataset params as JSON, e.g. \'{"string_columns": 10}\'')
+    args = parser.parse_args(argv)
+
+    current = run(args.rows, args.repeat, not args.no_loaders, args.generator)
+    for name, reason in current["skipped"].items():
+        print(f"skipped  {name}: {reason}")
+
+    output = args.output or os.path.join(BENCHMARK_DIR, "results",
+                                         f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(current, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (run with --update-baseline to create one)")
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(current, json.load(f), args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['group']} {r['name']} @ {r['rows']:,} rows: {r['metric']} "
+              f"{r['baseline']:.3f} -> {r['current']:.3f} ({r['ratio']:.2f}x)")
+    if not regressions:
+        print("No regressions against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+PLACEHOLDER_VALUES = ["N/A", "unknown", "null", "--", "TBD", "none"]
+
+
+def generate_dataset(rows: int = 100_000, numeric_columns: int = 4, string_columns: int = 3,
+                     mixed_columns: int = 1, null_rate: float = 0.05, placeholder_rate: float = 0.02,
+                     empty_rate: float = 0.01, outlier_rate: float = 0.01, duplicate_rate: float = 0.01,
+                     cardinality: int = 1_000, date_span_days: int = 365, start_date: str = "2024-01-01",
+                     seed: int = 0) -> pd.DataFrame:
+    """
+    Build a synthetic frame with controllable data quality problems.
+
+    Parameters:
+    - rows: int | Number of rows
+    - numeric_columns: int | Float columns drawn from a normal distribution
+    - string_columns: int | Object columns drawn from `cardinality` distinct strings
+    - mixed_columns: int | Object columns mixing ints, floats and strings
+    - null_rate: float | Share of nulls per column
+    - placeholder_rate: float | Share of placeholder strings per string column
+    - empty_rate: float | Share of empty strings per string column
+    - outlier_rate: float | Share of extreme values per numeric column
+    - duplicate_rate: float | Share of rows copied from earlier rows
+    - cardinality: int | Distinct values per string column
+    - date_span_days: int | Days covered by the 'event_date' column (as '%Y-%m-%d' strings)
+    - start_date: str | First date
+    - seed: int | Random seed
+
+    Returns:
+    - pd.DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start_date, periods=date_span_days).strftime('%Y-%m-%d').to_numpy(dtype=object)
+    data = {"event_date": dates[rng.integers(0, date_span_days, rows)]}
+
+    for i in range(numeric_columns):
+        values = rng.normal(100, 15, rows)
+        outliers = rng.random(rows) < outlier_rate
+        values[outliers] = rng.choice([-1, 1], outliers.sum()) * rng.uniform(1_000, 10_000, outliers.sum())
+        values[rng.random(rows) < null_rate] = np.nan
+        data[f"num_{i}"] = values
+
+    vocabulary = np.array([f"value_{i}" for i in range(cardinality)], dtype=object)
+    for i in range(string_columns):
+        values = vocabulary[rng.integers(0, cardinality, rows)]
+        draw = rng.random(rows)
+        values[draw < placeholder_rate] = rng.choice(PLACEHOLDER_VALUES, (draw < placeholder_rate).sum())
+        values[(draw >= placeholder_rate) & (draw < placeholder_rate + empty_rate)] = ""
+        values[rng.random(rows) < null_rate] = None
+        data[f"str_{i}"] = values
+
+    for i in range(mixed_columns):
+        kind = rng.integers(0, 3, rows)
+        values = np.empty(rows, dtype=object)
+        values[kind == 0] = rng.integers(0, cardinality, (kind == 0).sum()).tolist()
+        values[kind == 1] = rng.normal(size=(kind == 1).sum()).tolist()
+        values[kind == 2] = vocabulary[rng.integers(0, cardinality, (kind == 2).sum())]
+        values[rng.random(rows) < null_rate] = None
+        data[f"mixed_{i}"] = values
+
+    # Copy whole rows from earlier positions
+    duplicates = np.flatnonzero(rng.random(rows) < duplicate_rate)
+    duplicates = duplicates[duplicates > 0]
+    if len(duplicates):
+        sources = rng.integers(0, duplicates)
+        for values in data.values():
+            values[duplicates] = values[sources]
+    return pd.DataFrame(data)
@@ -0,0 +1,147 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from data_quality_checker import DataQualityChecker, DateIndex
+from utils.instrumentation import Instrumentation
+
+SHARD_BACKENDS = ("thread", "process")
+
+# Frames ordered by date first; every other frame follows the column order
+DATE_ORDERED = ("nulls_by_date", "empty_strings_by_date", "placeholder_counts_by_date")
+
+
+def run_sharded(checker: DataQualityChecker, workers: int, backend: str = "thread", names: list = None) -> dict:
+    """
+    Run a checker's column-local checks on column shards in a worker pool.
+
+    Parameters:
+    - checker: DataQualityChecker | Checker whose frame is sharded
+    - workers: int | Pool size; columns are dealt round-robin into this many shards
+    - backend: str | 'thread', or 'process' to pass column data through shared memory
+    - names: list | Column-local checks to run, defaults to all of them
+
+    Returns:
+    - dict | The same frames as DataQualityChecker._column_checks, merged in
+      column order; anomaly rows are merged into checker.anomaly_rows
+    """
+    if backend not in SHARD_BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend}")
+
+    columns = list(checker.df.columns)
+    shards = [columns[i::workers] for i in range(min(workers, len(columns)))]
+    # Parse the date column once in the parent and hand the index to every shard
+    date_index = checker._date_index() if checker.date_column else None
+    config = checker.config()
+    config["date_format"] = checker.date_format
+
+    if backend == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_shard, {c: checker.df[c] for c in shard}, config, date_index, names)
+                       for shard in shards]
+            outputs = [f.result() for f in futures]
+    else:
+        outputs = _run_process_shards(checker.df, shards, config, date_index, workers, names)
+
+    for _, store in outputs:
+        checker.anomaly_rows.merge(store)
+    checker.anomaly_rows.reorder(columns)
+    return _merge_results([results for results, _ in outputs], columns)
+
+
+def _run_shard(columns: dict, config: dict, date_index: DateIndex, names: list = None):
+    frame = pd.DataFrame(columns, copy=False)
+    shard = DataQualityChecker(frame, copy=False, instrumentation=Instrumentation(memory=None, log=False), **config)
+    shard._date_index_cache = date_index
+    return shard._column_checks(names), shard.anomaly_rows
+
+
+def _run_process_shards(df, shards, config, date_index, workers, names):
+    # Numpy-backed columns (and the date bucket codes) are copied once into
+    # shared memory blocks; only object/extension columns are pickled. The row
+    # index the shared columns need is pickled once per shard.
+    blocks = []
+
+    def share(values):
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+        blocks.append(block)
+        return (block.name, values.dtype.str, values.shape)
+
+    try:
+        payloads = []
+        for shard in shards:
+            shared, pickled = {}, {}
+            for col in shard:
+                series = df[col]
+                if isinstance(series.dtype, np.dtype) and series.dtype != object:
+                    shared[col] = share(series.to_numpy())
+                else:
+                    pickled[col] = series
+            payloads.append((shard, shared, pickled, df.index if shared else None))
+
+        shared_date_index = None
+        if date_index is not None:
+            shared_date_index = (share(date_index.row_codes), date_index.dates, date_index.totals)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_process_shard, *payload, config, shared_date_index, names)
+                       for payload in payloads]
+            return [f.result() for f in futures]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _attach(descriptor, handles):
+    name, dtype, shape = descriptor
+    block = shared_memory.SharedMemory(name=name)
+    handles.append(block)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _run_process_shard(shard, shared, pickled, index, config, shared_date_index, names):
+    handles = []
+    try:
+        columns = {}
+        for col in shard:
+            if col in shared:
+                columns[col] = pd.Series(_attach(shared[col], handles), index=index, name=col, copy=False)
+            else:
+                columns[col] = pickled[col]
+        date_index = None
+        if shared_date_index is not None:
+            descriptor, dates, totals = shared_date_index
+            date_index = DateIndex(_attach(descriptor, handles), dates, totals)
+
+        results, store = _run_shard(columns, config, date_index, names)
+        del columns, date_index
+        return results, store
+    finally:
+        for block in handles:
+            try:
+                block.close()
+            except BufferError:
+                # A view is still alive; the mapping is released when the worker exits
+                pass
+
+
+def _merge_results(shard_results, columns):
+    position = {col: i for i, col in enumerate(columns)}
+    merged = {}
+    for key in shard_results[0]:
+        frames = [r[key] for r in shard_results if not r[key].empty]
+        if not frames:
+            merged[key] = shard_results[0][key]
+            continue
+        frame = pd.concat(frames, ignore_index=True)
+        order = frame['column'].map(position)
+        if key in DATE_ORDERED:
+            frame = frame.assign(_order=order).sort_values(['date_only', 'column'], kind='stable')
+        else:
+            frame = frame.assign(_order=order).sort_values('_order', kind='stable')
+        merged[key] = frame.drop(columns='_order').reset_index(drop=True)
+    return merged
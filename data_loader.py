@@ -10,30 +10,70 @@ from file_handlers.load_parquet import load_parquet
 from file_handlers.load_txt import load_txt
 from file_handlers.load_xml import load_xml
 from file_handlers.load_compressed import load_compressed
+from file_handlers.stream_csv import stream_csv
+from file_handlers.file_dataset import FileDataset, expand_sources, is_multi_source, read_columns
 
 # Import DB & Web handlers
 from db_handlers.sql_loader import load_sql_server_data
 from db_handlers.postgres_loader import load_postgres_data
+from db_handlers.stream_sql import resolve_engine
 
 # Utility
 from utils.logger import logger
 from utils.file_detector import detect_file_type
+from utils.instrumentation import Instrumentation
 
 
-def load_data(source: str = None, source_type: str = None, **kwargs) -> pd.DataFrame:
+COMPRESSED_SOURCE_TYPES = ('zip', 'tar', 'gzip', 'bz2', 'xz', 'zstd', 'compressed')
+DB_SOURCE_TYPES = ('sqlserver', 'postgres')
+STREAMING_SOURCE_TYPES = ('csv', 'txt', 'text', 'tsv') + COMPRESSED_SOURCE_TYPES + DB_SOURCE_TYPES
+
+LOADERS = {
+    'csv': load_csv,
+    'excel': load_excel,
+    'json': load_json,
+    'parquet': load_parquet,
+    'txt': load_txt,
+    'text': load_txt,
+    'tsv': load_txt,
+    'xml': load_xml,
+    **{kind: load_compressed for kind in COMPRESSED_SOURCE_TYPES},
+    'sqlserver': load_sql_server_data,
+    'postgres': load_postgres_data
+}
+
+
+def load_data(source: str = None, source_type: str = None, instrumentation: Instrumentation = None,
+              stream: bool = False, chunk_rows: int = 100_000, **kwargs) -> pd.DataFrame:
     """
     Main function to load data from any source.
     
     Parameters:
-    - source: str | URL, file path, SQL query, or API endpoint
+    - source: str | URL, file path, SQL query, or API endpoint; a directory, glob
+      or list of files loads them as one FileDataset (see load_dataset)
     - source_type: str | Explicit type like 'csv', 'sql', 'api' (optional)
+    - instrumentation: Instrumentation | Records the load's time, memory and rows/sec
+      (optional); pass the same one to DataQualityChecker to keep load and check
+      metrics together. With optimize=True the load's record also holds the
+      memory_report (see file_handlers.optimize_dtypes)
+    - stream: bool | Return an iterator of DataFrame chunks instead (csv/txt and
+      compressed sources, parsed on a thread pool ahead of the consumer; database
+      sources, read through a server-side cursor); pass it to
+      StreamingDataQualityChecker. See file_handlers.stream_csv and
+      db_handlers.stream_sql for the options
+    - chunk_rows: int | Rows per chunk when streaming
     - kwargs: dict | Extra arguments passed to specific loaders
     
     Returns:
-    - DataFrame
+    - DataFrame | iterator of DataFrame when stream=True; FileDataset for multi-file sources
     """
     logger.info(f" Loading data from source: {source}")
 
+    # Queries can contain glob characters ('select * ...'), so DB sources are never file sets
+    if is_multi_source(source) and (source_type or '').strip().lower() not in DB_SOURCE_TYPES:
+        dataset = load_dataset(source, source_type, **kwargs)
+        return dataset.iter_chunks(chunk_rows) if stream else dataset
+
     # Auto-detect if type is not passed
     try:
         print(source_type)
@@ -44,27 +84,132 @@ def load_data(source: str = None, source_type: str = None, **kwargs) -> pd.DataF
     if not source_type:
         source_type = detect_file_type(source)
         logger.info(f" Auto-detected source type: {source_type}")
-   
-    loaders = {
-        'csv': load_csv,
-        'excel': load_excel,
-        'json': load_json,
-        'parquet': load_parquet,
-        'txt': load_txt,
-        'xml': load_xml,
-        'zip': load_compressed,
-        'sqlserver': load_sql_server_data,
-        'postgres': load_postgres_data
-    }
-    
-    loader_func = loaders.get(source_type)
+
+    if source_type in COMPRESSED_SOURCE_TYPES:
+        # An explicit type wins over the extension ('zip' for a zip named data.bin)
+        kwargs.setdefault('compression', source_type)
+
+    if stream:
+        if source_type not in STREAMING_SOURCE_TYPES:
+            raise ValueError(f" Streaming is not supported for source_type: {source_type}")
+        logger.info(f"Streaming {source} in chunks of {chunk_rows} rows")
+        if source_type in COMPRESSED_SOURCE_TYPES:
+            return load_compressed(source, stream=True, chunk_rows=chunk_rows, **kwargs)
+        if source_type in DB_SOURCE_TYPES:
+            return LOADERS[source_type](source, stream=True, chunk_rows=chunk_rows, **kwargs)
+        kwargs.setdefault('delimiter', kwargs.pop('sep', ',' if source_type == 'csv' else '\t'))
+        return stream_csv(source, chunk_rows=chunk_rows, **kwargs)
+
+    loader_func = LOADERS.get(source_type)
     if not loader_func:
         raise ValueError(f" Unsupported source_type: {source_type}")
 
+    if kwargs.get('optimize'):
+        kwargs['return_report'] = True
     try:
-        df = loader_func(source, **kwargs)
+        with (instrumentation or Instrumentation()).stage(f"load_{source_type}", kind='load') as record:
+            df = loader_func(source, **kwargs)
+            if isinstance(df, tuple):
+                # Optimized loads return their memory report next to the frame
+                df, record['memory_report'] = df
+            record['rows'] = len(df)
         logger.info(f"Loaded data successfully. Shape: {df.shape}")
         return df
     except Exception as e:
         logger.error(f" Failed to load data using {source_type} loader: {e}")
         raise
+
+
+def load_dataset(source, source_type: str = None, workers: int = None, schema="union", partitions: bool = True,
+                 file_column: str = None, **kwargs) -> FileDataset:
+    """
+    Load many files as one lazily concatenated dataset.
+
+    Parameters:
+    - source: str | list | Directory (walked recursively, hive-style key=value
+      folders such as date=2026-10-01/ included), glob such as 'landing/**/*.csv',
+      or list of file paths. Hidden and _-prefixed files (_SUCCESS) are skipped
+    - source_type: str | Type of every file, defaults to detecting each file's
+      type; files of unknown type are skipped
+    - workers: int | Threads reading files concurrently
+    - schema: str | list | Column reconciliation, see FileDataset
+    - partitions: bool | Add the key=value folder values as columns
+    - file_column: str | Add a column holding each row's file path (optional)
+    - kwargs: dict | Extra arguments passed to the per-file loader
+
+    Returns:
+    - FileDataset | Iterate it for one frame per file (e.g. pass it to
+      StreamingDataQualityChecker), or call to_frame() for one DataFrame
+    """
+    files, root = expand_sources(source)
+    kind = source_type.strip().lower() if source_type else None
+    types = {path: kind or detect_file_type(path) for path in files}
+    files = [path for path in files if types[path] in LOADERS and types[path] not in DB_SOURCE_TYPES]
+    if not files:
+        raise ValueError(f" No supported files found for source: {source}")
+    logger.info(f"Loading {len(files)} files from {source}")
+    # As in load_data, an explicit archive type wins over each file's extension
+    load_kwargs = dict(kwargs, compression=kind) if kind in COMPRESSED_SOURCE_TYPES else kwargs
+
+    def loader(path):
+        return LOADERS[types[path]](path, **load_kwargs)
+
+    def columns_reader(path):
+        return read_columns(path, types[path], **kwargs)
+
+    return FileDataset(files, loader, root=root, columns_reader=columns_reader, schema=schema,
+                       partitions=partitions, file_column=file_column, workers=workers)
+
+
+def run_checks_cached(source: str, source_type: str = None, cache=None, checker_kwargs: dict = None,
+                      content_hash: bool = False, probe=None, engine=None, **kwargs) -> dict:
+    """
+    Load a source and run all checks, reusing cached results while the source is unchanged.
+
+    Parameters:
+    - source: str | File path, or the query/table for DB sources
+    - source_type: str | Explicit type like 'csv', 'postgres' (optional)
+    - cache: ResultCache | Cache to use, defaults to ResultCache() in .dq_cache
+    - checker_kwargs: dict | Params passed to DataQualityChecker (part of the cache key)
+    - content_hash: bool | Also hash file contents for the fingerprint
+    - probe: str | callable | Change probe for DB sources, defaults to the query's
+      row count; see query_fingerprint
+    - engine: sqlalchemy.Engine | str | Engine (or URL) the probe query runs on; DB sources are also loaded with it.
+      DB sources with neither a probe nor an engine are checked without the cache
+    - kwargs: dict | Extra arguments passed to load_data
+
+    Returns:
+    - dict | run_all_checks results; row views of a cached result reload the source on first access
+    """
+    from data_quality_checker import DataQualityChecker
+    from utils.result_cache import ResultCache, file_fingerprint, query_fingerprint
+
+    cache = cache if cache is not None else ResultCache()
+    checker_kwargs = checker_kwargs or {}
+    # One Instrumentation records both the load and the checks
+    instrumentation = checker_kwargs.get('instrumentation') or Instrumentation()
+    run_kwargs = dict(checker_kwargs, instrumentation=instrumentation)
+    kind = (source_type or '').strip().lower()
+    if kind in DB_SOURCE_TYPES:
+        engine = resolve_engine(engine)
+        if engine is None and not callable(probe):
+            # Nothing can tell whether the data changed, so results are never reused
+            logger.warning(f"Not caching {source}: DB sources need an engine or a callable probe")
+            df = load_data(source, source_type, instrumentation, **kwargs)
+            return DataQualityChecker(df, copy=False, **run_kwargs).run_all_checks()
+        fingerprint = query_fingerprint(source, probe, engine)
+    else:
+        fingerprint = file_fingerprint(source, content_hash)
+    key = cache.key(fingerprint, dict(checker_kwargs, loader_kwargs=kwargs))
+
+    # The engine also skips the loaders' connection prompts; it is not part of the key
+    load_kwargs = dict(kwargs, engine=engine) if kind in DB_SOURCE_TYPES and engine is not None else kwargs
+    results = cache.get(key)
+    if results is not None:
+        results["anomaly_rows"]._frame_loader = lambda: load_data(source, source_type, **load_kwargs)
+        return results
+
+    df = load_data(source, source_type, instrumentation, **load_kwargs)
+    results = DataQualityChecker(df, copy=False, **run_kwargs).run_all_checks()
+    cache.put(key, results)
+    return results
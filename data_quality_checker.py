@@ -1,233 +1,687 @@
 import pandas as pd
 import numpy as np
 import re
+from collections import namedtuple
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.0
+    from pandas.core.tools.datetimes import guess_datetime_format
+
+from anomaly_rows import AnomalyRowStore
+from duplicate_detector import DuplicateDetector
+from utils.sketches import KLLSketch, HyperLogLog
+from utils.instrumentation import Instrumentation
+
+QUANTILE_BACKENDS = ("exact", "sketch")
+APPROX_DISTINCT_MODES = (False, True, "auto")
+
+# infer_dtype results that guarantee a single Python type per value
+HOMOGENEOUS_INFERRED_TYPES = ("string", "bytes", "empty")
+_type_of = np.frompyfunc(type, 1, 1)
+
+PLACEHOLDERS = [
+    r"other", r"others", r"unknown", r"undefined", r"not available", r"not known",
+    r"not specified", r"none", r"missing", r"n/?a", r"null", r"tbd", r"default",
+    r"\?", r"--", r"_", r"no data", r"empty", r"select", r"choose"
+]
+
+
+def value_type_counts(values: pd.Series) -> pd.Series:
+    """
+    Count the Python type of every value in a Series of non-null values.
+
+    Native dtypes, categoricals and homogeneous object columns are answered
+    without a Python call per cell; other object columns use a C-level type()
+    map instead of Series.apply.
+
+    Returns:
+    - pd.Series | Count per type, most common first
+    """
+    if values.empty:
+        return pd.Series(dtype='int64')
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+        types = pd.Series(counts, index=_type_of(values.cat.categories.to_numpy(dtype=object)))
+        types = types.groupby(level=0, sort=False).sum()
+        return types[types > 0].sort_values(ascending=False, kind='stable')
+    if values.dtype != object:
+        return pd.Series([len(values)], index=[type(values.iloc[:1].tolist()[0])])
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred in ("string", "bytes"):
+        return pd.Series([len(values)], index=[str if inferred == "string" else bytes])
+    return pd.Series(_type_of(values.to_numpy()), dtype=object).value_counts()
+
+
+def compile_placeholder_pattern(placeholders=None) -> re.Pattern:
+    """
+    Compile placeholder regex fragments into one anchored, case-insensitive pattern.
+
+    Parameters:
+    - placeholders: list | Regex fragments, defaults to PLACEHOLDERS
+
+    Returns:
+    - re.Pattern
+    """
+    placeholders = PLACEHOLDERS if placeholders is None else placeholders
+    return re.compile(r"^(" + "|".join(placeholders) + r")$", re.IGNORECASE)
+
+
+PLACEHOLDER_PATTERN = compile_placeholder_pattern()
+
+
+def encoded_match(series: pd.Series, predicate, codes=None, uniques=None) -> np.ndarray:
+    """
+    Evaluate a vectorised string predicate once per distinct value of a column
+    and map the result back to every row through the factorized codes.
+
+    Parameters:
+    - series: pd.Series | Column to match
+    - predicate: callable | Takes a Series of distinct values, returns a boolean Series
+    - codes, uniques: Output of pd.factorize(series), when already available
+
+    Returns:
+    - np.ndarray | Boolean row mask; nulls never match
+    """
+    if codes is None:
+        codes, uniques = pd.factorize(series)
+    matches = np.asarray(predicate(pd.Series(uniques, dtype=object)), dtype=bool)
+    # Null rows carry code -1, which picks up the trailing False
+    return np.append(matches, False)[codes]
+
+
+def is_placeholder(pattern: re.Pattern = PLACEHOLDER_PATTERN):
+    return lambda values: values.astype(str).str.strip().str.match(pattern)
+
+
+def is_empty_string(values: pd.Series) -> pd.Series:
+    return values.astype(str).str.strip() == ''
+
+
+def is_text_dtype(dtype) -> bool:
+    """Object, string (incl. Arrow-backed) and categorical columns are checked as text."""
+    return dtype == object or isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype))
+
+# A registered check: func(checker) -> pd.DataFrame, the intermediates it reads,
+# whether it needs date_column and whether it only looks at one column at a time
+# (column-local checks can be sharded across workers).
+Check = namedtuple('Check', ['func', 'requires', 'by_date', 'column_local'])
+CHECK_REGISTRY = {}
+
+# Shared intermediates: name -> (builder method, intermediates it is built from)
+INTERMEDIATES = {
+    "null_mask": ("_null_mask", ()),
+    "object_columns": ("_object_columns", ()),
+    "numeric_columns": ("_numeric_columns", ()),
+    "date_index": ("_date_index", ()),
+    "encoded": ("_encoded_columns", ("object_columns",)),
+    "placeholder_masks": ("_placeholder_masks", ("encoded",)),
+}
+
+
+def register_check(name: str, func=None, requires=(), by_date: bool = False, column_local: bool = False):
+    """
+    Register a check run by DataQualityChecker.run_all_checks.
+
+    Parameters:
+    - name: str | Result key of the check
+    - func: callable | func(checker) -> pd.DataFrame; when omitted this works as a decorator
+    - requires: tuple | Names from INTERMEDIATES the check reads through checker.intermediate()
+    - by_date: bool | Skipped (empty frame) when the checker has no date_column
+    - column_local: bool | Results depend on one column at a time and carry a 'column'
+      column, so the check can run on column shards; it must then be registered
+      when its module is imported for process workers to see it
+
+    Returns:
+    - callable | func
+    """
+    unknown = [r for r in requires if r not in INTERMEDIATES]
+    if unknown:
+        raise ValueError(f"Unknown intermediates for check {name}: {unknown}")
+    if func is None:
+        return lambda f: register_check(name, f, requires, by_date, column_local)
+    CHECK_REGISTRY[name] = Check(func, tuple(requires), by_date, column_local)
+    return func
+
+
+# Reusable date buckets: per-row bucket code (-1 for unparseable dates), the
+# sorted distinct dates (datetime.date) and the row count per date.
+DateIndex = namedtuple('DateIndex', ['row_codes', 'dates', 'totals'])
+
+
+def parse_dates(values: pd.Series, date_format: str = None):
+    """
+    Parse a date column, inferring the format from the first non-null string
+    when none is given so every row is parsed with the same fast format.
+
+    Parameters:
+    - values: pd.Series | Raw date column
+    - date_format: str | strftime format, inferred when None
+
+    Returns:
+    - (pd.Series, str) | Parsed datetimes (NaT where unparseable) and the format used
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, date_format
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Parse each category once and map the rows back through the codes
+        categories, date_format = parse_dates(pd.Series(values.cat.categories.to_numpy(dtype=object)), date_format)
+        parsed = categories.array.take(values.cat.codes.to_numpy(), allow_fill=True)
+        return pd.Series(parsed, index=values.index, name=values.name), date_format
+    if date_format is None and is_text_dtype(values.dtype):
+        first = values.dropna().head(1)
+        if len(first) and isinstance(first.iloc[0], str):
+            date_format = guess_datetime_format(first.iloc[0])
+    if date_format:
+        return pd.to_datetime(values, format=date_format, errors='coerce'), date_format
+    return pd.to_datetime(values, errors='coerce'), date_format
+
+
+def build_date_index(parsed: pd.Series) -> DateIndex:
+    """Bucket parsed datetimes by calendar day."""
+    if getattr(parsed.dt, 'tz', None) is not None:
+        parsed = parsed.dt.tz_localize(None)
+    row_codes, days = pd.factorize(parsed.dt.floor('D'), sort=True)
+    dates = np.asarray(days.date, dtype=object)
+    totals = pd.Series(np.bincount(row_codes[row_codes >= 0], minlength=len(dates)), index=dates)
+    return DateIndex(row_codes, dates, totals)
+
+
+def sum_by_date(masks: pd.DataFrame, date_index: DateIndex) -> pd.DataFrame:
+    """Sum boolean row masks per date bucket into a (date x column) frame."""
+    sums = masks.groupby(date_index.row_codes).sum()
+    return sums.reindex(range(len(date_index.dates)), fill_value=0).set_axis(date_index.dates, axis=0)
+
+
+def wide_to_long_by_date(wide: pd.DataFrame, totals: pd.Series, name: str, total_column: str = None) -> pd.DataFrame:
+    """
+    Reshape a (date x column) frame of counts into the long by-date layout.
+
+    Parameters:
+    - wide: pd.DataFrame | Counts indexed by date, one column per checked column
+    - totals: pd.Series | Row count per date, used for the percentage
+    - name: str | Prefix of the '<name>_count' and '<name>_percentage' columns
+    - total_column: str | Also keep the per-date totals under this name (optional)
+
+    Returns:
+    - pd.DataFrame | Non-zero counts sorted by date_only and column
+    """
+    count_col, pct_col = f'{name}_count', f'{name}_percentage'
+    columns = ['date_only', 'column', count_col] + ([total_column] if total_column else []) + [pct_col]
+    if wide.empty:
+        return pd.DataFrame(columns=columns)
+
+    long = wide.rename_axis(index='date_only', columns='column').stack().rename(count_col).reset_index()
+    long = long[long[count_col] > 0].copy()
+    long[count_col] = long[count_col].astype('int64')
+    row_totals = long['date_only'].map(totals).astype('int64')
+    if total_column:
+        long[total_column] = row_totals
+    long[pct_col] = (long[count_col] / row_totals) * 100
+    return long[columns].sort_values(['date_only', 'column']).reset_index(drop=True)
+
 
 class DataQualityChecker:
-    def __init__(self, df: pd.DataFrame, date_column: str = None):
-        self.df = df.copy()
+    def __init__(self, df: pd.DataFrame, date_column: str = None, copy: bool = True,
+                 quantile_backend: str = "exact", sketch_error: float = 0.01,
+                 approx_distinct=False, distinct_threshold: int = 100_000, hll_precision: int = 14,
+                 placeholders: list = None, date_format: str = None, mixed_type_sample: int = None,
+                 duplicate_subset: list = None, instrumentation: Instrumentation = None):
+        # copy=False skips the defensive copy when the caller owns the frame,
+        # which halves peak memory for large inputs.
+        # approx_distinct=True counts distinct values with a HyperLogLog sketch;
+        # "auto" only keeps the sketch estimate for columns above distinct_threshold.
+        # placeholders replaces the default PLACEHOLDERS regex fragments.
+        # date_format is inferred from date_column on first use when not given.
+        # mixed_type_sample=N only counts types exactly for object columns whose
+        # N-value sample already shows two types (faster, may miss rare types).
+        # duplicate_subset limits the duplicate check to these key columns.
+        # instrumentation records time, memory and throughput of every stage;
+        # pass one shared with load_data to see loads and checks together.
+        if quantile_backend not in QUANTILE_BACKENDS:
+            raise ValueError(f"Unsupported quantile_backend: {quantile_backend}")
+        if approx_distinct not in APPROX_DISTINCT_MODES:
+            raise ValueError(f"Unsupported approx_distinct mode: {approx_distinct}")
+        self.df = df.copy() if copy else df
         self.date_column = date_column
+        self.date_format = date_format
+        self.mixed_type_sample = mixed_type_sample
+        self.duplicate_subset = duplicate_subset
+        self.quantile_backend = quantile_backend
+        self.sketch_error = sketch_error
+        self.approx_distinct = approx_distinct
+        self.distinct_threshold = distinct_threshold
+        self.hll_precision = hll_precision
+        self.placeholders = placeholders
+        self.placeholder_pattern = PLACEHOLDER_PATTERN if placeholders is None else compile_placeholder_pattern(placeholders)
+        self._null_mask_cache = None
+        self._date_index_cache = None
+        self._encoded_cache = {}
+        self._placeholder_mask_cache = {}
+        self._intermediate_cache = {}
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        # Row positions flagged by each check; frames are only built on access
+        self.anomaly_rows = AnomalyRowStore(self.df)
 
-    def run_all_checks(self):
-        results = {
-            "column_summary": self._column_summary(),
-            "nulls": self._null_counts(),
-            "outliers": self._outlier_summary(),
-            "duplicates": self._duplicate_summary(),
-            "mixed_types": self._mixed_type_check(),
-            "outliers_by_date": self._outliers_by_date() if self.date_column else pd.DataFrame(),
-            "placeholder_counts": self._placeholder_counts(),
-            "placeholder_counts_by_date": self._placeholder_counts_by_date() if self.date_column else pd.DataFrame()
-    
-        }
-        if self.date_column:
-            results["nulls_by_date"], results["empty_strings_by_date"] = self._nulls_and_empty_strings_by_date()
+    def run_all_checks(self, workers: int = None, backend: str = "thread", only: list = None):
+        """
+        Run the registered checks and collect the results.
+
+        Parameters:
+        - workers: int | Shard column-local checks across this many workers (optional)
+        - backend: str | 'thread' or 'process' pool for the column shards
+        - only: list | Names of the checks to run, defaults to every registered check
+
+        Returns:
+        - dict | Result frames keyed by check name, lazy anomaly-row views and
+          'metrics' (per-stage timings, see utils.instrumentation.Metrics)
+        """
+        names = self._select_checks(only)
+        column_names = [name for name in names if CHECK_REGISTRY[name].column_local]
+        if workers and workers > 1 and len(self.df.columns) > 1 and column_names:
+            from column_sharding import run_sharded
+            # Shards are timed as one stage; per-check timings come from serial runs
+            with self.instrumentation.stage(f"sharded[{backend} x {workers}]", rows=len(self.df)):
+                results = run_sharded(self, workers, backend, column_names)
+            results.update(self._run_checks([name for name in names if name not in results]))
         else:
-            results["nulls_by_date"] = pd.DataFrame()
-            results["empty_strings_by_date"] = pd.DataFrame()
+            results = self._run_checks(names)
+        results = {name: results[name] for name in names}
 
-        results["null_rows"] = self.null_rows  # dict of DataFrames
-        results["outlier_rows"] = self.outlier_rows  # dict of DataFrames
-        results["placeholder_rows"] = self.placeholder_rows  # dict of DataFrames
-        
+        self.null_rows = self.anomaly_rows.view('nulls')
+        self.outlier_rows = self.anomaly_rows.view('outliers')
+        self.placeholder_rows = self.anomaly_rows.view('placeholders')
+        results["null_rows"] = self.null_rows  # lazy dict of DataFrames
+        results["outlier_rows"] = self.outlier_rows  # lazy dict of DataFrames
+        results["placeholder_rows"] = self.placeholder_rows  # lazy dict of DataFrames
+        results["anomaly_rows"] = self.anomaly_rows
+        if "duplicates" in names:
+            results["duplicate_groups"] = self.duplicate_report.groups
+        results["metrics"] = self.instrumentation.metrics
+
+        return results
+
+    @staticmethod
+    def _select_checks(only=None):
+        if only is None:
+            return list(CHECK_REGISTRY)
+        unknown = [name for name in only if name not in CHECK_REGISTRY]
+        if unknown:
+            raise ValueError(f"Unknown checks: {unknown}")
+        # Registry order, so results come out in the same order however they are asked for
+        return [name for name in CHECK_REGISTRY if name in only]
+
+    def _run_checks(self, names):
+        checks = {name: CHECK_REGISTRY[name] for name in names}
+        runnable = [name for name, check in checks.items() if self.date_column or not check.by_date]
+        # Build every required intermediate once, dependencies first
+        rows = len(self.df)
+        for name in self._plan([r for n in runnable for r in checks[n].requires]):
+            if name not in self._intermediate_cache:
+                with self.instrumentation.stage(name, kind='intermediate', rows=rows):
+                    self.intermediate(name)
+        results = {}
+        for name in names:
+            if name not in runnable:
+                results[name] = pd.DataFrame()
+                continue
+            with self.instrumentation.stage(name, rows=rows):
+                results[name] = checks[name].func(self)
         return results
 
+    def _column_checks(self, names=None):
+        # Checks that only look at one column at a time (plus the date index),
+        # which is what lets run_all_checks shard them across workers.
+        if names is None:
+            names = [name for name, check in CHECK_REGISTRY.items() if check.column_local]
+        return self._run_checks(names)
+
+    @staticmethod
+    def _plan(required):
+        order = []
+
+        def visit(name):
+            if name in order:
+                return
+            for dependency in INTERMEDIATES[name][1]:
+                visit(dependency)
+            order.append(name)
+
+        for name in required:
+            visit(name)
+        return order
+
+    def intermediate(self, name: str):
+        """
+        Shared intermediate by name (see INTERMEDIATES), built once per checker.
+
+        Custom checks should read null masks, column lists, the date index and
+        encodings through this instead of recomputing them.
+        """
+        if name not in INTERMEDIATES:
+            raise ValueError(f"Unknown intermediate: {name}")
+        if name not in self._intermediate_cache:
+            self._intermediate_cache[name] = getattr(self, INTERMEDIATES[name][0])()
+        return self._intermediate_cache[name]
+
+    def config(self) -> dict:
+        """Keyword arguments that recreate this checker's configuration."""
+        return {
+            "date_column": self.date_column,
+            "quantile_backend": self.quantile_backend,
+            "sketch_error": self.sketch_error,
+            "approx_distinct": self.approx_distinct,
+            "distinct_threshold": self.distinct_threshold,
+            "hll_precision": self.hll_precision,
+            "placeholders": self.placeholders,
+            "date_format": self.date_format,
+            "mixed_type_sample": self.mixed_type_sample,
+            "duplicate_subset": self.duplicate_subset
+        }
+
+    def _null_mask(self):
+        # Shared (rows x columns) null mask, built once and reused by every check
+        # that needs per-column null information.
+        if self._null_mask_cache is None:
+            self._null_mask_cache = np.asfortranarray(self.df.isnull().to_numpy(dtype=bool))
+        return self._null_mask_cache
+
+    def _encoded(self, col):
+        # Dictionary encoding (codes, distinct values) of a column, shared by the
+        # string checks so each distinct value is only inspected once.
+        if col not in self._encoded_cache:
+            self._encoded_cache[col] = pd.factorize(self.df[col])
+        return self._encoded_cache[col]
+
+    def _placeholder_mask(self, col):
+        if col not in self._placeholder_mask_cache:
+            codes, uniques = self._encoded(col)
+            self._placeholder_mask_cache[col] = encoded_match(self.df[col], is_placeholder(self.placeholder_pattern),
+                                                              codes, uniques)
+        return self._placeholder_mask_cache[col]
+
+    def _object_columns(self):
+        return [col for col, dtype in self.df.dtypes.items() if is_text_dtype(dtype)]
+
+    def _numeric_columns(self):
+        return list(self.df.select_dtypes(include=[np.number]).columns)
+
+    def _encoded_columns(self):
+        return {col: self._encoded(col) for col in self.intermediate('object_columns')}
+
+    def _placeholder_masks(self):
+        return {col: self._placeholder_mask(col) for col in self.intermediate('object_columns')}
+
+    def _date_index(self):
+        # date_column is parsed once per checker; every by-date check groups on
+        # the shared bucket codes instead of copying and re-parsing the frame.
+        if self._date_index_cache is None:
+            parsed, self.date_format = parse_dates(self.df[self.date_column], self.date_format)
+            self._date_index_cache = build_date_index(parsed)
+        return self._date_index_cache
+
     def _column_summary(self):
+        null_mask = self._null_mask()
+        null_counts = null_mask.sum(axis=0)
+        total_rows = len(self.df)
+
         summary = []
-        for col in self.df.columns:
-            summary.append({
+        for i, col in enumerate(self.df.columns):
+            series = self.df.iloc[:, i]
+            unique_values, sample_values, error = self._distinct_summary(series[~null_mask[:, i]])
+            row = {
                 "column": col,
-                "dtype": str(self.df[col].dtype),
-                "non_null_count": self.df[col].notnull().sum(),
-                "null_count": self.df[col].isnull().sum(),
-                "null_percentage": self.df[col].isnull().sum() / len(self.df) * 100,
-                "unique_values": self.df[col].nunique(),
-                "sample_values": self.df[col].dropna().unique()[:3].tolist()
-            })
+                "dtype": str(series.dtype),
+                "non_null_count": total_rows - null_counts[i],
+                "null_count": null_counts[i],
+                "null_percentage": null_counts[i] / total_rows * 100 if total_rows else np.nan,
+                "unique_values": unique_values,
+                "sample_values": sample_values
+            }
+            if self.approx_distinct:
+                row["unique_values_error"] = error
+            summary.append(row)
         return pd.DataFrame(summary)
 
+    def _distinct_summary(self, non_null):
+        # Returns (distinct count, first three distinct values, relative error).
+        # The exact path gets both from a single unique() pass over the values.
+        if self.approx_distinct:
+            sketch = HyperLogLog(self.hll_precision).update(non_null)
+            estimate = sketch.estimate()
+            if self.approx_distinct is True or estimate >= self.distinct_threshold:
+                return int(round(estimate)), self._first_distinct(non_null), sketch.relative_error
+        uniques = non_null.unique()
+        return len(uniques), uniques[:3].tolist(), 0.0
+
+    @staticmethod
+    def _first_distinct(values, n: int = 3):
+        # Grow the scanned prefix until n distinct values are found
+        stop = 1024
+        while True:
+            uniques = values.iloc[:stop].unique()
+            if len(uniques) >= n or stop >= len(values):
+                return uniques[:n].tolist()
+            stop *= 4
+
     def _null_counts(self):
-        nulls = self.df.isnull().sum().reset_index()
-        nulls.columns = ['column', 'null_count']
+        null_mask = self._null_mask()
+        nulls = pd.DataFrame({'column': self.df.columns, 'null_count': null_mask.sum(axis=0)})
         nulls['null_percentage'] = (nulls['null_count'] / len(self.df)) * 100
 
-        self.null_rows = {col: self.df[self.df[col].isnull()].copy()
-                          for col in self.df.columns if self.df[col].isnull().any()}
+        for i, col in enumerate(self.df.columns):
+            if null_mask[:, i].any():
+                self.anomaly_rows.add('nulls', col, null_mask[:, i])
+        self.null_rows = self.anomaly_rows.view('nulls')
         return nulls
 
     def _outlier_summary(self):
         outlier_data = []
-        self.outlier_rows = {}  # Reset
-        
-        for col in self.df.select_dtypes(include=[np.number]).columns:
-            q1 = self.df[col].quantile(0.25)
-            q3 = self.df[col].quantile(0.75)
-            iqr = q3 - q1
-            lower = q1 - 1.5 * iqr
-            upper = q3 + 1.5 * iqr
 
-            outliers = self.df[(self.df[col] < lower) | (self.df[col] > upper)]
-            self.outlier_rows[col] = outliers.copy()
+        for col in self.intermediate('numeric_columns'):
+            lower, upper = self._iqr_bounds(self.df[col])
+
+            # Nullable (Int64/Float64) columns compare to pd.NA on missing values
+            outlier_mask = ((self.df[col] < lower) | (self.df[col] > upper)).to_numpy(dtype=bool, na_value=False)
+            self.anomaly_rows.add('outliers', col, outlier_mask)
+            outlier_count = int(outlier_mask.sum())
 
             outlier_data.append({
                 'column': col,
-                'outlier_count': len(outliers),
+                'outlier_count': outlier_count,
                 'total_count': len(self.df),
-                'outlier_percentage': (len(outliers) / len(self.df)) * 100
+                'outlier_percentage': (outlier_count / len(self.df)) * 100 if len(self.df) else np.nan
             })
+        self.outlier_rows = self.anomaly_rows.view('outliers')
         return pd.DataFrame(outlier_data)
 
+    def _iqr_bounds(self, values, backend: str = None):
+        backend = backend or self.quantile_backend
+        if backend == "sketch":
+            sketch = KLLSketch(self.sketch_error).update(values.to_numpy(dtype='float64', na_value=np.nan))
+            q1, q3 = sketch.quantile(0.25), sketch.quantile(0.75)
+        else:
+            q1, q3 = values.quantile(0.25), values.quantile(0.75)
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+    def outlier_method_comparison(self):
+        """
+        Compare IQR outlier counts from the exact quantiles with the sketch backend.
+
+        Returns:
+        - pd.DataFrame | One row per numeric column with both counts, their
+          difference and the sketch's configured rank error
+        """
+        data = []
+        for col in self.df.select_dtypes(include=[np.number]).columns:
+            values = self.df[col]
+            counts = {}
+            for backend in QUANTILE_BACKENDS:
+                lower, upper = self._iqr_bounds(values, backend)
+                counts[backend] = int(((values < lower) | (values > upper)).sum())
+            data.append({
+                'column': col,
+                'exact_outlier_count': counts['exact'],
+                'sketch_outlier_count': counts['sketch'],
+                'count_difference': counts['sketch'] - counts['exact'],
+                'sketch_error': self.sketch_error
+            })
+        return pd.DataFrame(data)
+
     def _duplicate_summary(self):
-        total_rows = len(self.df)
-        duplicate_rows = self.df.duplicated().sum()
-        return pd.DataFrame([{
-            'total_rows': total_rows,
-            'duplicate_rows': duplicate_rows,
-            'duplicate_percentage': (duplicate_rows / total_rows) * 100
-        }])
+        # Hash-based: group ids and member rows are kept on self.duplicate_report
+        self.duplicate_report = DuplicateDetector(subset=self.duplicate_subset).update(self.df).finalize()
+        return self.duplicate_report.summary()
 
     def _mixed_type_check(self):
+        null_mask = self._null_mask()
         result = []
-        for col in self.df.columns:
-            types = self.df[col].dropna().apply(type).value_counts()
+        for i, col in enumerate(self.df.columns):
+            series = self.df.iloc[:, i]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                # Native dtypes hold a single Python type per value
+                if series.dtype != object:
+                    continue
+                if pd.api.types.infer_dtype(series, skipna=True) in HOMOGENEOUS_INFERRED_TYPES:
+                    continue
+                if self.mixed_type_sample and not self._sample_has_mixed_types(series.to_numpy()[~null_mask[:, i]]):
+                    continue
+
+            types = value_type_counts(series[~null_mask[:, i]])
             if len(types) > 1:
                 result.append({
                     "column": col,
-                    "type_counts": dict(types)
+                    "type_counts": dict(zip(types.index, types.values))
                 })
         return pd.DataFrame(result)
 
-    def _nulls_and_empty_strings_by_date(self):
-        df = self.df.copy()
-        df[self.date_column] = pd.to_datetime(df[self.date_column], errors='coerce')
-        df = df.dropna(subset=[self.date_column])
-        df['date_only'] = df[self.date_column].dt.date
+    def _sample_has_mixed_types(self, values, block_size: int = 1024):
+        # Scan an evenly spaced sample block by block, stopping as soon as a
+        # second type shows up.
+        if len(values) > self.mixed_type_sample:
+            values = values[np.linspace(0, len(values) - 1, self.mixed_type_sample).astype(np.int64)]
+        seen = set()
+        for start in range(0, len(values), block_size):
+            seen.update(_type_of(values[start:start + block_size]))
+            if len(seen) > 1:
+                return True
+        return False
 
-        melted = df.melt(id_vars=['date_only'], var_name='column', value_name='value')
-        total_per_date = df.groupby('date_only').size().reset_index(name='total_count')
+    def _nulls_by_date(self):
+        date_index = self.intermediate('date_index')
 
-        nulls = melted[melted['value'].isnull()]
-        null_counts = nulls.groupby(['date_only', 'column']).size().reset_index(name='null_count')
-        null_counts = null_counts.merge(total_per_date, on='date_only', how='left')
-        null_counts['null_percentage'] = (null_counts['null_count'] / null_counts['total_count']) * 100
-        null_counts.drop(columns=['total_count'], inplace=True)
+        # Grouped sums of the wide boolean masks; only the small (date x column)
+        # aggregate is reshaped into the long by-date layout.
+        null_mask = pd.DataFrame(self.intermediate('null_mask'), columns=self.df.columns)
+        return wide_to_long_by_date(sum_by_date(null_mask, date_index), date_index.totals, 'null')
 
-        str_cols = df.select_dtypes(include=['object']).columns.tolist()
-        melted_str = melted[melted['column'].isin(str_cols)].copy()
-        empty_strs = melted_str[melted_str['value'].astype(str).str.strip() == '']
-        empty_counts = empty_strs.groupby(['date_only', 'column']).size().reset_index(name='empty_string_count')
-        empty_counts = empty_counts.merge(total_per_date, on='date_only', how='left')
-        empty_counts['empty_string_percentage'] = (empty_counts['empty_string_count'] / empty_counts['total_count']) * 100
-        empty_counts.drop(columns=['total_count'], inplace=True)
-
-        return null_counts, empty_counts
+    def _empty_strings_by_date(self):
+        date_index = self.intermediate('date_index')
+        encoded = self.intermediate('encoded')
+        str_cols = [c for c in self.intermediate('object_columns') if c != self.date_column]
+        empty_mask = pd.DataFrame({col: encoded_match(self.df[col], is_empty_string, *encoded[col])
+                                   for col in str_cols},
+                                  columns=str_cols, index=pd.RangeIndex(len(self.df)))
+        return wide_to_long_by_date(sum_by_date(empty_mask, date_index), date_index.totals, 'empty_string')
 
     def _outliers_by_date(self):
         if not self.date_column:
             return pd.DataFrame()
-        df = self.df.copy()
-        df[self.date_column] = pd.to_datetime(df[self.date_column], errors='coerce')
-        df = df.dropna(subset=[self.date_column])
-        df['date_only'] = df[self.date_column].dt.date
-
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        result = []
+        date_index = self._date_index()
+        codes, unique_dates = date_index.row_codes, date_index.dates
 
-        for col in numeric_cols:
-            for date, group in df.groupby('date_only'):
-                if group[col].dropna().shape[0] < 5:
-                    continue
-
-                q1 = group[col].quantile(0.25)
-                q3 = group[col].quantile(0.75)
-                iqr = q3 - q1
-                lower = q1 - 1.5 * iqr
-                upper = q3 + 1.5 * iqr
+        numeric_cols = [c for c in self.intermediate('numeric_columns') if c != self.date_column]
+        if not numeric_cols or not len(unique_dates):
+            return pd.DataFrame()
 
-                outlier_count = group[(group[col] < lower) | (group[col] > upper)].shape[0]
-                total_count = group[col].notnull().sum()
+        # One grouped quantile computation for every (date, column) pair; bounds
+        # are then broadcast back to the rows through the bucket codes.
+        grouped = self.df.groupby(codes)[numeric_cols]
+        groups = range(len(unique_dates))
+        totals = grouped.count().reindex(groups, fill_value=0)
+        lower, upper = (bounds.reindex(groups) for bounds in self._grouped_iqr_bounds(grouped))
 
-                result.append({
-                    "date_only": date,
-                    "column": col,
-                    "outlier_count": outlier_count,
-                    "total_count": total_count,
-                    "outlier_percentage": (outlier_count / total_count) * 100 if total_count > 0 else 0
-                })
+        result = []
+        valid = codes >= 0
+        for col in numeric_cols:
+            values = self.df[col].to_numpy(dtype='float64', na_value=np.nan)[valid]
+            row_codes = codes[valid]
+            outside = (values < lower[col].to_numpy()[row_codes]) | (values > upper[col].to_numpy()[row_codes])
+            outlier_count = np.bincount(row_codes, weights=outside, minlength=len(unique_dates)).astype(np.int64)
+            total_count = totals[col].to_numpy()
+            keep = total_count >= 5
+            if not keep.any():
+                continue
+            result.append(pd.DataFrame({
+                "date_only": unique_dates[keep],
+                "column": col,
+                "outlier_count": outlier_count[keep],
+                "total_count": total_count[keep],
+                "outlier_percentage": (outlier_count[keep] / total_count[keep]) * 100
+            }))
 
-        return pd.DataFrame(result)
+        return pd.concat(result, ignore_index=True) if result else pd.DataFrame()
 
+    def _grouped_iqr_bounds(self, grouped):
+        if self.quantile_backend == "sketch":
+            # One sketch per (date, column) gives both bounds; rows without a date (code -1) are skipped
+            bounds = {code: {col: self._iqr_bounds(frame[col]) for col in frame.columns}
+                      for code, frame in grouped if code >= 0}
+            lower, upper = ({code: {col: pair[side] for col, pair in cols.items()} for code, cols in bounds.items()}
+                            for side in (0, 1))
+            return pd.DataFrame.from_dict(lower, orient='index'), pd.DataFrame.from_dict(upper, orient='index')
+        quantiles = grouped.quantile([0.25, 0.75])
+        q1 = quantiles.xs(0.25, level=-1)
+        q3 = quantiles.xs(0.75, level=-1)
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
 
 
     def _placeholder_counts(self):
-        placeholders = [
-            r"other", r"others", r"unknown", r"undefined", r"not available", r"not known",
-            r"not specified", r"none", r"missing", r"n/?a", r"null", r"tbd", r"default",
-            r"\?", r"--", r"_", r"no data", r"empty", r"select", r"choose"
-        ]
-        pattern = re.compile(r"^(" + "|".join(placeholders) + r")$", re.IGNORECASE)
-    
-        self.placeholder_rows = {}
         data = []
-    
-        obj_cols = self.df.select_dtypes(include=['object']).columns
+
+        obj_cols = self.intermediate('object_columns')
         total_rows = len(self.df)
-    
+
         for col in obj_cols:
-            full_series = self.df[col]  # Includes nulls
-    
-            # Apply pattern to only non-null values
-            stripped = full_series.dropna().astype(str).str.strip()
-            placeholder_mask = stripped.str.match(pattern)
+            placeholder_mask = self._placeholder_mask(col)
             placeholder_count = placeholder_mask.sum()
-    
-            # Mask for original df to extract rows (including nulls, but won't match)
-            final_mask = full_series.astype(str).str.strip().str.match(pattern)
-            self.placeholder_rows[col] = self.df[final_mask].copy()
-    
+            self.anomaly_rows.add('placeholders', col, placeholder_mask)
+
             percentage = (placeholder_count / total_rows) * 100 if total_rows > 0 else 0
-    
+
             data.append({
                 "column": col,
                 "placeholder_count": placeholder_count,
                 "total_rows": total_rows,
                 "placeholder_percentage": percentage
             })
-    
+
+        self.placeholder_rows = self.anomaly_rows.view('placeholders')
         return pd.DataFrame(data)
-    
 
     def _placeholder_counts_by_date(self):
-        placeholders = [
-            r"other", r"others", r"unknown", r"undefined", r"not available", r"not known",
-            r"not specified", r"none", r"missing", r"n/?a", r"null", r"tbd", r"default",
-            r"\?", r"--", r"_", r"no data", r"empty", r"select", r"choose"
-        ]
-        pattern = re.compile(r"^(" + "|".join(placeholders) + r")$", re.IGNORECASE)
-    
-        df = self.df.copy()
-        df[self.date_column] = pd.to_datetime(df[self.date_column], errors='coerce')
-        df = df.dropna(subset=[self.date_column])
-        df['date_only'] = df[self.date_column].dt.date
-    
-        obj_cols = df.select_dtypes(include=['object']).columns
-    
-        melted = df.melt(id_vars=['date_only'], value_vars=obj_cols, var_name='column', value_name='value')
-    
-        # Total rows per date and column (including nulls)
-        total_per_date = melted.groupby(['date_only', 'column']).size().reset_index(name='total_rows')
-    
-        # Filter non-null values for matching
-        melted_non_null = melted[melted['value'].notnull()].copy()
-        melted_non_null['value_stripped'] = melted_non_null['value'].astype(str).str.strip()
-    
-        placeholder_mask = melted_non_null['value_stripped'].str.match(pattern)
-        placeholder_df = melted_non_null[placeholder_mask]
-    
-        # Count placeholders by date and column
-        placeholder_counts = placeholder_df.groupby(['date_only', 'column']).size().reset_index(name='placeholder_count')
-    
-        # Merge with total rows to calculate percentage
-        merged = placeholder_counts.merge(total_per_date, on=['date_only', 'column'], how='left')
-        merged['placeholder_percentage'] = (merged['placeholder_count'] / merged['total_rows']) * 100
-    
-        return merged
+        date_index = self._date_index()
+        obj_cols = [c for c in self.intermediate('object_columns') if c != self.date_column]
+        placeholder_mask = pd.DataFrame({col: self._placeholder_mask(col) for col in obj_cols},
+                                        columns=obj_cols, index=pd.RangeIndex(len(self.df)))
+        return wide_to_long_by_date(sum_by_date(placeholder_mask, date_index), date_index.totals,
+                                    'placeholder', 'total_rows')
+
+
+for _name, _func, _requires, _by_date in (
+    ("column_summary", DataQualityChecker._column_summary, ("null_mask",), False),
+    ("nulls", DataQualityChecker._null_counts, ("null_mask",), False),
+    ("outliers", DataQualityChecker._outlier_summary, ("numeric_columns",), False),
+    ("duplicates", DataQualityChecker._duplicate_summary, (), False),
+    ("mixed_types", DataQualityChecker._mixed_type_check, ("null_mask",), False),
+    ("outliers_by_date", DataQualityChecker._outliers_by_date, ("date_index", "numeric_columns"), True),
+    ("placeholder_counts", DataQualityChecker._placeholder_counts, ("placeholder_masks",), False),
+    ("placeholder_counts_by_date", DataQualityChecker._placeholder_counts_by_date, ("date_index", "placeholder_masks"), True),
+    ("nulls_by_date", DataQualityChecker._nulls_by_date, ("date_index", "null_mask"), True),
+    ("empty_strings_by_date", DataQualityChecker._empty_strings_by_date, ("date_index", "encoded"), True),
+):
+    # Every built-in check except duplicates looks at one column at a time
+    register_check(_name, _func, _requires, _by_date, column_local=_name != "duplicates")
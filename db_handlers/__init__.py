@@ -1,5 +1,6 @@
 from .sql_loader import load_sql_server_data
 from .postgres_loader import load_postgres_data
+from .stream_sql import read_sql, stream_sql
 
 def load_from_database(db_type='sqlserver'):
     """
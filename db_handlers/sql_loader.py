@@ -1,5 +1,5 @@
-import pandas as pd
 from sqlalchemy import create_engine
+from .stream_sql import read_sql, resolve_engine, stream_sql
 from urllib.parse import quote_plus
 import urllib
 import getpass
@@ -7,48 +7,73 @@ import getpass
 _engine = None
 _cached_query = {}
 
-def load_sql_server_data(args,**kwagrs):
+def load_sql_server_data(args=None, engine=None, table: str = None, stream: bool = False, chunk_rows: int = 100_000,
+                         fetch_size: int = None, **kwargs):
+    """
+    Load a SQL Server table or query, prompting for whatever is not given.
+
+    Parameters:
+    - args: str | SQL query (load_data passes its source here)
+    - engine: sqlalchemy.Engine | str | Engine or database URL; skips the connection prompts
+    - table: str | Table to read instead of a query
+    - stream: bool | Return an iterator of DataFrame chunks read through a
+      server-side cursor, see db_handlers.stream_sql
+    - chunk_rows: int | Rows per chunk when streaming
+    - fetch_size: int | Rows fetched per round trip when streaming, defaults to chunk_rows
+    - kwargs: extra params passed to pd.read_sql_table / pd.read_sql_query
+
+    Returns:
+    - pd.DataFrame | iterator of pd.DataFrame when stream=True; None when loading fails
+    """
     global _engine, _cached_query
 
-    # Step 1: Create engine only on first run
-    if _engine is None:
-        host = getpass.getpass("Enter SQL Server host/IP: ").strip()
-        port = getpass.getpass("Enter port (default 1433): ").strip() or "1433"
-        database = getpass.getpass("Enter SQL Server database name: ").strip()
-
-        server = f"{host},{port}"
-        conn_str = (
-            "Driver={ODBC Driver 17 for SQL Server};"
-            f"Server={server};"
-            f"Database={database};"
-            "Trusted_Connection=yes;"
-        )
-        conn_str = 'mssql+pyodbc:///?odbc_connect={}'.format(
-            urllib.parse.quote_plus(conn_str)
-        )
-        _engine = create_engine(conn_str)
+    # Step 1: Use the given engine for this call only, or the prompted one (created on first run)
+    if engine is not None:
+        db_engine = resolve_engine(engine)
     else:
-        print("✅ Reusing existing SQL Server engine...")
-
-    # Step 2: Use cached query or prompt on first run
-    if not _cached_query:
-        table = input("Enter SQL table (leave blank to enter custom query): ").strip()
-        if table:
-            _cached_query["mode"] = "table"
-            _cached_query["value"] = table
+        if _engine is None:
+            host = getpass.getpass("Enter SQL Server host/IP: ").strip()
+            port = getpass.getpass("Enter port (default 1433): ").strip() or "1433"
+            database = getpass.getpass("Enter SQL Server database name: ").strip()
+
+            server = f"{host},{port}"
+            conn_str = (
+                "Driver={ODBC Driver 17 for SQL Server};"
+                f"Server={server};"
+                f"Database={database};"
+                "Trusted_Connection=yes;"
+            )
+            conn_str = 'mssql+pyodbc:///?odbc_connect={}'.format(
+                urllib.parse.quote_plus(conn_str)
+            )
+            _engine = create_engine(conn_str)
         else:
-            query = input("Enter SQL query: ").strip()
-            _cached_query["mode"] = "query"
-            _cached_query["value"] = query
+            print("✅ Reusing existing SQL Server engine...")
+        db_engine = _engine
+
+    # Step 2: Use the given table/query, or the prompted one (cached from the first run)
+    if args or table:
+        source = {"table": table} if table else {"query": args}
     else:
-        print("✅ Reusing previous table/query...")
+        if not _cached_query:
+            table = input("Enter SQL table (leave blank to enter custom query): ").strip()
+            if table:
+                _cached_query["mode"] = "table"
+                _cached_query["value"] = table
+            else:
+                query = input("Enter SQL query: ").strip()
+                _cached_query["mode"] = "query"
+                _cached_query["value"] = query
+        else:
+            print("✅ Reusing previous table/query...")
+        source = {_cached_query["mode"]: _cached_query["value"]}
 
     # Step 3: Load data
+    if stream:
+        # Errors surface while the chunks are read
+        return stream_sql(db_engine, chunk_rows=chunk_rows, fetch_size=fetch_size, **source, **kwargs)
     try:
-        if _cached_query["mode"] == "table":
-            df = pd.read_sql_table(_cached_query["value"], _engine)
-        else:
-            df = pd.read_sql_query(_cached_query["value"], _engine)
+        df = read_sql(db_engine, **source, **kwargs)
 
         print("✅ Data loaded successfully from SQL Server.")
         return df
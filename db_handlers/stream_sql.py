@@ -0,0 +1,82 @@
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+
+def resolve_engine(engine):
+    """Engine from an Engine or a database URL string (e.g. 'sqlite:///data.db')."""
+    if engine is None or isinstance(engine, Engine):
+        return engine
+    return create_engine(engine)
+
+
+def read_sql(engine, query: str = None, table: str = None, stream: bool = False, chunk_rows: int = 100_000,
+             fetch_size: int = None, **kwargs):
+    """
+    Run a query, or read a whole table, with pandas.
+
+    Parameters:
+    - engine: sqlalchemy.Engine | str | Engine or database URL
+    - query: str | SQL query (used when table is not given)
+    - table: str | Table to read
+    - stream: bool | Return an iterator of DataFrame chunks, see stream_sql
+    - chunk_rows: int | Rows per chunk when streaming
+    - fetch_size: int | Rows fetched per round trip when streaming
+    - kwargs: extra params passed to pd.read_sql_table / pd.read_sql_query
+
+    Returns:
+    - pd.DataFrame | iterator of pd.DataFrame when stream=True
+    """
+    if not query and not table:
+        raise ValueError("A query or a table is required")
+    engine = resolve_engine(engine)
+    if stream:
+        return stream_sql(engine, query=query, table=table, chunk_rows=chunk_rows, fetch_size=fetch_size, **kwargs)
+    if table:
+        return pd.read_sql_table(table, engine, **kwargs)
+    return pd.read_sql_query(query, engine, **kwargs)
+
+
+def stream_sql(engine, query: str = None, table: str = None, chunk_rows: int = 100_000, fetch_size: int = None,
+               **kwargs):
+    """
+    Read a query or table as an iterator of DataFrame chunks without holding
+    the result set in client memory.
+
+    The connection runs with stream_results, so drivers with server-side
+    cursors (psycopg2 named cursors, pyodbc, MySQL SSCursor) fetch rows as the
+    chunks are consumed; SQLite cursors step through the result lazily anyway.
+    The connection stays open until the iterator is exhausted or closed.
+
+    Parameters:
+    - engine: sqlalchemy.Engine | str | Engine or database URL
+    - query: str | SQL query (used when table is not given)
+    - table: str | Table to read
+    - chunk_rows: int | Rows per DataFrame chunk
+    - fetch_size: int | Rows the driver fetches per round trip, defaults to chunk_rows
+    - kwargs: extra params passed to pd.read_sql_table / pd.read_sql_query
+
+    Returns:
+    - iterator of pd.DataFrame | Index continues across chunks; pass it to
+      StreamingDataQualityChecker
+    """
+    if not query and not table:
+        raise ValueError("A query or a table is required")
+    if chunk_rows is None or chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive number of rows")
+    return _stream(resolve_engine(engine), query, table, chunk_rows, fetch_size or chunk_rows, kwargs)
+
+
+def _stream(engine, query, table, chunk_rows, fetch_size, kwargs):
+    offset = 0
+    with engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True, max_row_buffer=fetch_size)
+        if table:
+            chunks = pd.read_sql_table(table, conn, chunksize=chunk_rows, **kwargs)
+        else:
+            chunks = pd.read_sql_query(query, conn, chunksize=chunk_rows, **kwargs)
+        for chunk in chunks:
+            if 'index_col' not in kwargs:
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
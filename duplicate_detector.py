@@ -0,0 +1,327 @@
+import numbers
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from utils.sketches import hash_numeric
+
+# Two independent hash keys: groups are formed on the first hash and the
+# second one verifies that rows sharing it really are equal.
+HASH_KEY = "0123456789123456"
+VERIFY_HASH_KEY = "dq-verify-hash-k"
+
+RECORD_DTYPE = np.dtype([('hash', '<u8'), ('verify', '<u8'), ('source', '<i4'), ('row', '<i8')])
+
+
+def hash_rows(frame: pd.DataFrame, hash_key: str = HASH_KEY) -> np.ndarray:
+    """
+    64-bit hash of every row. Numeric columns are hashed exactly, integers as
+    int64, so a column inferred as int in one chunk and float in another still
+    hashes identically (see hash_numeric). Object columns are hashed per value
+    with its type (see _hash_objects).
+    """
+    normalized = frame.copy(deep=False)
+    for col in normalized.columns:
+        dtype = normalized[col].dtype
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            normalized[col] = hash_numeric(normalized[col], hash_key)
+        elif dtype == object:
+            normalized[col] = _hash_objects(normalized[col].to_numpy(), hash_key)
+    return pd.util.hash_pandas_object(normalized, index=False, hash_key=hash_key).to_numpy()
+
+
+_is_str = np.frompyfunc(lambda value: isinstance(value, str), 1, 1)
+_is_real = np.frompyfunc(lambda value: isinstance(value, numbers.Real), 1, 1)
+_is_integral = np.frompyfunc(lambda value: isinstance(value, numbers.Integral), 1, 1)
+_type_name = np.frompyfunc(lambda value: type(value).__name__, 1, 1)
+
+
+def _hash_objects(values: np.ndarray, hash_key: str) -> np.ndarray:
+    # pandas hashes object values by their string form, so 1 and '1' would
+    # collide; non-strings also hash their type. Numbers (bool, int, float)
+    # share one type and are hashed like numeric columns, and missing values
+    # are one value, as they compare equal in DataFrame.duplicated.
+    hashed = pd.util.hash_array(values, hash_key=hash_key)
+    if pd.api.types.infer_dtype(values, skipna=False) == 'string':
+        return hashed
+    other = ~_is_str(values).astype(bool)
+    others = values[other]
+    missing = pd.isna(others)
+    real = _is_real(others).astype(bool) & ~missing
+    tags = np.where(missing, 'null', np.where(real, 'number', _type_name(others))).astype(object)
+    others[missing] = None
+    base = pd.util.hash_array(others, hash_key=hash_key)
+    if real.any():
+        base[real] = _hash_object_numbers(others[real], hash_key)
+    hashed[other] = base * np.uint64(0x9E3779B97F4A7C15) ^ pd.util.hash_array(tags, hash_key=hash_key)
+    return hashed
+
+
+def _hash_object_numbers(values, hash_key):
+    # Python ints may not fit float64 exactly, so they are hashed as int64
+    hashed = hash_numeric(values.astype('float64'), hash_key)
+    integral = np.flatnonzero(_is_integral(values).astype(bool))
+    if len(integral):
+        try:
+            hashed[integral] = hash_numeric(np.array(values[integral].tolist(), dtype='int64'), hash_key)
+        except OverflowError:
+            # Some exceed int64: keep their float hash, as DataFrame.duplicated compares them exactly anyway
+            fits = [i for i in integral if -2 ** 63 <= values[i] < 2 ** 63]
+            hashed[fits] = hash_numeric(np.array(values[fits].tolist(), dtype='int64'), hash_key)
+    return hashed
+
+
+class DuplicateReport:
+    """
+    Outcome of a duplicate scan.
+
+    Attributes:
+    - total_rows: int | Rows scanned
+    - duplicate_rows: int | Rows that repeat an earlier row (same as DataFrame.duplicated().sum())
+    - hash_collisions: int | Hash groups split because the verification hash disagreed
+    - groups: pd.DataFrame | group_id, size, first_source, first_row for every duplicated key
+    - rows: pd.DataFrame | group_id, source, row for every row belonging to a group
+    """
+
+    def __init__(self, total_rows, duplicate_rows, hash_collisions, groups, rows):
+        self.total_rows = total_rows
+        self.duplicate_rows = duplicate_rows
+        self.hash_collisions = hash_collisions
+        self.groups = groups
+        self.rows = rows
+
+    def summary(self) -> pd.DataFrame:
+        return pd.DataFrame([{
+            'total_rows': self.total_rows,
+            'duplicate_rows': self.duplicate_rows,
+            'duplicate_percentage': (self.duplicate_rows / self.total_rows) * 100 if self.total_rows else np.nan
+        }])
+
+
+class DuplicateDetector:
+    """
+    Memory-bounded duplicate detection over chunks and files using row hashes.
+
+    Parameters:
+    - subset: list | Key columns to compare, defaults to all columns
+    - memory_budget: int | Bytes of buffered hash records before they are spilled to disk
+    - spill_dir: str | Directory for spilled partitions, a temp dir by default
+    - partitions: int | Number of hash partitions written when spilling
+
+    Each row costs one 24-byte record (two hashes plus its source and row
+    position). When the buffer exceeds memory_budget the records are split by
+    hash into partitions and appended to per-partition files, so `finalize` only ever
+    holds one partition in memory. Spilled files live until `cleanup` is called
+    or the detector is garbage collected.
+    """
+
+    def __init__(self, subset: list = None, memory_budget: int = 256 * 1024 ** 2,
+                 spill_dir: str = None, partitions: int = 64):
+        self.subset = subset
+        self.memory_budget = memory_budget
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+        self.sources = []
+        self.total_rows = 0
+        self._source_ids = {}
+        self._source_rows = []
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._spilled = False
+        self._owns_spill_dir = spill_dir is None
+
+    def update(self, chunk: pd.DataFrame, source=None):
+        """Add a chunk; rows are numbered per source in the order they arrive."""
+        if source not in self._source_ids:
+            self._source_ids[source] = len(self.sources)
+            self.sources.append(source)
+            self._source_rows.append(0)
+        source_id = self._source_ids[source]
+
+        keys = chunk[self.subset] if self.subset is not None else chunk
+        records = np.empty(len(chunk), dtype=RECORD_DTYPE)
+        records['hash'] = hash_rows(keys)
+        records['verify'] = hash_rows(keys, VERIFY_HASH_KEY)
+        records['source'] = source_id
+        records['row'] = np.arange(self._source_rows[source_id], self._source_rows[source_id] + len(chunk))
+        self._source_rows[source_id] += len(chunk)
+        self.total_rows += len(chunk)
+
+        self._buffer.append(records)
+        self._buffer_bytes += records.nbytes
+        if self._buffer_bytes > self.memory_budget:
+            self._spill()
+        return self
+
+    def merge(self, other: "DuplicateDetector"):
+        """Fold in another detector's rows; its sources are kept as separate sources."""
+        offset = len(self.sources)
+        for source, rows in zip(other.sources, other._source_rows):
+            self._source_ids.setdefault(source, len(self.sources))
+            self.sources.append(source)
+            self._source_rows.append(rows)
+        for records in other._iter_records():
+            records = records.copy()
+            records['source'] += offset
+            self._buffer.append(records)
+            self._buffer_bytes += records.nbytes
+        self.total_rows += other.total_rows
+        if self._buffer_bytes > self.memory_budget:
+            self._spill()
+        return self
+
+    def finalize(self) -> DuplicateReport:
+        if self._spilled:
+            self._spill()
+            partitions = (self._read_partition(i) for i in range(self.partitions))
+        else:
+            partitions = [np.concatenate(self._buffer) if self._buffer else np.empty(0, dtype=RECORD_DTYPE)]
+
+        duplicate_rows, collisions, next_group = 0, 0, 0
+        groups, rows = [], []
+        for records in partitions:
+            part = self._group_partition(records, next_group)
+            duplicate_rows += part[0]
+            collisions += part[1]
+            if len(part[2]):
+                groups.append(part[2])
+                rows.append(part[3])
+                next_group += len(part[2])
+
+        groups = pd.concat(groups, ignore_index=True) if groups else pd.DataFrame(
+            columns=['group_id', 'size', 'first_source', 'first_row'])
+        rows = pd.concat(rows, ignore_index=True) if rows else pd.DataFrame(columns=['group_id', 'source', 'row'])
+        return DuplicateReport(self.total_rows, duplicate_rows, collisions, groups, rows)
+
+    def cleanup(self):
+        """Drop all rows seen so far, removing spilled partitions from disk."""
+        if self._spilled and self.spill_dir:
+            if self._owns_spill_dir:
+                shutil.rmtree(self.spill_dir, ignore_errors=True)
+                self.spill_dir = None
+            else:
+                for i in range(self.partitions):
+                    if os.path.exists(self._partition_path(i)):
+                        os.remove(self._partition_path(i))
+        self._spilled = False
+        self._buffer = []
+        self._buffer_bytes = 0
+
+    def __getstate__(self):
+        # A pickled copy reads the same spill files but never deletes them
+        state = self.__dict__.copy()
+        state['_owns_spill_dir'] = False
+        return state
+
+    def __del__(self):
+        if self._spilled and self._owns_spill_dir and self.spill_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _group_partition(self, records, first_group_id):
+        if not len(records):
+            return 0, 0, [], []
+        hashes = np.ascontiguousarray(records['hash'])
+        verify = np.ascontiguousarray(records['verify'])
+        n = len(records)
+
+        # Sort by hash, then by arrival within each hash so the first row of
+        # every key is the one seen first; two quicksorts beat one lexsort.
+        order = np.argsort(hashes)
+        new_hash = np.ones(n, dtype=bool)
+        new_hash[1:] = hashes[order][1:] != hashes[order][:-1]
+        order = order[np.argsort((np.cumsum(new_hash) - 1) * n + order)]
+        sorted_verify = verify[order]
+        new_key = new_hash.copy()
+        new_key[1:] |= sorted_verify[1:] != sorted_verify[:-1]
+
+        # A key that starts while the hash is unchanged means the verification
+        # hash split a hash group: the rows only collided on the first hash
+        collisions = int(np.count_nonzero(new_key & ~new_hash))
+        if collisions:
+            order = np.lexsort((np.arange(n), verify, hashes))
+            new_key = np.ones(n, dtype=bool)
+            new_key[1:] = (hashes[order][1:] != hashes[order][:-1]) | (verify[order][1:] != verify[order][:-1])
+            collisions = int(np.count_nonzero(new_key[1:] & (hashes[order][1:] == hashes[order][:-1])))
+
+        starts = np.flatnonzero(new_key)
+        sizes = np.diff(np.append(starts, n))
+        duplicated = sizes > 1
+        if not duplicated.any():
+            return 0, collisions, [], []
+        group_ids = np.full(len(starts), -1, dtype=np.int64)
+        group_ids[duplicated] = np.arange(first_group_id, first_group_id + duplicated.sum())
+        row_groups = np.repeat(group_ids, sizes)
+        in_group = row_groups >= 0
+
+        first = order[starts[duplicated]]
+        members = order[in_group]
+        sources = np.array(self.sources + [None], dtype=object)[:-1]
+        groups = pd.DataFrame({
+            'group_id': group_ids[duplicated],
+            'size': sizes[duplicated],
+            'first_source': sources[records['source'][first]],
+            'first_row': records['row'][first]
+        })
+        rows = pd.DataFrame({
+            'group_id': row_groups[in_group],
+            'source': sources[records['source'][members]],
+            'row': records['row'][members]
+        })
+        return int((sizes[duplicated] - 1).sum()), collisions, groups, rows
+
+    def _iter_records(self):
+        if self._spilled:
+            self._spill()
+            for i in range(self.partitions):
+                yield self._read_partition(i)
+        else:
+            yield from self._buffer
+
+    def _spill(self):
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="dq_duplicates_")
+        os.makedirs(self.spill_dir, exist_ok=True)
+        self._spilled = True
+        if not self._buffer:
+            return
+        records = np.concatenate(self._buffer)
+        partition = (records['hash'] % np.uint64(self.partitions)).astype(np.int64)
+        for i in np.unique(partition):
+            with open(self._partition_path(i), 'ab') as f:
+                records[partition == i].tofile(f)
+        self._buffer = []
+        self._buffer_bytes = 0
+
+    def _partition_path(self, i):
+        return os.path.join(self.spill_dir, f"partition_{i:04d}.bin")
+
+    def _read_partition(self, i):
+        path = self._partition_path(i)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.fromfile(path, dtype=RECORD_DTYPE)
+
+
+def detect_duplicates(sources: dict, subset: list = None, **kwargs) -> DuplicateReport:
+    """
+    Find duplicate rows across several sources (e.g. months of daily files).
+
+    Parameters:
+    - sources: dict | Source label -> DataFrame or iterable of DataFrame chunks,
+      e.g. {path: load_csv(path, chunksize=100_000) for path in paths}
+    - subset: list | Key columns, defaults to all columns
+    - kwargs: extra params passed to DuplicateDetector (memory_budget, spill_dir, partitions)
+
+    Returns:
+    - DuplicateReport
+    """
+    detector = DuplicateDetector(subset=subset, **kwargs)
+    for label, chunks in sources.items():
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        for chunk in chunks:
+            detector.update(chunk, source=label)
+    return detector.finalize()
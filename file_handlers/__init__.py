@@ -5,6 +5,9 @@ from .load_parquet import load_parquet
 from .load_txt import load_txt
 from .load_xml import load_xml
 from .load_compressed import load_compressed
+from .parquet_metadata import parquet_null_counts, parquet_row_count
+from .stream_csv import stream_csv
+from .file_dataset import FileDataset
 
 def load_file(file_path: str, file_type: str = None, **kwargs):
     """
@@ -32,7 +35,7 @@ def load_file(file_path: str, file_type: str = None, **kwargs):
             file_type = "text"
         elif file_path.endswith(".xml"):
             file_type = "xml"
-        elif file_path.endswith((".zip", ".gz", ".tar", ".rar")):
+        elif file_path.endswith((".zip", ".tar", ".tgz", ".gz", ".bz2", ".xz", ".zst")):
             file_type = "compressed"
         else:
             raise ValueError("❌ Cannot detect file type. Please specify `file_type` manually.")
@@ -47,7 +50,7 @@ def load_file(file_path: str, file_type: str = None, **kwargs):
     elif file_type == "parquet":
         return load_parquet(file_path, **kwargs)
     elif file_type == "text" or file_type == "tsv":
-        return load_text(file_path, **kwargs)
+        return load_txt(file_path, **kwargs)
     elif file_type == "xml":
         return load_xml(file_path, **kwargs)
     elif file_type == "compressed":
@@ -0,0 +1,297 @@
+import csv
+import glob
+import logging
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+_logger = logging.getLogger("data_quality_logger")
+
+GLOB_CHARS = "*?["
+# scheme:// prefix of a URL; a single letter is a Windows drive, not a scheme
+_URL_SCHEME = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]+://")
+SCHEMA_MODES = ("union", "first")
+# Loader options that change which columns a delimited file's header yields
+_HEADER_KWARGS = ("sep", "delimiter", "encoding", "usecols", "header", "names", "skiprows", "index_col")
+_EXCEL_HEADER_KWARGS = ("sheet_name", "usecols", "header", "names", "skiprows", "index_col")
+
+
+def is_multi_source(source) -> bool:
+    """True for a list of paths, a directory or a glob pattern."""
+    if isinstance(source, (list, tuple)):
+        return True
+    if not isinstance(source, (str, os.PathLike)):
+        return False
+    source = os.fspath(source)
+    if isinstance(source, str) and _URL_SCHEME.match(source):
+        # URLs (http(s), s3, ...) go to the loaders as they are; '?' starts their query string
+        return False
+    return os.path.isdir(source) or (any(c in source for c in GLOB_CHARS) and not os.path.exists(source))
+
+
+def _is_data_file(path):
+    # Skip hidden files and writer markers such as _SUCCESS or .crc files
+    base = os.path.basename(path)
+    return not base.startswith(('.', '_'))
+
+
+def expand_sources(source) -> tuple:
+    """
+    Resolve a list of paths, a directory (walked recursively) or a glob into files.
+
+    Returns:
+    - (list, str) | Sorted file paths and the root directory partition
+      folders are taken relative to
+    """
+    if isinstance(source, (list, tuple)):
+        # No root: partition folders anywhere in the paths count
+        files, root = [os.fspath(path) for path in source], None
+    elif os.path.isdir(source):
+        root = os.fspath(source)
+        files = [os.path.join(directory, name)
+                 for directory, dirnames, names in os.walk(root)
+                 for name in names]
+        files = [path for path in files
+                 if _is_data_file(path) and not any(part.startswith(('.', '_')) and '=' not in part
+                                                    for part in os.path.relpath(path, root).split(os.sep)[:-1])]
+    else:
+        source = os.fspath(source)
+        files = [path for path in glob.glob(source, recursive=True) if os.path.isfile(path) and _is_data_file(path)]
+        # Partition folders are read below the last directory without wildcards
+        prefix = source.split(os.sep)
+        fixed = next((i for i, part in enumerate(prefix) if any(c in part for c in GLOB_CHARS)), len(prefix) - 1)
+        root = os.sep.join(prefix[:fixed]) or os.curdir
+    files = sorted(files)
+    if not files:
+        raise ValueError(f"No files found for source: {source}")
+    return files, root
+
+
+def hive_partitions(path: str, root: str) -> dict:
+    """key=value directory names between root (or the filesystem root) and path,
+    e.g. {'date': '2026-10-01'}."""
+    directory = os.path.dirname(os.path.abspath(path))
+    relative = os.path.relpath(directory, os.path.abspath(root)) if root is not None else directory
+    partitions = {}
+    for part in relative.split(os.sep):
+        if '=' in part:
+            key, value = part.split('=', 1)
+            partitions[key] = value
+    return partitions
+
+
+def read_columns(path: str, file_type: str, **kwargs) -> list:
+    """
+    Column names of a file without loading its rows where the format allows
+    (CSV/TXT header, Parquet schema, Excel header row of a given sheet); None
+    for other formats.
+    """
+    if file_type in ('csv', 'txt', 'text', 'tsv'):
+        header_kwargs = {key: value for key, value in kwargs.items() if key in _HEADER_KWARGS}
+        if file_type != 'csv' and 'sep' not in header_kwargs:
+            header_kwargs.setdefault('delimiter', '\t')
+        if set(header_kwargs) <= {'sep', 'delimiter', 'encoding'}:
+            # Parsing the first line directly is much cheaper than read_csv on small files
+            names = _header_line(path, header_kwargs)
+            if names is not None:
+                return names
+        return list(pd.read_csv(path, nrows=0, **header_kwargs).columns)
+    if file_type == 'parquet':
+        import pyarrow.parquet as pq
+        names = pq.read_schema(path).names
+        columns = kwargs.get('columns')
+        return [name for name in names
+                if not name.startswith('__index_level_') and (columns is None or name in columns)]
+    if file_type == 'excel' and kwargs.get('sheet_name') is not None:
+        # The header row only; without a sheet the loader returns every sheet
+        excel_kwargs = {key: value for key, value in kwargs.items() if key in _EXCEL_HEADER_KWARGS}
+        return list(pd.read_excel(path, nrows=0, **excel_kwargs).columns)
+    return None
+
+
+def _header_line(path, header_kwargs):
+    delimiter = header_kwargs.get('delimiter', header_kwargs.get('sep', ','))
+    if delimiter is None or len(delimiter) != 1:
+        return None
+    with open(path, newline='', encoding=header_kwargs.get('encoding') or 'utf-8') as f:
+        names = next(csv.reader(f, delimiter=delimiter), None)
+    # Leave duplicate or blank names to read_csv, which renames them
+    if not names or len(set(names)) != len(names) or '' in names:
+        return None
+    return [name.lstrip('\ufeff') if i == 0 else name for i, name in enumerate(names)]
+
+
+class FileDataset:
+    """
+    Many files read as one lazily concatenated dataset.
+
+    Parameters:
+    - files: list | File paths, in dataset order
+    - loader: callable | loader(path) -> pd.DataFrame for one file
+    - root: str | Directory hive partitions (key=value folders) are read relative to
+    - columns_reader: callable | columns_reader(path) -> column names, cheaper than
+      a full load (see read_columns); files it returns None for are loaded
+    - schema: str | list | 'union' of all files' columns, the 'first' file's
+      columns, an explicit column list, or None to leave frames as read
+    - partitions: bool | Add the hive partition values from the path as columns
+      (as strings; a path value replaces a file column of the same name)
+    - file_column: str | Add a column holding each row's file path (optional)
+    - workers: int | Threads reading files concurrently
+    - prefetch: int | Files read ahead of the consumer, defaults to 2 x workers
+    - keep_bytes: int | Memory for frames loaded to learn their columns, see below
+
+    Iterating yields one conformed frame per file in order, while the next files
+    are read on the thread pool, so StreamingDataQualityChecker can consume the
+    dataset file by file. Every frame carries the reconciled columns (missing
+    ones as NaN), so per-column counts cover all rows. `to_frame` concatenates.
+    Files whose columns_reader returns None (JSON, XML, ...) are loaded to
+    learn their columns; up to keep_bytes of those frames are kept until they
+    are iterated, the rest are read again.
+    """
+
+    def __init__(self, files: list, loader, root: str = None, columns_reader=None, schema="union",
+                 partitions: bool = True, file_column: str = None, workers: int = None, prefetch: int = None,
+                 keep_bytes: int = 256 * 1024 ** 2):
+        if isinstance(schema, str) and schema not in SCHEMA_MODES:
+            raise ValueError(f"Unsupported schema mode: {schema}")
+        self.paths = list(files)
+        self.loader = loader
+        self.root = root
+        self.columns_reader = columns_reader
+        self.schema = schema
+        self.partitions = partitions
+        self.file_column = file_column
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.prefetch = prefetch or 2 * self.workers
+        self._columns = list(schema) if isinstance(schema, (list, tuple)) else None
+        self.keep_bytes = keep_bytes
+        self._loaded = {}
+        self._loaded_bytes = 0
+        self._loaded_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __repr__(self):
+        return f"FileDataset({len(self.paths)} files, root={self.root!r})"
+
+    @property
+    def columns(self) -> list:
+        """Reconciled columns (file columns, then partition keys, then file_column)."""
+        if self._columns is None and self.schema is not None:
+            paths = self.paths[:1] if self.schema == "first" else self.paths
+            columns = {}
+            for names in self._map(self._read_columns, paths):
+                columns.update(dict.fromkeys(names))
+            if self.partitions:
+                for path in self.paths:
+                    columns.update(dict.fromkeys(hive_partitions(path, self.root)))
+            if self.file_column:
+                columns[self.file_column] = None
+            self._columns = list(columns)
+        return self._columns
+
+    def __iter__(self):
+        columns = self.columns
+        for path, frame in zip(self.paths, self._map(self._load, self.paths)):
+            yield self._conform(frame, path, columns)
+
+    def iter_chunks(self, chunk_rows: int = 100_000):
+        """
+        Yield frames of chunk_rows rows, coalescing small files and splitting
+        large ones (the last chunk may be shorter).
+        """
+        buffered, buffered_rows, offset = [], 0, 0
+        for frame in self:
+            buffered.append(frame)
+            buffered_rows += len(frame)
+            if buffered_rows < chunk_rows:
+                continue
+            merged = pd.concat(buffered, ignore_index=True) if len(buffered) > 1 else frame
+            full = len(merged) - len(merged) % chunk_rows
+            for start in range(0, full, chunk_rows):
+                chunk = merged.iloc[start:start + chunk_rows]
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+            buffered, buffered_rows = ([merged.iloc[full:]], len(merged) - full) if full < len(merged) else ([], 0)
+        if buffered_rows:
+            merged = pd.concat(buffered, ignore_index=True)
+            merged.index = pd.RangeIndex(offset, offset + len(merged))
+            yield merged
+
+    def to_frame(self) -> pd.DataFrame:
+        """Read every file and concatenate them into one DataFrame."""
+        frames = list(self._map(self._load, self.paths))
+        _logger.info(f"Loaded {len(frames)} files from {self.root or 'file list'}")
+        merged = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
+        # Path columns are added once to the whole frame, not file by file
+        extras = [self._path_values(path) for path in self.paths]
+        lengths = [len(frame) for frame in frames]
+        for column in dict.fromkeys(key for extra in extras for key in extra):
+            merged[column] = np.repeat(np.array([extra.get(column) for extra in extras], dtype=object), lengths)
+        # concat already unions the columns in order of appearance, so no header scan is needed
+        columns = self._columns if self.schema == "union" else self.columns
+        if columns is not None and list(merged.columns) != columns:
+            merged = merged.reindex(columns=columns)
+        return merged
+
+    def _read_columns(self, path):
+        names = self.columns_reader(path) if self.columns_reader else None
+        if names is None:
+            # No cheap header: keep the frame for the first read while it fits keep_bytes
+            frame = self.loader(path)
+            names = list(frame.columns)
+            size = int(frame.memory_usage(deep=True).sum())
+            with self._loaded_lock:
+                if self._loaded_bytes + size <= self.keep_bytes:
+                    self._loaded[path] = (frame, size)
+                    self._loaded_bytes += size
+        return names
+
+    def _load(self, path):
+        with self._loaded_lock:
+            frame, size = self._loaded.pop(path, (None, 0))
+            self._loaded_bytes -= size
+        return frame if frame is not None else self.loader(path)
+
+    def _path_values(self, path):
+        extra = hive_partitions(path, self.root) if self.partitions else {}
+        if self.file_column:
+            extra[self.file_column] = path
+        return extra
+
+    def _conform(self, frame, path, columns):
+        for column, value in self._path_values(path).items():
+            # Frames come fresh from the loader, so they are extended in place
+            frame[column] = value
+        if columns is not None and list(frame.columns) != columns:
+            dropped = [col for col in frame.columns if col not in columns]
+            if dropped:
+                _logger.info(f"Dropping columns {dropped} of {path} that are not in the dataset schema")
+            frame = frame.reindex(columns=columns)
+        return frame
+
+    def _map(self, func, paths):
+        # Ordered results with at most `prefetch` files in flight
+        if len(paths) <= 1 or self.workers == 1:
+            yield from map(func, paths)
+            return
+        pending = deque()
+        paths = iter(paths)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="dq_files") as pool:
+            try:
+                for path in paths:
+                    pending.append(pool.submit(func, path))
+                    if len(pending) >= self.prefetch:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
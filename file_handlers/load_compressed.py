@@ -1,33 +1,347 @@
+import bz2
+import gzip
+import io
+import logging
+import lzma
+import os
+import tarfile
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from io import BytesIO
 
-def load_compressed(path: str, file_inside: str = None, **kwargs) -> pd.DataFrame:
+from .stream_csv import stream_csv
+
+_logger = logging.getLogger("data_quality_logger")
+
+# Single-stream codecs by extension; '.tgz'-style names are tar archives with a codec
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.gzip': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd', '.zstd': 'zstd'}
+TAR_SHORT_EXTENSIONS = {'.tgz': 'gzip', '.tbz2': 'bz2', '.tbz': 'bz2', '.txz': 'xz', '.tzst': 'zstd'}
+
+# Member extension -> format; members with other extensions are skipped when loading a whole archive
+MEMBER_FORMATS = {
+    'csv': 'csv', 'txt': 'txt', 'tsv': 'txt', 'json': 'json', 'xml': 'xml',
+    'xls': 'excel', 'xlsx': 'excel', 'parquet': 'parquet'
+}
+STREAMABLE_FORMATS = ('csv', 'txt')
+# Codecs pyarrow decompresses itself, so single compressed CSVs get stream_csv's parallel parser
+ARROW_STREAM_CODECS = ('gzip', 'bz2', 'zstd')
+# Readers that need a seekable file get the member's bytes in memory
+_SEEKABLE_FORMATS = ('excel', 'parquet')
+_CODEC_MAGIC = ((b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz'), (b'\x28\xb5\x2f\xfd', 'zstd'))
+
+
+def archive_type(path: str, compression: str = None) -> tuple:
+    """
+    Kind of compressed source.
+
+    Parameters:
+    - path: str | Archive or compressed file
+    - compression: str | Explicit type ('zip', 'tar', 'gzip', 'bz2', 'xz', 'zstd'),
+      which wins over the extension; None or 'compressed' detects it from the
+      extension, then from the file's leading bytes
+
+    Returns:
+    - (str, str) | ('zip', None), ('tar', codec or None) or ('single', codec) for
+      one compressed file such as data.csv.gz; (None, None) when not compressed
+    """
+    name = os.path.basename(path).lower()
+    root, ext = os.path.splitext(name)
+    if ext == '.zip':
+        kind, codec = 'zip', None
+    elif ext == '.tar':
+        kind, codec = 'tar', None
+    elif ext in TAR_SHORT_EXTENSIONS:
+        kind, codec = 'tar', TAR_SHORT_EXTENSIONS[ext]
+    elif ext in COMPRESSION_EXTENSIONS:
+        codec = COMPRESSION_EXTENSIONS[ext]
+        kind = 'tar' if root.endswith('.tar') else 'single'
+    else:
+        kind, codec = None, None
+
+    if compression in (None, 'compressed'):
+        return (kind, codec) if kind or compression is None else _sniff_type(path)
+    if compression == 'zip':
+        return 'zip', None
+    if compression == 'tar':
+        return 'tar', codec if kind == 'tar' else _sniff_codec(path)
+    if compression in COMPRESSION_EXTENSIONS.values():
+        return ('tar' if kind == 'tar' else 'single'), compression
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def _sniff_codec(path):
+    # Single-stream codec from the magic bytes at the start of the file
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, codec in _CODEC_MAGIC:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def _sniff_type(path):
+    if zipfile.is_zipfile(path):
+        return 'zip', None
+    codec = _sniff_codec(path)
+    if codec is None:
+        return ('tar', None) if tarfile.is_tarfile(path) else (None, None)
+    try:
+        with open_decompressed(path, codec) as f, tarfile.open(fileobj=f, mode='r|') as tar:
+            tar.next()
+        return 'tar', codec
+    except tarfile.TarError:
+        return 'single', codec
+
+
+def open_decompressed(path: str, codec: str):
+    """Binary file object yielding the decompressed bytes of path as they are read."""
+    if codec is None:
+        return open(path, 'rb')
+    if codec == 'gzip':
+        return gzip.open(path, 'rb')
+    if codec == 'bz2':
+        return bz2.open(path, 'rb')
+    if codec == 'xz':
+        return lzma.open(path, 'rb')
+    if codec == 'zstd':
+        try:
+            from compression import zstd  # Python 3.14+
+            return zstd.open(path, 'rb')
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Reading .zst files needs the zstandard package (pip install zstandard)")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    raise ValueError(f"Unsupported compression: {codec}")
+
+
+def member_format(name: str) -> str:
+    """Format of an archive member from its extension, or None when unsupported."""
+    return MEMBER_FORMATS.get(name.rsplit('.', 1)[-1].lower()) if '.' in name else None
+
+
+def list_members(path: str, compression: str = None) -> list:
+    """Names of the files in an archive (for one compressed file, its inner name);
+    compression is an explicit type, see archive_type."""
+    kind, codec = archive_type(path, compression)
+    if kind == 'zip':
+        with zipfile.ZipFile(path) as z:
+            return [info.filename for info in z.infolist() if _is_data_member(info.filename, info.is_dir())]
+    if kind == 'tar':
+        with tarfile.open(fileobj=open_decompressed(path, codec), mode='r|') as tar:
+            return [m.name for m in tar if _is_data_member(m.name, not m.isfile())]
+    if kind == 'single':
+        # data.csv.gz holds data.csv; a file whose name has no codec extension holds itself
+        root, ext = os.path.splitext(os.path.basename(path))
+        return [root if ext.lower() in COMPRESSION_EXTENSIONS else os.path.basename(path)]
+    raise ValueError(f"Not a supported compressed file: {path}")
+
+
+class _ForwardOnly(io.RawIOBase):
+    """Read-only, non-seekable view of a member of a tar read in stream mode
+    (whose own seekable() fails, which pandas calls)."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._f.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _is_data_member(name, is_dir):
+    # Skip directories and the metadata macOS adds to zips
+    base = os.path.basename(name)
+    return not is_dir and not name.startswith('__MACOSX/') and not base.startswith('._')
+
+
+def iter_members(path: str, members: list = None, compression: str = None):
     """
-    Load a file inside a compressed archive (zip) into a DataFrame.
-    
+    Yield (name, file object) for each member in archive order, decompressing
+    as the file object is read; nothing is extracted to disk.
+
     Parameters:
-    - path: str | Path to zip archive
-    - file_inside: str | Filename inside zip to load (required if multiple files)
-    - kwargs: extra params passed to specific loaders
-    
+    - path: str | Archive or compressed file
+    - members: list | Only these members, defaults to all
+    - compression: str | Explicit archive type, see archive_type
+    """
+    kind, codec = archive_type(path, compression)
+    wanted = set(members) if members is not None else None
+    if kind == 'zip':
+        with zipfile.ZipFile(path) as z:
+            for info in z.infolist():
+                if _is_data_member(info.filename, info.is_dir()) and (wanted is None or info.filename in wanted):
+                    with z.open(info) as f:
+                        yield info.filename, f
+    elif kind == 'tar':
+        # Stream mode: one sequential pass, also for compressed tars
+        with tarfile.open(fileobj=open_decompressed(path, codec), mode='r|') as tar:
+            for member in tar:
+                if _is_data_member(member.name, not member.isfile()) and (wanted is None or member.name in wanted):
+                    with tar.extractfile(member) as f:
+                        yield member.name, io.BufferedReader(_ForwardOnly(f))
+    elif kind == 'single':
+        name = list_members(path, compression)[0]
+        if wanted is None or name in wanted:
+            with open_decompressed(path, codec) as f:
+                yield name, f
+    else:
+        raise ValueError(f"Not a supported compressed file: {path}")
+
+
+def read_member(f, fmt: str, **kwargs) -> pd.DataFrame:
+    """Parse one member with the reader of its format."""
+    if fmt in _SEEKABLE_FORMATS and not isinstance(f, io.BytesIO):
+        f = io.BytesIO(f.read())
+    if fmt == 'csv':
+        return pd.read_csv(f, **kwargs)
+    if fmt == 'txt':
+        return pd.read_csv(f, **_txt_kwargs(kwargs))
+    if fmt == 'json':
+        return pd.read_json(f, **kwargs)
+    if fmt == 'xml':
+        return pd.read_xml(f, **kwargs)
+    if fmt == 'excel':
+        return pd.read_excel(f, **kwargs)
+    if fmt == 'parquet':
+        return pd.read_parquet(f, **kwargs)
+    raise ValueError(f"Unsupported file type {fmt} inside archive")
+
+
+def _txt_kwargs(kwargs):
+    # Same default as load_txt: tab-delimited
+    if 'sep' not in kwargs and 'delimiter' not in kwargs:
+        return dict(kwargs, delimiter='\t')
+    return kwargs
+
+
+def load_compressed(path: str, file_inside: str = None, members: list = None, workers: int = None,
+                    stream: bool = False, chunk_rows: int = 100_000, member_column: str = None,
+                    compression: str = None, **kwargs) -> pd.DataFrame:
+    """
+    Load the data files of a compressed source into a DataFrame.
+
+    Supports zip and tar archives (plain, .tar.gz/.tgz, .tar.bz2, .tar.xz,
+    .tar.zst) and single compressed files (.gz, .bz2, .xz, .zst -- zstd needs
+    the zstandard package before Python 3.14). Members are decompressed in
+    memory as they are parsed; nothing is extracted to disk.
+
+    Parameters:
+    - path: str | Archive or compressed file
+    - file_inside: str | Load only this member
+    - members: list | Load only these members, defaults to every csv/txt/tsv/json/
+      xml/xls(x)/parquet member (others are skipped)
+    - workers: int | Threads parsing members in parallel, defaults to the CPU count
+    - stream: bool | Return an iterator of DataFrame chunks over all members
+      instead (csv/txt members are read with chunksize, others are sliced)
+    - chunk_rows: int | Rows per chunk when streaming
+    - member_column: str | Add a column holding each row's member name (optional)
+    - compression: str | Archive type ('zip', 'tar', 'gzip', 'bz2', 'xz', 'zstd'), for
+      files whose extension does not tell it; detected by default (see archive_type)
+    - kwargs: extra params passed to the member readers (pd.read_csv etc.)
+
     Returns:
-    - pd.DataFrame
+    - pd.DataFrame | Members concatenated in archive order (columns are unioned);
+      an iterator of DataFrame when stream=True
     """
-    with zipfile.ZipFile(path, 'r') as z:
-        # If no filename specified, try to pick the first file
-        if not file_inside:
-            file_inside = z.namelist()[0]
-        with z.open(file_inside) as f:
-            # Infer file extension to decide how to load
-            ext = file_inside.split('.')[-1].lower()
-            if ext == 'csv':
-                return pd.read_csv(f, **kwargs)
-            elif ext in ['xls', 'xlsx']:
-                return pd.read_excel(f, **kwargs)
-            elif ext == 'json':
-                return pd.read_json(f, **kwargs)
-            elif ext == 'parquet':
-                return pd.read_parquet(f, **kwargs)
-            else:
-                raise ValueError(f"Unsupported file type {ext} inside zip")
+    if file_inside:
+        members = [file_inside]
+    for name in members or []:
+        if member_format(name) is None:
+            raise ValueError(f"Unsupported file type {name.rsplit('.', 1)[-1]} inside archive")
+
+    if stream:
+        return _stream_members(path, members, chunk_rows, member_column, compression, kwargs)
+    workers = workers or os.cpu_count() or 1
+    kind, codec = archive_type(path, compression)
+    if kind is None:
+        raise ValueError(f"Not a supported compressed file: {path}")
+    # Pin the detected type, so the readers below all agree on it
+    compression = codec if kind == 'single' else kind
+    if kind == 'zip':
+        # The zip directory is cheap to read, so members are opened independently
+        names = members if members is not None else list_members(path, 'zip')
+        names = [name for name in names if _supported(name)]
+        loaded = _load_zip_members(path, names, workers, kwargs)
+    else:
+        loaded = _load_sequential_members(path, members, workers, compression, kwargs)
+    if not loaded:
+        raise ValueError(f"No supported data files in {path}")
+
+    frames = [frame.assign(**{member_column: name}) if member_column else frame for name, frame in loaded]
+    _logger.info(f"Loaded {len(frames)} member(s) from {path}")
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def _supported(name):
+    if member_format(name) is None:
+        _logger.info(f"Skipping unsupported archive member {name}")
+        return False
+    return True
+
+
+def _load_zip_member(path, name, kwargs):
+    # One ZipFile per task, so members decompress and parse concurrently
+    with zipfile.ZipFile(path) as z, z.open(name) as f:
+        return name, read_member(f, member_format(name), **kwargs)
+
+
+def _load_zip_members(path, names, workers, kwargs):
+    if len(names) <= 1 or workers == 1:
+        return [_load_zip_member(path, name, kwargs) for name in names]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dq_archive") as pool:
+        futures = [pool.submit(_load_zip_member, path, name, kwargs) for name in names]
+        return [future.result() for future in futures]
+
+
+def _read_named(name, f, kwargs):
+    return name, read_member(f, member_format(name), **kwargs)
+
+
+def _load_sequential_members(path, members, workers, compression, kwargs):
+    # Tar streams only read front to back: members are read here in order and
+    # parsed on the pool, with at most 2 x workers members' bytes held at once
+    loaded, pending = [], deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dq_archive") as pool:
+        for name, f in iter_members(path, members, compression):
+            if not _supported(name):
+                continue
+            pending.append(pool.submit(_read_named, name, io.BytesIO(f.read()), kwargs))
+            while len(pending) >= 2 * workers:
+                loaded.append(pending.popleft().result())
+        loaded.extend(future.result() for future in pending)
+    return loaded
+
+
+def _stream_members(path, members, chunk_rows, member_column, compression, kwargs):
+    kind, codec = archive_type(path, compression)
+    name = list_members(path, compression)[0] if kind == 'single' else ''
+    # pyarrow picks the codec from the extension, so it only gets files named after theirs
+    if (kind == 'single' and codec in ARROW_STREAM_CODECS and member_format(name) in STREAMABLE_FORMATS
+            and members in (None, [name]) and archive_type(path) == (kind, codec)):
+        reader_kwargs = _txt_kwargs(kwargs) if member_format(name) == 'txt' else dict(kwargs)
+        reader_kwargs.setdefault('delimiter', reader_kwargs.pop('sep', ','))
+        for chunk in stream_csv(path, chunk_rows, **reader_kwargs):
+            yield chunk.assign(**{member_column: name}) if member_column else chunk
+        return
+
+    for name, f in iter_members(path, members, compression):
+        if not _supported(name):
+            continue
+        fmt = member_format(name)
+        if fmt in STREAMABLE_FORMATS:
+            reader_kwargs = _txt_kwargs(kwargs) if fmt == 'txt' else kwargs
+            chunks = pd.read_csv(f, chunksize=chunk_rows, **reader_kwargs)
+        else:
+            frame = read_member(f, fmt, **kwargs)
+            chunks = (frame.iloc[start:start + chunk_rows] for start in range(0, len(frame), chunk_rows))
+        for chunk in chunks:
+            yield chunk.assign(**{member_column: name}) if member_column else chunk
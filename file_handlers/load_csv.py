@@ -1,14 +1,20 @@
 import pandas as pd
 
-def load_csv(path: str, **kwargs) -> pd.DataFrame:
+from .optimize_dtypes import read_optimized
+
+def load_csv(path: str, optimize: bool = False, **kwargs) -> pd.DataFrame:
     """
     Load a CSV file into a DataFrame.
     
     Parameters:
     - path: str | Path to the CSV file
+    - optimize: bool | Infer compact dtypes from a sample first (categoricals,
+      Arrow strings, downcast ints); see optimize_dtypes.read_optimized for its options
     - kwargs: extra params passed to pd.read_csv
     
     Returns:
     - pd.DataFrame
     """
-    return pd.read_csv(path, **kwargs)
\ No newline at end of file
+    if optimize:
+        return read_optimized(pd.read_csv, path, **kwargs)
+    return pd.read_csv(path, **kwargs)
@@ -1,14 +1,21 @@
 import pandas as pd
 
-def load_json(path: str, **kwargs) -> pd.DataFrame:
+from .optimize_dtypes import optimize_frame
+
+def load_json(path: str, optimize: bool = False, return_report: bool = False, **kwargs) -> pd.DataFrame:
     """
     Load a JSON file into a DataFrame.
     
     Parameters:
     - path: str | Path to JSON file
+    - optimize: bool | Convert to compact dtypes after parsing (JSON cannot be
+      sampled cheaply, so the saving is in the frame kept, not the parse peak)
+    - return_report: bool | With optimize, also return the memory report (see optimize_dtypes)
     - kwargs: extra params passed to pd.read_json
     
     Returns:
     - pd.DataFrame
     """
-    return pd.read_json(path, **kwargs)
\ No newline at end of file
+    if optimize:
+        return optimize_frame(pd.read_json(path, **kwargs), source=path, return_report=return_report)
+    return pd.read_json(path, **kwargs)
@@ -1,14 +1,30 @@
 import pandas as pd
 
-def load_parquet(path: str, **kwargs) -> pd.DataFrame:
+from .parquet_metadata import parquet_date_filters
+
+def load_parquet(path: str, as_arrow: bool = False, columns: list = None, date_column: str = None,
+                 date_range: tuple = None, **kwargs) -> pd.DataFrame:
     """
     Load a Parquet file into a DataFrame.
-    
+
     Parameters:
     - path: str | Path to Parquet file
-    - kwargs: extra params passed to pd.read_parquet
-    
+    - as_arrow: bool | Return the pyarrow.Table without converting to pandas
+      (for ArrowDataQualityChecker)
+    - columns: list | Only read these columns (see arrow_checker.columns_for_checks)
+    - date_column: str | Column date_range applies to
+    - date_range: tuple | (start, end) inclusive; row groups outside it are pruned
+      from their footer statistics and the remaining rows filtered
+    - kwargs: extra params passed to pd.read_parquet, or pyarrow.parquet.read_table with as_arrow
+
     Returns:
-    - pd.DataFrame
+    - pd.DataFrame | pyarrow.Table when as_arrow=True
     """
-    return pd.read_parquet(path, **kwargs)
+    if date_range is not None:
+        if not date_column:
+            raise ValueError("date_range needs date_column")
+        kwargs['filters'] = parquet_date_filters(date_column, date_range, kwargs.get('filters'))
+    if as_arrow:
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=columns, **kwargs)
+    return pd.read_parquet(path, columns=columns, **kwargs)
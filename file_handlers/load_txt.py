@@ -1,14 +1,19 @@
 import pandas as pd
 
-def load_txt(path: str, delimiter: str = '\t', **kwargs) -> pd.DataFrame:
+from .optimize_dtypes import read_optimized
+
+def load_txt(path: str, delimiter: str = '\t', optimize: bool = False, **kwargs) -> pd.DataFrame:
     """
     Load a delimited text file into a DataFrame.
     
     Parameters:
     - path: str | Path to the text file
     - delimiter: str | Field delimiter, default tab
+    - optimize: bool | Infer compact dtypes from a sample first, see load_csv
     
     Returns:
     - pd.DataFrame
     """
+    if optimize:
+        return read_optimized(pd.read_csv, path, delimiter=delimiter, **kwargs)
     return pd.read_csv(path, delimiter=delimiter, **kwargs)
@@ -0,0 +1,129 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    ARROW_STRING_DTYPE = None
+
+_logger = logging.getLogger("data_quality_logger")
+
+
+def infer_compact_dtypes(sample: pd.DataFrame, category_ratio: float = 0.5, max_categories: int = 10_000,
+                         arrow_strings: bool = True) -> dict:
+    """
+    Pick parse-time dtypes for the string columns of a sample.
+
+    Parameters:
+    - sample: pd.DataFrame | Rows parsed with the default dtypes
+    - category_ratio: float | Use 'category' when distinct / non-null values is at most this
+    - max_categories: int | ... and there are at most this many distinct values
+    - arrow_strings: bool | Use Arrow-backed strings for the other string columns (needs pyarrow)
+
+    Returns:
+    - dict | column -> dtype, only for columns that should change
+    """
+    dtypes = {}
+    for col in sample.columns:
+        values = sample[col]
+        if values.dtype != object:
+            continue
+        non_null = values.dropna()
+        if len(non_null) and pd.api.types.infer_dtype(non_null, skipna=True) != "string":
+            continue  # mixed or non-string objects keep their Python values
+        distinct = non_null.nunique()
+        if distinct <= max_categories and distinct <= category_ratio * max(len(non_null), 1):
+            dtypes[col] = "category"
+        elif arrow_strings and ARROW_STRING_DTYPE:
+            dtypes[col] = ARROW_STRING_DTYPE
+    return dtypes
+
+
+def downcast_numeric(df: pd.DataFrame, floats: bool = False) -> pd.DataFrame:
+    """
+    Shrink integer columns to the smallest dtype holding their actual range
+    (and float64 to float32 when floats=True, which loses precision).
+    """
+    for col in df.columns:
+        dtype = df[col].dtype
+        if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        elif floats and dtype == np.float64:
+            df[col] = pd.to_numeric(df[col], downcast="float")
+    return df
+
+
+def memory_report(default_sample: pd.DataFrame, optimized: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-column memory of the optimized frame against an estimate of the default
+    load (the default-dtype sample scaled to the full row count).
+    """
+    scale = len(optimized) / max(len(default_sample), 1)
+    before = default_sample.memory_usage(index=False, deep=True) * scale
+    after = optimized.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        'column': optimized.columns,
+        'default_dtype': [str(default_sample[c].dtype) if c in default_sample else None for c in optimized.columns],
+        'optimized_dtype': [str(dtype) for dtype in optimized.dtypes],
+        'estimated_default_mb': before.reindex(optimized.columns).to_numpy() / 1024 ** 2,
+        'optimized_mb': after.reindex(optimized.columns).to_numpy() / 1024 ** 2
+    })
+    report['saved_mb'] = report['estimated_default_mb'] - report['optimized_mb']
+    return report
+
+
+def _finish(df, sample, source, return_report):
+    # The report is returned rather than kept in df.attrs, which pandas copies into every derived frame
+    report = memory_report(sample, df)
+    before, after = report['estimated_default_mb'].sum(), report['optimized_mb'].sum()
+    _logger.info(f"Optimized load of {source}: {after:.1f} MB instead of ~{before:.1f} MB "
+                 f"({before / after if after else float('inf'):.1f}x smaller)")
+    return (df, report) if return_report else df
+
+
+def read_optimized(reader, path, sample_rows: int = 10_000, category_ratio: float = 0.5,
+                   max_categories: int = 10_000, arrow_strings: bool = True, downcast_floats: bool = False,
+                   return_report: bool = False, **kwargs) -> pd.DataFrame:
+    """
+    Two-pass load: infer compact dtypes from the first sample_rows rows, then
+    parse the whole file with them and downcast the numeric columns.
+
+    Parameters:
+    - reader: callable | pd.read_csv-like function accepting nrows and dtype
+    - path: str | File to read
+    - sample_rows: int | Rows parsed with default dtypes for the inference pass
+    - category_ratio, max_categories, arrow_strings: see infer_compact_dtypes
+    - downcast_floats: bool | Also store floats as float32
+    - return_report: bool | Also return the memory_report
+    - kwargs: extra params passed to reader; an explicit dtype wins over inferred ones
+
+    Returns:
+    - pd.DataFrame | (pd.DataFrame, pd.DataFrame) with the memory report when return_report=True
+    """
+    if kwargs.get('chunksize') or kwargs.get('iterator'):
+        raise ValueError("optimize cannot be combined with chunksize/iterator")
+    sample = reader(path, nrows=sample_rows, **kwargs)
+    dtypes = infer_compact_dtypes(sample, category_ratio, max_categories, arrow_strings)
+    user_dtypes = kwargs.pop('dtype', None)
+    if isinstance(user_dtypes, dict):
+        dtypes.update(user_dtypes)
+    elif user_dtypes is not None:
+        dtypes = user_dtypes
+    df = downcast_numeric(reader(path, dtype=dtypes, **kwargs), downcast_floats)
+    return _finish(df, sample, path, return_report)
+
+
+def optimize_frame(df: pd.DataFrame, sample_rows: int = 10_000, category_ratio: float = 0.5,
+                   max_categories: int = 10_000, arrow_strings: bool = True, downcast_floats: bool = False,
+                   source: str = "frame", return_report: bool = False) -> pd.DataFrame:
+    """
+    Convert an already parsed frame to compact dtypes (for formats whose
+    readers cannot take a sample first, such as JSON); see read_optimized.
+    """
+    sample = df.head(sample_rows)
+    dtypes = infer_compact_dtypes(sample, category_ratio, max_categories, arrow_strings)
+    optimized = downcast_numeric(df.astype(dtypes) if dtypes else df.copy(), downcast_floats)
+    return _finish(optimized, sample, source, return_report)
@@ -0,0 +1,90 @@
+import pandas as pd
+
+
+def _parquet_file(path):
+    import pyarrow.parquet as pq
+    return pq.ParquetFile(path)
+
+
+def parquet_row_count(path: str) -> int:
+    """Row count from the Parquet footer, without reading any data page."""
+    return _parquet_file(path).metadata.num_rows
+
+
+def parquet_null_counts(path: str, columns: list = None, scan_missing: bool = True,
+                        scan_floats: bool = False) -> pd.DataFrame:
+    """
+    Null counts per column from the row-group statistics in the Parquet footer.
+
+    Parameters:
+    - path: str | Parquet file
+    - columns: list | Top-level columns to report, defaults to all
+    - scan_missing: bool | Read the columns whose row groups lack a null count
+      (nested columns, writers that skip statistics); when False they are NaN
+    - scan_floats: bool | Also read float columns, since Parquet statistics do not
+      count NaN values that pandas would report as missing
+
+    Returns:
+    - pd.DataFrame | column, null_count, null_percentage (same layout as the
+      'nulls' check) plus source: 'statistics' or 'scan'
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    parquet = _parquet_file(path)
+    metadata = parquet.metadata
+    schema = parquet.schema_arrow
+    columns = list(schema.names) if columns is None else list(columns)
+    total_rows = metadata.num_rows
+
+    # Leaf columns of flat schemas are named after their top-level column
+    leaf = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+    counts, sources, to_scan = {}, {}, []
+    for col in columns:
+        index = leaf.get(col)
+        null_count = 0 if index is not None else None
+        for rg in range(metadata.num_row_groups if index is not None else 0):
+            statistics = metadata.row_group(rg).column(index).statistics
+            if statistics is None or not statistics.has_null_count:
+                null_count = None
+                break
+            null_count += statistics.null_count
+        if null_count is None or (scan_floats and pa.types.is_floating(schema.field(col).type)):
+            to_scan.append(col)
+        else:
+            counts[col], sources[col] = null_count, 'statistics'
+
+    if scan_missing and to_scan:
+        table = parquet.read(columns=to_scan)
+        for col in to_scan:
+            counts[col] = pc.sum(pc.is_null(table.column(col), nan_is_null=True)).as_py() or 0
+            sources[col] = 'scan'
+
+    nulls = pd.DataFrame({
+        'column': columns,
+        'null_count': [counts.get(col) for col in columns],
+        'source': [sources.get(col) for col in columns]
+    })
+    nulls['null_percentage'] = (nulls['null_count'] / total_rows) * 100 if total_rows else float('nan')
+    return nulls[['column', 'null_count', 'null_percentage', 'source']]
+
+
+def parquet_date_filters(date_column: str, date_range: tuple, filters: list = None) -> list:
+    """
+    Row filter for a (start, end) date range, inclusive; either bound may be None.
+
+    Passed as `filters` to pyarrow, row groups whose min/max statistics fall
+    outside the range are skipped without being read. Bounds must compare
+    with the column's own type (e.g. ISO strings for a string date column).
+    Existing list-of-tuples or list-of-lists (OR of ANDs) filters are combined
+    with the range.
+    """
+    start, end = date_range
+    conditions = []
+    if start is not None:
+        conditions.append((date_column, '>=', start))
+    if end is not None:
+        conditions.append((date_column, '<=', end))
+    if filters and isinstance(filters[0], list):
+        return [list(conjunction) + conditions for conjunction in filters]
+    return list(filters or []) + conditions
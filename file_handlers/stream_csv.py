@@ -0,0 +1,173 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+CSV_STREAM_ENGINES = ("auto", "pyarrow", "pandas")
+# pandas read_csv options the pyarrow engine understands; any other option uses pandas
+ARROW_STREAM_KWARGS = ("usecols", "encoding")
+ARROW_ENCODINGS = (None, "utf-8", "utf8", "UTF-8")
+
+# Same strings pandas.read_csv reads as missing, so both engines agree on nulls
+try:
+    from pandas._libs.parsers import STR_NA_VALUES as _NA_VALUES
+except ImportError:
+    _NA_VALUES = {'', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                  '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'}
+
+
+def stream_csv(path: str, chunk_rows: int = 100_000, delimiter: str = ',', engine: str = "auto",
+               workers: int = None, prefetch: int = None, block_size: int = 8 * 1024 ** 2, **kwargs):
+    """
+    Read a delimited file as an iterator of DataFrame chunks.
+
+    Parameters:
+    - path: str | CSV/TXT file; .gz/.bz2/.zst files are decompressed on the fly
+      by the pyarrow engine
+    - chunk_rows: int | Rows per chunk (the last one may be shorter)
+    - delimiter: str | Field delimiter (sep is accepted too)
+    - engine: str | 'pyarrow' (parallel parsing), 'pandas' (read_csv chunksize)
+      or 'auto' (pyarrow when installed and the kwargs allow it)
+    - workers: int | Parser threads, defaults to the CPU count
+    - prefetch: int | Blocks parsed ahead of the consumer, defaults to 2 x workers;
+      bounds memory at about prefetch x block_size
+    - block_size: int | Bytes of the file handed to one parse task
+    - kwargs: extra params passed to pd.read_csv; with pyarrow only usecols and
+      encoding (UTF-8) are supported
+
+    Returns:
+    - iterator of pd.DataFrame | Index continues across chunks like read_csv(chunksize=...)
+
+    The pyarrow engine cuts the file into blocks at line ends and parses them
+    on a thread pool while the previous chunks are being checked, so parsing
+    overlaps with the caller's work. Each block infers its own types, as
+    each read_csv chunk does. Blocks are only cut at line ends outside
+    double-quoted values, so quoted values may span several lines.
+    """
+    if 'sep' in kwargs:
+        # read_csv's other name for the delimiter
+        delimiter = kwargs.pop('sep')
+    if engine not in CSV_STREAM_ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}")
+    if chunk_rows is None or chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive number of rows")
+    arrow_ok = (pacsv is not None and set(kwargs) <= set(ARROW_STREAM_KWARGS)
+                and kwargs.get('encoding') in ARROW_ENCODINGS)
+    if engine == "pyarrow" and not arrow_ok:
+        raise ValueError("The pyarrow engine needs pyarrow and only supports the usecols and encoding (UTF-8) options")
+    if engine == "pandas" or not arrow_ok:
+        return _stream_pandas(path, chunk_rows, delimiter, **kwargs)
+    return _stream_arrow(path, chunk_rows, delimiter, workers or os.cpu_count() or 1, prefetch, block_size,
+                         kwargs.get('usecols'))
+
+
+def _stream_pandas(path, chunk_rows, delimiter, **kwargs):
+    with pd.read_csv(path, sep=delimiter, chunksize=chunk_rows, **kwargs) as reader:
+        yield from reader
+
+
+def _blocks(path, block_size):
+    # Whole records only: every block ends at a newline outside quotes
+    with pa.input_stream(path) as stream:
+        tail = b''
+        while True:
+            data = stream.read(block_size)
+            if not data:
+                break
+            data = tail + data
+            cut = _record_end(data)
+            tail = data[cut:]
+            if cut:
+                yield data[:cut]
+        if tail.strip():
+            yield tail
+
+
+def _record_end(data: bytes) -> int:
+    """Offset just past the last newline of data that is not inside a quoted value, 0 if none."""
+    cut = data.rfind(b'\n') + 1
+    if not cut or data.count(b'"', 0, cut) % 2 == 0:
+        return cut
+    # Escaped quotes are doubled, so a newline is outside quotes when an even
+    # number of quote characters precede it
+    chars = np.frombuffer(data, dtype=np.uint8)
+    in_quotes = np.bitwise_xor.accumulate(chars == ord('"'))
+    ends = np.flatnonzero((chars == ord('\n')) & ~in_quotes)
+    return int(ends[-1]) + 1 if len(ends) else 0
+
+
+def _parse_block(block, delimiter, column_names, usecols, text_columns=()):
+    table = _read_block(block, delimiter, column_names, usecols, text_columns)
+    # Keep date-like strings as text, as read_csv does without parse_dates
+    temporal = [field.name for field in table.schema
+                if pa.types.is_temporal(field.type) and field.name not in text_columns]
+    if temporal:
+        table = _read_block(block, delimiter, column_names, usecols, tuple(text_columns) + tuple(temporal))
+    # All-null columns come out as float NaN in pandas
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table.to_pandas(), temporal
+
+
+def _read_block(block, delimiter, column_names, usecols, text_columns):
+    read_options = pacsv.ReadOptions(column_names=column_names, use_threads=False)
+    convert_options = pacsv.ConvertOptions(
+        null_values=list(_NA_VALUES), strings_can_be_null=True,
+        include_columns=list(usecols) if usecols is not None else None,
+        column_types={col: pa.string() for col in text_columns})
+    return pacsv.read_csv(pa.py_buffer(block), read_options=read_options,
+                          parse_options=pacsv.ParseOptions(delimiter=delimiter), convert_options=convert_options)
+
+
+def _stream_arrow(path, chunk_rows, delimiter, workers, prefetch, block_size, usecols):
+    prefetch = prefetch or 2 * workers
+    blocks = _blocks(path, block_size)
+    header = next(blocks, None)
+    if header is None:
+        return
+    # The first block carries the header; later blocks reuse its column names
+    # and read the columns it found date-like as text straight away
+    first, text_columns = _parse_block(header, delimiter, None, usecols)
+    column_names = pacsv.read_csv(pa.py_buffer(header.split(b'\n', 1)[0] + b'\n'),
+                                  parse_options=pacsv.ParseOptions(delimiter=delimiter)).column_names
+
+    buffered, buffered_rows, offset = ([first] if len(first) else []), len(first), 0
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dq_csv") as pool:
+        try:
+            while True:
+                while len(pending) < prefetch:
+                    block = next(blocks, None)
+                    if block is None:
+                        break
+                    pending.append(pool.submit(_parse_block, block, delimiter, column_names, usecols,
+                                               tuple(text_columns)))
+                if buffered_rows >= chunk_rows or (not pending and buffered_rows):
+                    frame = pd.concat(buffered, ignore_index=True) if len(buffered) > 1 else buffered[0]
+                    full = len(frame) - len(frame) % chunk_rows if pending else len(frame)
+                    for start in range(0, full, chunk_rows):
+                        chunk = frame.iloc[start:start + chunk_rows]
+                        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                        yield chunk
+                        offset += len(chunk)
+                    buffered = [frame.iloc[full:]] if full < len(frame) else []
+                    buffered_rows = len(frame) - full
+                if not pending:
+                    break
+                parsed, _ = pending.popleft().result()
+                if len(parsed):
+                    # Skip empty frames, whose all-null float columns would upcast the others
+                    buffered.append(parsed)
+                    buffered_rows += len(parsed)
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,142 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from data_quality_checker import DataQualityChecker, DateIndex
+from duplicate_detector import hash_rows
+
+BY_DATE_CHECKS = ("outliers_by_date", "placeholder_counts_by_date", "nulls_by_date", "empty_strings_by_date")
+
+
+class IncrementalByDateChecker:
+    """
+    Re-run the by-date checks only for dates that are new or changed since the last run.
+
+    Parameters:
+    - state_dir: str | Directory holding one state file per dataset
+    - dataset: str | Name the persisted state is stored under (e.g. table name)
+    - date_column: str | Column used for the by-date breakdowns
+    - checker_kwargs: extra params passed to DataQualityChecker
+
+    Every by-date result only depends on the rows of its own date, so the
+    stored per-date frames stay valid until that date's rows change. A date is
+    considered changed when its fingerprint -- row count plus the wrapping sum
+    of the row hashes -- differs from the stored one. The state is rebuilt from
+    scratch when the columns, dtypes or checker configuration change.
+    """
+
+    def __init__(self, state_dir: str, dataset: str, date_column: str, **checker_kwargs):
+        if not date_column:
+            raise ValueError("date_column is required for incremental by-date checks")
+        self.state_dir = state_dir
+        self.dataset = dataset
+        self.date_column = date_column
+        self.checker_kwargs = checker_kwargs
+        self.changed_dates = []
+        self.removed_dates = []
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.state_dir, f"{self.dataset}.bydate.pkl")
+
+    def run(self, df: pd.DataFrame) -> dict:
+        """
+        Bring the stored by-date results up to date with df and return them.
+
+        Returns:
+        - dict | outliers_by_date, placeholder_counts_by_date, nulls_by_date and
+          empty_strings_by_date over every date in df
+        """
+        checker = DataQualityChecker(df, date_column=self.date_column, copy=False, **self.checker_kwargs)
+        date_index = checker._date_index()
+        fingerprints = self._fingerprints(df, date_index)
+
+        schema = self._schema(df, checker)
+        state = self._load()
+        if state is None or state['schema'] != schema:
+            state = {'schema': schema, 'fingerprints': {}, 'results': {key: pd.DataFrame() for key in BY_DATE_CHECKS}}
+
+        stored = state['fingerprints']
+        changed = np.array([stored.get(date) != fp for date, fp in zip(date_index.dates, fingerprints)], dtype=bool)
+        self.changed_dates = list(date_index.dates[changed])
+        self.removed_dates = sorted(set(stored) - set(date_index.dates))
+
+        fresh = self._check_dates(checker, date_index, changed) if changed.any() else {}
+        stale = set(self.changed_dates) | set(self.removed_dates)
+        results = {key: self._merge(state['results'][key], fresh.get(key), stale, list(df.columns), key)
+                   for key in BY_DATE_CHECKS}
+
+        state['fingerprints'] = dict(zip(date_index.dates, fingerprints))
+        state['results'] = results
+        self._save(state)
+        return results
+
+    def reset(self):
+        """Forget the stored state so the next run recomputes every date."""
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+    def _schema(self, df, checker):
+        config = checker.config()
+        config.pop('date_format', None)
+        return [(col, str(dtype)) for col, dtype in df.dtypes.items()], sorted(config.items(), key=lambda kv: kv[0])
+
+    @staticmethod
+    def _fingerprints(df, date_index):
+        n_dates = len(date_index.dates)
+        valid = date_index.row_codes >= 0
+        codes = date_index.row_codes[valid]
+        hash_sums = np.zeros(n_dates, dtype=np.uint64)
+        np.add.at(hash_sums, codes, hash_rows(df)[valid])
+        counts = np.bincount(codes, minlength=n_dates)
+        return [(int(n), int(h)) for n, h in zip(counts, hash_sums)]
+
+    def _check_dates(self, checker, date_index, changed):
+        # Restrict the parent's date index to the changed dates instead of
+        # re-parsing the date column of the subset
+        rows = changed[date_index.row_codes] & (date_index.row_codes >= 0)
+        remap = np.cumsum(changed) - 1
+        subset = checker.df[rows].reset_index(drop=True)
+        sub_index = DateIndex(remap[date_index.row_codes[rows]], date_index.dates[changed],
+                              date_index.totals[changed])
+
+        kwargs = dict(self.checker_kwargs, date_format=checker.date_format)
+        sub = DataQualityChecker(subset, date_column=self.date_column, copy=False, **kwargs)
+        sub._date_index_cache = sub_index
+        return sub._run_checks(BY_DATE_CHECKS)
+
+    @staticmethod
+    def _merge(stored, fresh, stale, columns, key):
+        frames = []
+        if not stored.empty:
+            frames.append(stored[~stored['date_only'].isin(stale)])
+        if fresh is not None and not fresh.empty:
+            frames.append(fresh)
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return fresh if fresh is not None else stored.iloc[:0]
+
+        merged = pd.concat(frames, ignore_index=True)
+        if key == "outliers_by_date":
+            # Same order as a full run: column by column, dates ascending
+            position = merged['column'].map({col: i for i, col in enumerate(columns)})
+            merged = merged.assign(_order=position).sort_values(['_order', 'date_only'], kind='stable')
+            merged = merged.drop(columns='_order')
+        else:
+            merged = merged.sort_values(['date_only', 'column'], kind='stable')
+        return merged.reset_index(drop=True)
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return None
+        with open(self.state_path, 'rb') as f:
+            return pickle.load(f)
+
+    def _save(self, state):
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,543 @@
+import logging
+import re
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+
+from data_quality_checker import (PLACEHOLDERS, compile_placeholder_pattern, is_placeholder, is_text_dtype,
+                                  parse_dates, wide_to_long_by_date, guess_datetime_format)
+from db_handlers.stream_sql import resolve_engine
+from duplicate_detector import DuplicateReport
+from utils.instrumentation import Instrumentation
+
+# Checks the SQL backend implements, in the same order as the built-in registry
+SQL_CHECKS = ("column_summary", "nulls", "outliers", "duplicates", "mixed_types", "outliers_by_date",
+              "placeholder_counts", "placeholder_counts_by_date", "nulls_by_date", "empty_strings_by_date")
+BY_DATE_CHECKS = ("outliers_by_date", "placeholder_counts_by_date", "nulls_by_date", "empty_strings_by_date")
+
+_REGEX_SYNTAX = set(".^$*+{}[]()|")
+_KEY = "dq_key"
+# Width of the strftime directives a day can be cut out of text by position
+_FIXED_WIDTH_DIRECTIVES = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2, 'y': 2, 'p': 2}
+_DIRECTIVE = re.compile(r"%(.)|([^%])")
+
+_logger = logging.getLogger("data_quality_logger")
+
+
+def placeholder_literals(placeholders: list = None) -> list:
+    """
+    Expand placeholder regex fragments into the lower-case strings they match,
+    so the placeholder check can run as an IN list in SQL.
+
+    Only literal text, escaped characters and optional characters (`x?`) can be
+    expanded, which covers PLACEHOLDERS.
+
+    Returns:
+    - list | Matching strings, or None when a fragment uses other regex syntax
+    """
+    literals = []
+    for fragment in PLACEHOLDERS if placeholders is None else placeholders:
+        expanded = _expand_fragment(fragment)
+        if expanded is None:
+            return None
+        literals.extend(value.lower() for value in expanded)
+    return sorted(set(literals))
+
+
+def _expand_fragment(fragment):
+    alternatives, i = [''], 0
+    while i < len(fragment):
+        char = fragment[i]
+        if char == '\\':
+            # Escaped punctuation is literal; \d, \s and friends are classes
+            if i + 1 >= len(fragment) or fragment[i + 1].isalnum():
+                return None
+            atom, i = fragment[i + 1], i + 2
+        elif char in _REGEX_SYNTAX or char == '?':
+            return None
+        else:
+            atom, i = char, i + 1
+        if i < len(fragment) and fragment[i] == '?':
+            alternatives = [prefix + tail for prefix in alternatives for tail in ('', atom)]
+            i += 1
+        else:
+            alternatives = [prefix + atom for prefix in alternatives]
+    return alternatives
+
+
+def day_positions(date_format: str):
+    """
+    1-based (start, length) of the year, month and day in text written with
+    date_format, plus a LIKE pattern such text matches; None unless every
+    directive up to the last of them has a fixed width (e.g. '%d/%m/%Y %H:%M:%S').
+    """
+    positions, pattern, offset = {}, [], 0
+    for directive, literal in _DIRECTIVE.findall(date_format or ''):
+        if literal:
+            pattern.append(literal.replace('_', '\\_'))
+            offset += 1
+            continue
+        width = _FIXED_WIDTH_DIRECTIVES.get(directive)
+        if width is None:
+            if len(positions) == 3:
+                # Whatever follows the date only needs to be there
+                pattern.append('%')
+                break
+            return None
+        if directive in 'Ymd':
+            positions[directive] = (offset + 1, width)
+        pattern.append('_' * width)
+        offset += width
+    if len(positions) != 3:
+        return None
+    return positions, ''.join(pattern)
+
+
+def _declared_kind(sql_type):
+    # 'numeric', 'text' or None from the Python type a SQL column type maps to
+    try:
+        python_type = sql_type.python_type
+    except NotImplementedError:
+        return None
+    if python_type in (int, float, Decimal):
+        return 'numeric'
+    return 'text' if python_type is str else None
+
+
+class SQLDataQualityChecker:
+    """
+    DataQualityChecker backend that pushes the checks down into the database.
+
+    Parameters:
+    - engine: sqlalchemy.Engine | str | Engine or database URL
+    - table: str | Table to check
+    - query: str | Query to check instead of a table
+    - schema: str | Database schema of table (optional)
+    - date_column: str | Column used for the by-date breakdowns (optional)
+    - placeholders: list | Regex fragments, defaults to PLACEHOLDERS
+    - date_format: str | strftime format of date_column, inferred when None
+    - duplicate_subset: list | Key columns for the duplicate check
+    - sample_rows: int | Rows read to infer column types and sample values
+    - instrumentation: Instrumentation | Records every stage (optional)
+
+    Every check is compiled with SQLAlchemy Core into aggregate queries, so only
+    counts come back: null, empty-string and placeholder sums in one scan,
+    COUNT(DISTINCT) per column, a GROUP BY over the duplicate key, and one
+    GROUP BY over the date for all by-date counts. IQR bounds come from
+    ROW_NUMBER/COUNT window functions (SQLite 3.25+, PostgreSQL, SQL Server,
+    MySQL 8): the two ranks around each quartile are interpolated like
+    Series.quantile, and the rows outside the bounds are counted in the same
+    query. Results have the same keys and layout as DataQualityChecker.run_all_checks.
+
+    Differences from the pandas checker:
+    - Column types (numeric or text) and sample_values come from the first
+      sample_rows rows, read with pandas like the full load would be.
+    - Only SQL NULL counts as missing, and empty strings and placeholders are
+      trimmed of spaces only.
+    - Placeholders are matched with lower(trim(value)) IN (...) when the
+      fragments expand to literals (see placeholder_literals); other patterns
+      are matched in Python against each column's distinct values.
+    - Dates are bucketed in SQL for date/time columns, ISO (%Y-%m-%d...) text
+      and fixed-width formats such as '%d/%m/%Y %H:%M:%S' (see day_positions);
+      other text formats are grouped by value and parsed in Python, and
+      outliers_by_date is skipped with a warning when such a column holds
+      several values per day.
+    - A database column holds one type, so mixed_types is always empty.
+    - Row views (null_rows, ...) and duplicate_groups are empty, since no rows
+      are fetched; load the rows with load_data for those.
+    """
+
+    def __init__(self, engine, table: str = None, query: str = None, schema: str = None, date_column: str = None,
+                 placeholders: list = None, date_format: str = None, duplicate_subset: list = None,
+                 sample_rows: int = 1000, instrumentation: Instrumentation = None):
+        if not table and not query:
+            raise ValueError("A query or a table is required")
+        self.engine = resolve_engine(engine)
+        self.date_column = date_column
+        self.date_format = date_format
+        self.duplicate_subset = duplicate_subset
+        self.placeholders = placeholders
+        self.placeholder_pattern = compile_placeholder_pattern(placeholders)
+        self.placeholder_literals = placeholder_literals(placeholders)
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        if table:
+            self.source = sa.Table(table, sa.MetaData(), schema=schema, autoload_with=self.engine)
+        else:
+            self.source = self._query_source(query)
+        self.columns = [column.name for column in self.source.columns]
+        missing = [col for col in [date_column] + list(duplicate_subset or []) if col and col not in self.columns]
+        if missing:
+            raise ValueError(f"Columns not in the source: {missing}")
+
+        self.sample = pd.read_sql_query(sa.select(self.source).limit(sample_rows), self.engine)
+        self.numeric_columns, self.text_columns = self._classify()
+        self._totals_cache = None
+        self._by_date_cache = None
+        self._date_key_cache = None
+
+    def _query_source(self, query):
+        # Column names from a query that returns no rows, then the query as a subquery
+        query = query.strip().rstrip(';')
+        with self.engine.connect() as conn:
+            names = list(conn.execute(sa.text(f"SELECT * FROM ({query}) dq_probe WHERE 1 = 0")).keys())
+        return sa.text(query).columns(*[sa.column(name) for name in names]).subquery("dq_source")
+
+    def _classify(self):
+        # pandas dtypes of the sample, as the pandas checker would see them; columns
+        # that are all null in the sample fall back to their declared SQL type
+        numeric, text = [], []
+        self.dtypes = self.sample.dtypes.to_dict()
+        for col in self.columns:
+            dtype = self.sample[col].dtype
+            if self.sample[col].isna().all():
+                kind = _declared_kind(self.source.c[col].type)
+                if kind == 'numeric':
+                    numeric.append(col)
+                    self.dtypes[col] = np.dtype('float64')  # all-null numbers load as NaN
+                elif kind == 'text':
+                    text.append(col)
+            elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                numeric.append(col)
+            elif is_text_dtype(dtype):
+                text.append(col)
+        return numeric, text
+
+    def run_all_checks(self, only: list = None):
+        """
+        Run the checks in the database and collect the results.
+
+        Parameters:
+        - only: list | Names of the checks to run (from SQL_CHECKS), defaults to all of them
+
+        Returns:
+        - dict | Same layout as DataQualityChecker.run_all_checks
+        """
+        if only is not None:
+            unknown = [name for name in only if name not in SQL_CHECKS]
+            if unknown:
+                raise ValueError(f"Checks not supported by the SQL backend: {unknown}")
+        names = [name for name in SQL_CHECKS if only is None or name in only]
+
+        results = {}
+        for name in names:
+            if name in BY_DATE_CHECKS and not self.date_column:
+                results[name] = pd.DataFrame()
+                continue
+            with self.instrumentation.stage(name) as record:
+                results[name] = getattr(self, f"_{name}")()
+                record['rows'] = self.totals()['rows']
+
+        results["null_rows"] = {}
+        results["outlier_rows"] = {}
+        results["placeholder_rows"] = {}
+        if "duplicates" in names:
+            results["duplicate_groups"] = self.duplicate_report.groups
+        results["metrics"] = self.instrumentation.metrics
+        return results
+
+    # Expressions
+
+    def _text(self, col):
+        return sa.func.trim(sa.cast(self.source.c[col], sa.String))
+
+    def _empty_expr(self, col):
+        return self._text(col) == ''
+
+    def _placeholder_expr(self, col):
+        # None when the placeholders are matched in Python instead
+        if self.placeholder_literals is None:
+            return None
+        return sa.func.lower(self._text(col)).in_(self.placeholder_literals)
+
+    @staticmethod
+    def _sum(condition):
+        return sa.func.sum(sa.case((condition, 1), else_=0))
+
+    def _date_key(self):
+        """(SQL expression grouping rows by date, whether it already is one value per day)."""
+        if self._date_key_cache is None:
+            col = self.source.c[self.date_column]
+            sample = self.sample[self.date_column].dropna()
+            if self.date_format is None and len(sample) and isinstance(sample.iloc[0], str):
+                self.date_format = guess_datetime_format(sample.iloc[0])
+            is_temporal = pd.api.types.is_datetime64_any_dtype(sample.dtype) or isinstance(
+                self.source.c[self.date_column].type, (sa.Date, sa.DateTime))
+            positions = day_positions(self.date_format)
+            if is_temporal or (self.date_format or '').startswith('%Y-%m-%d'):
+                day = sa.func.date(col) if self.engine.dialect.name == 'sqlite' else sa.cast(col, sa.Date)
+                self._date_key_cache = (day, True)
+            elif positions is not None:
+                self._date_key_cache = (self._text_day(col, *positions), True)
+            else:
+                self._date_key_cache = (col, False)
+        return self._date_key_cache
+
+    def _text_day(self, col, positions, pattern):
+        # ISO 'YYYY-MM-DD' cut out of fixed-width date text, e.g. '%d/%m/%Y %H:%M:%S';
+        # text that does not fit the format gets no day, as it parses to NaT
+        substring = sa.func.substr if self.engine.dialect.name == 'sqlite' else sa.func.substring
+        text = sa.cast(col, sa.String)
+        year, month, day = (substring(text, *positions[part]) for part in 'Ymd')
+        return sa.case((text.like(pattern, escape='\\'), year.concat('-').concat(month).concat('-').concat(day)))
+
+    def _key_days(self, keys):
+        # Calendar day of every date key, parsed like the pandas checker parses the column
+        key, is_day = self._date_key()
+        values = pd.Series(list(keys), dtype=object)
+        parsed, fmt = parse_dates(values, None if is_day else self.date_format)
+        if not is_day:
+            self.date_format = fmt
+        if getattr(parsed.dt, 'tz', None) is not None:
+            parsed = parsed.dt.tz_localize(None)
+        return parsed.dt.floor('D').dt.date
+
+    # Aggregates shared by the checks
+
+    def totals(self) -> dict:
+        """Row count and per-column null, empty-string and placeholder counts from one scan."""
+        if self._totals_cache is None:
+            self._totals_cache = self._aggregate()
+        return self._totals_cache
+
+    def _aggregate(self, key=None):
+        # One SELECT of sums; labels are positional so user column names cannot clash
+        text_cols = self.text_columns
+        placeholder_cols = [col for col in text_cols if self._placeholder_expr(col) is not None]
+        selected = [sa.func.count().label("rows")]
+        selected += [self._sum(self.source.c[col].is_(None)).label(f"n{i}") for i, col in enumerate(self.columns)]
+        selected += [self._sum(self._empty_expr(col)).label(f"e{i}") for i, col in enumerate(text_cols)]
+        selected += [self._sum(self._placeholder_expr(col)).label(f"p{i}") for i, col in enumerate(placeholder_cols)]
+        if key is not None:
+            query = sa.select(key.label(_KEY), *selected).group_by(key)
+        else:
+            query = sa.select(*selected)
+        with self.engine.connect() as conn:
+            frame = pd.DataFrame(conn.execute(query.select_from(self.source)).mappings().all(),
+                                 columns=([_KEY] if key is not None else []) + [c.name for c in selected])
+        sums = [c.name for c in selected]
+        frame[sums] = frame[sums].apply(pd.to_numeric).fillna(0)
+
+        def counts(prefix, cols):
+            return pd.DataFrame({col: frame[f"{prefix}{i}"].astype('int64') for i, col in enumerate(cols)},
+                                columns=cols, index=frame.index)
+
+        placeholders = counts("p", placeholder_cols)
+        for col in text_cols:
+            if col not in placeholders:
+                placeholders[col] = self._match_counts(col, key, frame[_KEY] if key is not None else None)
+        aggregates = {
+            "rows": frame["rows"].astype('int64'),
+            "nulls": counts("n", self.columns),
+            "empty": counts("e", text_cols),
+            "placeholders": placeholders[text_cols] if text_cols else placeholders
+        }
+        if key is not None:
+            aggregates["keys"] = frame[_KEY]
+            return aggregates
+        return {"rows": int(aggregates["rows"].iloc[0]),
+                **{name: aggregates[name].iloc[0] for name in ("nulls", "empty", "placeholders")}}
+
+    def _match_counts(self, col, key=None, keys=None):
+        # Placeholder counts for patterns SQL cannot express: the predicate runs
+        # once per distinct value, as encoded_match does in the pandas checker
+        value = self.source.c[col]
+        grouping = ([key.label(_KEY)] if key is not None else []) + [value.label("value")]
+        query = sa.select(*grouping, sa.func.count().label("rows")).where(value.is_not(None)) \
+            .group_by(*([key] if key is not None else []), value).select_from(self.source)
+        with self.engine.connect() as conn:
+            frame = pd.DataFrame(conn.execute(query).mappings().all(),
+                                 columns=([_KEY] if key is not None else []) + ["value", "rows"])
+        matches = np.asarray(is_placeholder(self.placeholder_pattern)(frame["value"].astype(object)), dtype=bool)
+        matched = frame["rows"].where(matches, 0).astype('int64')
+        if key is None:
+            return int(matched.sum())
+        per_key = matched.groupby(frame[_KEY].astype(object), dropna=False).sum()
+        return keys.astype(object).map(per_key).fillna(0).astype('int64').to_numpy()
+
+    def by_date(self) -> dict:
+        """Per-day rows and null, empty-string and placeholder counts from one GROUP BY."""
+        if self._by_date_cache is None:
+            key, _ = self._date_key()
+            grouped = self._aggregate(key)
+            days = self._key_days(grouped["keys"])
+            valid = days.notna().to_numpy()
+
+            def per_day(frame):
+                return frame[valid].groupby(days[valid].to_numpy()).sum().sort_index()
+
+            rows = per_day(grouped["rows"].to_frame())["rows"]
+            self._by_date_cache = {
+                "totals": pd.Series(rows.to_numpy(), index=np.asarray(rows.index, dtype=object)),
+                **{name: per_day(grouped[name]).set_axis(np.asarray(rows.index, dtype=object), axis=0)
+                   for name in ("nulls", "empty", "placeholders")}
+            }
+        return self._by_date_cache
+
+    def _outlier_query(self, col, key=None):
+        """
+        Per group (or overall) non-null count and rows outside the IQR bounds.
+
+        The quartiles are interpolated between ranks floor((n-1)q)+1 and
+        ceil((n-1)q)+1, as the linear method of Series.quantile does.
+        """
+        value = self.source.c[col]
+        partition = [key] if key is not None else None
+        keys = [key.label(_KEY)] if key is not None else []
+        ranked = sa.select(
+            *keys, value.label("v"),
+            sa.func.row_number().over(partition_by=partition, order_by=value).label("rn"),
+            sa.func.count().over(partition_by=partition).label("n")
+        ).select_from(self.source).where(value.is_not(None))
+        if key is not None:
+            ranked = ranked.where(key.is_not(None))
+        ranked = ranked.cte("dq_ranked")
+
+        def rank(numerator, ceil):
+            return (((ranked.c.n - 1) * numerator + (3 if ceil else 0)) // 4) + 1
+
+        by_key = [ranked.c[_KEY]] if key is not None else []
+        quartiles = sa.select(*by_key, sa.func.max(ranked.c.n).label("n"), *[
+            sa.func.max(sa.case((ranked.c.rn == rank(q, ceil), sa.cast(ranked.c.v, sa.Float)))).label(name)
+            for q, ceil, name in ((1, False, "a1"), (1, True, "b1"), (3, False, "a3"), (3, True, "b3"))
+        ]).group_by(*by_key).subquery("dq_quartiles")
+
+        def interpolate(low, high, numerator):
+            fraction = sa.cast(((quartiles.c.n - 1) * numerator) % 4, sa.Float) / 4.0
+            return low + (high - low) * fraction
+
+        q1 = interpolate(quartiles.c.a1, quartiles.c.b1, 1)
+        q3 = interpolate(quartiles.c.a3, quartiles.c.b3, 3)
+        bounds = sa.select(*([quartiles.c[_KEY]] if key is not None else []),
+                           (q1 - 1.5 * (q3 - q1)).label("lower"), (q3 + 1.5 * (q3 - q1)).label("upper")) \
+            .subquery("dq_bounds")
+        on = ranked.c[_KEY] == bounds.c[_KEY] if key is not None else sa.true()
+        outside = sa.or_(ranked.c.v < bounds.c.lower, ranked.c.v > bounds.c.upper)
+        query = sa.select(*by_key, sa.func.count().label("total_count"), self._sum(outside).label("outlier_count")) \
+            .select_from(ranked.join(bounds, on)).group_by(*by_key)
+        with self.engine.connect() as conn:
+            return pd.DataFrame(conn.execute(query).mappings().all(),
+                                columns=([_KEY] if key is not None else []) + ["total_count", "outlier_count"])
+
+    # Checks
+
+    def _column_summary(self):
+        totals = self.totals()
+        total_rows = totals["rows"]
+        distinct = sa.select(*[sa.func.count(sa.distinct(self.source.c[col])).label(f"d{i}")
+                               for i, col in enumerate(self.columns)]).select_from(self.source)
+        with self.engine.connect() as conn:
+            distinct_counts = list(conn.execute(distinct).one())
+
+        summary = []
+        for col, unique_values in zip(self.columns, distinct_counts):
+            null_count = int(totals["nulls"][col])
+            dtype = self.dtypes[col]
+            if pd.api.types.is_integer_dtype(dtype) and null_count:
+                dtype = np.dtype('float64')  # as pandas stores integers with nulls
+            summary.append({
+                "column": col,
+                "dtype": str(dtype),
+                "non_null_count": total_rows - null_count,
+                "null_count": null_count,
+                "null_percentage": null_count / total_rows * 100 if total_rows else np.nan,
+                "unique_values": int(unique_values),
+                "sample_values": self.sample[col].dropna().unique()[:3].tolist()
+            })
+        return pd.DataFrame(summary)
+
+    def _nulls(self):
+        totals = self.totals()
+        counts = totals["nulls"].reindex(self.columns).to_numpy(dtype=np.int64)
+        nulls = pd.DataFrame({'column': self.columns, 'null_count': counts})
+        nulls['null_percentage'] = (nulls['null_count'] / totals["rows"]) * 100 if totals["rows"] else np.nan
+        return nulls
+
+    def _outliers(self):
+        total_rows = self.totals()["rows"]
+        outlier_data = []
+        for col in self.numeric_columns:
+            counts = self._outlier_query(col)
+            outlier_count = int(pd.to_numeric(counts["outlier_count"]).fillna(0).sum())
+            outlier_data.append({
+                'column': col,
+                'outlier_count': outlier_count,
+                'total_count': total_rows,
+                'outlier_percentage': (outlier_count / total_rows) * 100 if total_rows else np.nan
+            })
+        return pd.DataFrame(outlier_data)
+
+    def _duplicates(self):
+        keys = [self.source.c[col] for col in (self.duplicate_subset or self.columns)]
+        groups = sa.select(sa.literal(1).label("one")).select_from(self.source).group_by(*keys).subquery("dq_groups")
+        with self.engine.connect() as conn:
+            distinct_rows = conn.execute(sa.select(sa.func.count()).select_from(groups)).scalar_one()
+        total_rows = self.totals()["rows"]
+        self.duplicate_report = DuplicateReport(
+            total_rows, total_rows - distinct_rows, 0,
+            pd.DataFrame(columns=['group_id', 'size', 'first_source', 'first_row']),
+            pd.DataFrame(columns=['group_id', 'source', 'row']))
+        return self.duplicate_report.summary()
+
+    def _mixed_types(self):
+        # A database column has one declared type, so no column mixes Python types
+        return pd.DataFrame()
+
+    def _outliers_by_date(self):
+        numeric_cols = [c for c in self.numeric_columns if c != self.date_column]
+        if not numeric_cols:
+            return pd.DataFrame()
+        key, is_day = self._date_key()
+
+        result = []
+        for col in numeric_cols:
+            counts = self._outlier_query(col, key)
+            days = self._key_days(counts[_KEY])
+            counts = counts[days.notna().to_numpy()].assign(date_only=days.dropna().to_numpy())
+            if not is_day and counts["date_only"].duplicated().any():
+                # Quantiles of values grouped by text cannot be merged into days
+                _logger.warning(f"outliers_by_date skipped: {self.date_column} has several values per day "
+                                f"in a format ({self.date_format}) that cannot be cut into days in SQL")
+                return pd.DataFrame()
+            counts = counts[counts["total_count"] >= 5].sort_values("date_only")
+            if counts.empty:
+                continue
+            outlier_count = pd.to_numeric(counts["outlier_count"]).fillna(0).to_numpy(dtype=np.int64)
+            total_count = counts["total_count"].to_numpy(dtype=np.int64)
+            result.append(pd.DataFrame({
+                "date_only": np.asarray(counts["date_only"], dtype=object),
+                "column": col,
+                "outlier_count": outlier_count,
+                "total_count": total_count,
+                "outlier_percentage": (outlier_count / total_count) * 100
+            }))
+        return pd.concat(result, ignore_index=True) if result else pd.DataFrame()
+
+    def _placeholder_counts(self):
+        totals = self.totals()
+        total_rows = totals["rows"]
+        data = []
+        for col in self.text_columns:
+            placeholder_count = np.int64(totals["placeholders"][col])
+            data.append({
+                "column": col,
+                "placeholder_count": placeholder_count,
+                "total_rows": total_rows,
+                "placeholder_percentage": (placeholder_count / total_rows) * 100 if total_rows > 0 else 0
+            })
+        return pd.DataFrame(data)
+
+    def _placeholder_counts_by_date(self):
+        by_date = self.by_date()
+        text_cols = [c for c in self.text_columns if c != self.date_column]
+        return wide_to_long_by_date(by_date["placeholders"][text_cols], by_date["totals"], 'placeholder', 'total_rows')
+
+    def _nulls_by_date(self):
+        by_date = self.by_date()
+        return wide_to_long_by_date(by_date["nulls"], by_date["totals"], 'null')
+
+    def _empty_strings_by_date(self):
+        by_date = self.by_date()
+        text_cols = [c for c in self.text_columns if c != self.date_column]
+        return wide_to_long_by_date(by_date["empty"][text_cols], by_date["totals"], 'empty_string')
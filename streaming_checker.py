@@ -0,0 +1,477 @@
+import logging
+from functools import partial
+
+import pandas as pd
+import numpy as np
+
+from data_quality_checker import (DataQualityChecker, PLACEHOLDER_PATTERN, QUANTILE_BACKENDS, APPROX_DISTINCT_MODES,
+                                  wide_to_long_by_date, compile_placeholder_pattern, encoded_match,
+                                  is_placeholder, is_empty_string, parse_dates, build_date_index, sum_by_date,
+                                  value_type_counts, is_text_dtype)
+from anomaly_rows import AnomalyRowStore
+from duplicate_detector import DuplicateDetector
+from utils.instrumentation import Instrumentation
+from utils.sketches import KLLSketch, HyperLogLog
+
+_logger = logging.getLogger("data_quality_logger")
+
+
+class ChunkState:
+    """
+    Mergeable per-chunk state for the data quality checks.
+
+    Every field is either an additive counter, a set, a quantile or distinct
+    count sketch, or a list of retained numeric values, so two states built from disjoint chunks
+    (or on different workers) can be combined with `merge` and give the same
+    result as one state built from all the chunks.
+
+    The exact buffers are capped: retained numeric values past
+    numeric_memory_budget bytes are folded into quantile sketches, and a
+    column's exact distinct set past distinct_threshold values turns into a
+    HyperLogLog, each with a warning.
+    """
+
+    def __init__(self, date_column: str = None, quantile_backend: str = "exact", sketch_error: float = 0.01,
+                 approx_distinct=False, distinct_threshold: int = 100_000, hll_precision: int = 14,
+                 placeholders: list = None, date_format: str = None, duplicate_subset: list = None,
+                 duplicate_memory_budget: int = 256 * 1024 ** 2, numeric_memory_budget: int = 256 * 1024 ** 2):
+        if quantile_backend not in QUANTILE_BACKENDS:
+            raise ValueError(f"Unsupported quantile_backend: {quantile_backend}")
+        if approx_distinct not in APPROX_DISTINCT_MODES:
+            raise ValueError(f"Unsupported approx_distinct mode: {approx_distinct}")
+        self.date_column = date_column
+        # Inferred from the first chunk when not given, then reused for every chunk
+        self.date_format = date_format
+        self.quantile_backend = quantile_backend
+        self.sketch_error = sketch_error
+        self.approx_distinct = approx_distinct
+        self.distinct_threshold = distinct_threshold
+        self.hll_precision = hll_precision
+        self.placeholder_pattern = PLACEHOLDER_PATTERN if placeholders is None else compile_placeholder_pattern(placeholders)
+        self.total_rows = 0
+        self.dtypes = {}
+        self.null_counts = {}
+        # column -> set of distinct values, or a HyperLogLog once approximated
+        self.uniques = {}
+        self.samples = {}
+        self.object_columns = set()
+        self.non_numeric_columns = set()
+        self.type_counts = {}
+        self.placeholder_counts = {}
+        # Row hashes for the duplicate check; spilled to disk past the memory budget
+        self.duplicates = DuplicateDetector(subset=duplicate_subset, memory_budget=duplicate_memory_budget)
+        self.numeric_frames = []
+        self.numeric_memory_budget = numeric_memory_budget
+        self._numeric_bytes = 0
+        self.sketches = {}
+        self.date_sketches = {}
+        # By-date aggregates: wide (date x column) frames of summed masks
+        self.rows_by_date = pd.Series(dtype='int64')
+        self.nulls_by_date = pd.DataFrame()
+        self.empty_by_date = pd.DataFrame()
+        self.placeholders_by_date = pd.DataFrame()
+
+    def update(self, chunk: pd.DataFrame):
+        self.total_rows += len(chunk)
+        null_mask = chunk.isnull()
+        placeholder_masks, empty_masks = {}, {}
+
+        for col in chunk.columns:
+            series = chunk[col]
+            self._update_dtype(col, series.dtype)
+            self.null_counts[col] = self.null_counts.get(col, 0) + int(null_mask[col].sum())
+
+            non_null = series[~null_mask[col]]
+            uniques = non_null.unique()
+            self._add_distinct(col, uniques)
+            samples = self.samples.setdefault(col, [])
+            for value in uniques[:3].tolist():
+                if len(samples) >= 3:
+                    break
+                if value not in samples:
+                    samples.append(value)
+
+            counts = self.type_counts.setdefault(col, {})
+            if is_text_dtype(series.dtype):
+                # Only text columns can mix types within a chunk
+                types = value_type_counts(non_null)
+                for t, n in zip(types.index, types.values):
+                    counts[t] = counts.get(t, 0) + int(n)
+                self.object_columns.add(col)
+                codes, distinct = pd.factorize(series)
+                placeholder_masks[col] = encoded_match(series, is_placeholder(self.placeholder_pattern), codes, distinct)
+                empty_masks[col] = encoded_match(series, is_empty_string, codes, distinct)
+                self.placeholder_counts[col] = self.placeholder_counts.get(col, 0) + int(placeholder_masks[col].sum())
+            elif len(non_null):
+                # One type per chunk; kept in case the column is text in another chunk
+                t = type(non_null.iloc[:1].tolist()[0])
+                counts[t] = counts.get(t, 0) + len(non_null)
+            if not pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+                self.non_numeric_columns.add(col)
+
+        self.duplicates.update(chunk)
+
+        numeric_cols = [c for c in chunk.columns if c not in self.non_numeric_columns and c != self.date_column]
+        parsed_dates = date_index = None
+        if self.date_column:
+            parsed_dates, self.date_format = parse_dates(chunk[self.date_column], self.date_format)
+            date_index = build_date_index(parsed_dates)
+            self._update_by_date(date_index, null_mask, placeholder_masks, empty_masks)
+
+        if self.quantile_backend == "sketch":
+            self._update_sketches(chunk[numeric_cols], date_index)
+        else:
+            retained = chunk[numeric_cols].copy()
+            if self.date_column:
+                retained[self.date_column] = parsed_dates
+            self._retain([retained])
+        return self
+
+    def merge(self, other: "ChunkState"):
+        self.total_rows += other.total_rows
+        for col, dtype in other.dtypes.items():
+            self._update_dtype(col, dtype)
+        for col, n in other.null_counts.items():
+            self.null_counts[col] = self.null_counts.get(col, 0) + n
+        for col, values in other.uniques.items():
+            if isinstance(values, HyperLogLog):
+                self._to_sketch(col).merge(values)
+            else:
+                self._add_distinct(col, list(values))
+        for col, values in other.samples.items():
+            samples = self.samples.setdefault(col, [])
+            for value in values:
+                if len(samples) < 3 and value not in samples:
+                    samples.append(value)
+        for col, counts in other.type_counts.items():
+            mine = self.type_counts.setdefault(col, {})
+            for t, n in counts.items():
+                mine[t] = mine.get(t, 0) + n
+        for col, n in other.placeholder_counts.items():
+            self.placeholder_counts[col] = self.placeholder_counts.get(col, 0) + n
+        self.object_columns |= other.object_columns
+        self.non_numeric_columns |= other.non_numeric_columns
+        self.duplicates.merge(other.duplicates)
+        if other.quantile_backend == "sketch" and self.quantile_backend != "sketch":
+            self._to_quantile_sketches("merged with a state using quantile sketches")
+        if self.quantile_backend == "sketch":
+            self._fold_into_sketches(other.numeric_frames)
+        else:
+            self._retain(other.numeric_frames)
+        for sketches, theirs in ((self.sketches, other.sketches), (self.date_sketches, other.date_sketches)):
+            for key, sketch in theirs.items():
+                if key in sketches:
+                    sketches[key].merge(sketch)
+                else:
+                    sketches[key] = sketch
+        self.rows_by_date = self.rows_by_date.add(other.rows_by_date, fill_value=0)
+        self.nulls_by_date = self.nulls_by_date.add(other.nulls_by_date, fill_value=0)
+        self.empty_by_date = self.empty_by_date.add(other.empty_by_date, fill_value=0)
+        self.placeholders_by_date = self.placeholders_by_date.add(other.placeholders_by_date, fill_value=0)
+        return self
+
+    def _add_distinct(self, col, values):
+        current = self.uniques.get(col)
+        if isinstance(current, HyperLogLog) or self.approx_distinct is True:
+            self._to_sketch(col).update(values)
+            return
+        current = self.uniques.setdefault(col, set())
+        current.update(values.tolist() if hasattr(values, 'tolist') else values)
+        if len(current) >= self.distinct_threshold:
+            if self.approx_distinct is False:
+                _logger.warning(f"Column {col} reached {self.distinct_threshold} distinct values; "
+                                f"counting the rest with HyperLogLog")
+            self._to_sketch(col)
+
+    def _to_sketch(self, col):
+        current = self.uniques.get(col)
+        if isinstance(current, HyperLogLog):
+            return current
+        sketch = HyperLogLog(self.hll_precision)
+        if current:
+            sketch.update(list(current))
+        self.uniques[col] = sketch
+        return sketch
+
+    def _retain(self, frames):
+        self.numeric_frames.extend(frames)
+        self._numeric_bytes += sum(int(frame.memory_usage(index=False).sum()) for frame in frames)
+        if self._numeric_bytes > self.numeric_memory_budget:
+            self._to_quantile_sketches(f"exact outlier buffers passed {self.numeric_memory_budget} bytes")
+
+    def _to_quantile_sketches(self, reason):
+        _logger.warning(f"Switching to quantile sketches (rank error {self.sketch_error}): {reason}")
+        frames, self.numeric_frames, self._numeric_bytes = self.numeric_frames, [], 0
+        self.quantile_backend = "sketch"
+        self._fold_into_sketches(frames)
+
+    def _fold_into_sketches(self, frames):
+        # Retained frames carry the parsed dates next to the numeric columns
+        for frame in frames:
+            if self.date_column:
+                self._update_sketches(frame.drop(columns=self.date_column), build_date_index(frame[self.date_column]))
+            else:
+                self._update_sketches(frame, None)
+
+    def _update_dtype(self, col, dtype):
+        current = self.dtypes.get(col)
+        if current is None or current == dtype:
+            self.dtypes[col] = dtype
+            return
+        try:
+            self.dtypes[col] = np.result_type(current, dtype)
+        except TypeError:
+            self.dtypes[col] = np.dtype(object)
+
+    def _update_sketches(self, numeric, date_index):
+        if date_index is not None:
+            valid = date_index.row_codes >= 0
+            codes = date_index.row_codes[valid]
+            order = np.argsort(codes, kind='stable')
+            splits = np.cumsum(np.bincount(codes, minlength=len(date_index.dates)))[:-1]
+
+        for col in numeric.columns:
+            values = numeric[col].to_numpy(dtype='float64', na_value=np.nan)
+            self.sketches.setdefault(col, KLLSketch(self.sketch_error)).update(values)
+            if date_index is None:
+                continue
+            for date, group in zip(date_index.dates, np.split(values[valid][order], splits)):
+                self.date_sketches.setdefault((date, col), KLLSketch(self.sketch_error)).update(group)
+
+    def _update_by_date(self, date_index, null_mask, placeholder_masks, empty_masks):
+        if not len(date_index.dates):
+            return
+
+        self.rows_by_date = self.rows_by_date.add(date_index.totals, fill_value=0)
+        self.nulls_by_date = self.nulls_by_date.add(sum_by_date(null_mask, date_index), fill_value=0)
+
+        obj_cols = [c for c in placeholder_masks if c != self.date_column]
+        rows = pd.RangeIndex(len(null_mask))
+        empty = pd.DataFrame({c: empty_masks[c] for c in obj_cols}, columns=obj_cols, index=rows)
+        self.empty_by_date = self.empty_by_date.add(sum_by_date(empty, date_index), fill_value=0)
+
+        placeholders = pd.DataFrame({c: placeholder_masks[c] for c in obj_cols}, columns=obj_cols, index=rows)
+        self.placeholders_by_date = self.placeholders_by_date.add(sum_by_date(placeholders, date_index), fill_value=0)
+
+
+class StreamingDataQualityChecker:
+    """
+    Out-of-core variant of DataQualityChecker that consumes an iterator of
+    DataFrame chunks (e.g. load_csv(..., chunksize=N) or pd.read_sql_query(..., chunksize=N)).
+
+    Parameters:
+    - chunks: iterable of pd.DataFrame | Chunks sharing the same columns
+    - date_column: str | Column used for the by-date breakdowns (optional)
+    - quantile_backend: str | 'exact' or 'sketch' for the IQR outlier quantiles
+    - sketch_error: float | Rank error bound of the quantile sketches
+    - approx_distinct: bool | 'auto' | Count distinct values with HyperLogLog
+      sketches; 'auto' keeps exact sets until a column reaches distinct_threshold
+    - distinct_threshold: int | Cardinality at which a column's exact set switches to a sketch
+    - hll_precision: int | HyperLogLog precision (relative error 1.04 / sqrt(2**p))
+    - placeholders: list | Placeholder regex fragments, defaults to PLACEHOLDERS
+    - date_format: str | Format of date_column, inferred from the first chunk when None
+    - duplicate_subset: list | Key columns for the duplicate check, defaults to all columns
+    - duplicate_memory_budget: int | Bytes of row hashes kept in memory before spilling to disk
+    - numeric_memory_budget: int | Bytes of numeric values the exact backend retains
+      before it switches to the sketch backend
+    - instrumentation: Instrumentation | Records consuming the chunks and every check (optional)
+
+    With the exact backend, numeric columns are retained across chunks for the
+    IQR quantiles, up to numeric_memory_budget; with the sketch backend they
+    are reduced to mergeable KLL sketches and outlier counts are estimated from
+    sketch ranks. Exact distinct sets are kept up to distinct_threshold values
+    per column, then counted with HyperLogLog (a warning is logged for both
+    switches). Everything else is reduced to counters as the chunks stream by.
+    Row-level anomaly frames (null_rows, outlier_rows, placeholder_rows) are not
+    available in streaming mode and are returned as empty dicts, with an empty
+    anomaly_rows store; metrics holds the timings as in DataQualityChecker.
+    """
+
+    def __init__(self, chunks, date_column: str = None, quantile_backend: str = "exact", sketch_error: float = 0.01,
+                 approx_distinct=False, distinct_threshold: int = 100_000, hll_precision: int = 14,
+                 placeholders: list = None, date_format: str = None, duplicate_subset: list = None,
+                 duplicate_memory_budget: int = 256 * 1024 ** 2, numeric_memory_budget: int = 256 * 1024 ** 2,
+                 instrumentation: Instrumentation = None):
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        self.chunks = chunks
+        self.date_column = date_column
+        self.quantile_backend = quantile_backend
+        self.sketch_error = sketch_error
+        self.approx_distinct = approx_distinct
+        self.distinct_threshold = distinct_threshold
+        self.hll_precision = hll_precision
+        self.placeholders = placeholders
+        self.date_format = date_format
+        self.duplicate_subset = duplicate_subset
+        self.duplicate_memory_budget = duplicate_memory_budget
+        self.numeric_memory_budget = numeric_memory_budget
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self.state = None
+
+    def consume(self):
+        if self.state is None:
+            self.state = ChunkState(self.date_column, self.quantile_backend, self.sketch_error,
+                                    self.approx_distinct, self.distinct_threshold, self.hll_precision,
+                                    self.placeholders, self.date_format, self.duplicate_subset,
+                                    self.duplicate_memory_budget, self.numeric_memory_budget)
+            with self.instrumentation.stage("consume", kind='load') as record:
+                for chunk in self.chunks:
+                    self.state.update(chunk)
+                record['rows'] = self.state.total_rows
+        return self.state
+
+    def merge(self, other: "StreamingDataQualityChecker"):
+        self.consume().merge(other.consume())
+        return self
+
+    def run_all_checks(self):
+        state = self.consume()
+        # The state switches to sketches when the exact buffers outgrow their budget
+        if state.quantile_backend == "sketch":
+            outliers = partial(self._sketch_outlier_summary, state)
+            outliers_by_date = partial(self._sketch_outliers_by_date, state)
+        else:
+            numeric = self._numeric_checker(state)
+            outliers, outliers_by_date = numeric._outlier_summary, numeric._outliers_by_date
+
+        checks = {
+            "column_summary": lambda: self._column_summary(state),
+            "nulls": lambda: self._null_counts(state),
+            "outliers": outliers,
+            "duplicates": lambda: self._duplicate_summary(state),
+            "mixed_types": lambda: self._mixed_type_check(state),
+            "outliers_by_date": outliers_by_date,
+            "placeholder_counts": lambda: self._placeholder_counts(state),
+            "placeholder_counts_by_date": lambda: self._by_date(state, state.placeholders_by_date, 'placeholder'),
+            "nulls_by_date": lambda: self._by_date(state, state.nulls_by_date, 'null'),
+            "empty_strings_by_date": lambda: self._by_date(state, state.empty_by_date, 'empty_string'),
+        }
+        results = {}
+        for name, check in checks.items():
+            if name.endswith("_by_date") and not self.date_column:
+                results[name] = pd.DataFrame()
+                continue
+            with self.instrumentation.stage(name, rows=state.total_rows):
+                results[name] = check()
+
+        results["null_rows"] = {}
+        results["outlier_rows"] = {}
+        results["placeholder_rows"] = {}
+        # No rows are kept while streaming, so the store stays empty
+        results["anomaly_rows"] = AnomalyRowStore()
+        # Rows are numbered in stream order (per merged stream)
+        results["duplicate_groups"] = self.duplicate_report.groups
+        results["metrics"] = self.instrumentation.metrics
+        return results
+
+    def _numeric_checker(self, state):
+        keep = self._numeric_columns(state) + ([self.date_column] if self.date_column else [])
+        frames = [f.reindex(columns=keep) for f in state.numeric_frames]
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=keep)
+        return DataQualityChecker(frame, date_column=self.date_column, copy=False)
+
+    def _numeric_columns(self, state):
+        return [c for c in state.dtypes if c not in state.non_numeric_columns and c != self.date_column]
+
+    @staticmethod
+    def _sketch_outlier_count(sketch):
+        if sketch is None or sketch.n == 0:
+            return 0
+        q1, q3 = sketch.quantile(0.25), sketch.quantile(0.75)
+        iqr = q3 - q1
+        below = sketch.rank(q1 - 1.5 * iqr)
+        above = sketch.n - sketch.rank(q3 + 1.5 * iqr, inclusive=True)
+        return int(round(below + above))
+
+    def _sketch_outlier_summary(self, state):
+        outlier_data = []
+        for col in self._numeric_columns(state):
+            outlier_count = self._sketch_outlier_count(state.sketches.get(col))
+            outlier_data.append({
+                'column': col,
+                'outlier_count': outlier_count,
+                'total_count': state.total_rows,
+                'outlier_percentage': (outlier_count / state.total_rows) * 100
+            })
+        return pd.DataFrame(outlier_data)
+
+    def _sketch_outliers_by_date(self, state):
+        result = []
+        dates = sorted({date for date, _ in state.date_sketches})
+        for col in self._numeric_columns(state):
+            for date in dates:
+                sketch = state.date_sketches.get((date, col))
+                if sketch is None or sketch.n < 5:
+                    continue
+                outlier_count = self._sketch_outlier_count(sketch)
+                result.append({
+                    "date_only": date,
+                    "column": col,
+                    "outlier_count": outlier_count,
+                    "total_count": sketch.n,
+                    "outlier_percentage": (outlier_count / sketch.n) * 100
+                })
+        return pd.DataFrame(result)
+
+    def _column_summary(self, state):
+        summary = []
+        # Exact sets past distinct_threshold are sketched too, so report the error then as well
+        report_error = self.approx_distinct or any(isinstance(v, HyperLogLog) for v in state.uniques.values())
+        for col, dtype in state.dtypes.items():
+            null_count = state.null_counts[col]
+            distinct = state.uniques[col]
+            approximate = isinstance(distinct, HyperLogLog)
+            row = {
+                "column": col,
+                "dtype": str(dtype),
+                "non_null_count": state.total_rows - null_count,
+                "null_count": null_count,
+                "null_percentage": null_count / state.total_rows * 100 if state.total_rows else np.nan,
+                "unique_values": int(round(distinct.estimate())) if approximate else len(distinct),
+                "sample_values": state.samples[col]
+            }
+            if report_error:
+                row["unique_values_error"] = distinct.relative_error if approximate else 0.0
+            summary.append(row)
+        return pd.DataFrame(summary)
+
+    def _null_counts(self, state):
+        nulls = pd.DataFrame({'column': list(state.dtypes), 'null_count': [state.null_counts[c] for c in state.dtypes]})
+        nulls['null_percentage'] = (nulls['null_count'] / state.total_rows) * 100
+        return nulls
+
+    def _duplicate_summary(self, state):
+        self.duplicate_report = state.duplicates.finalize()
+        return self.duplicate_report.summary()
+
+    def _mixed_type_check(self, state):
+        result = []
+        for col in state.dtypes:
+            if col not in state.non_numeric_columns:
+                continue
+            counts = state.type_counts.get(col, {})
+            if len(counts) > 1:
+                result.append({
+                    "column": col,
+                    "type_counts": dict(sorted(counts.items(), key=lambda kv: kv[1], reverse=True))
+                })
+        return pd.DataFrame(result)
+
+    def _placeholder_counts(self, state):
+        data = []
+        for col in state.dtypes:
+            if col not in state.object_columns:
+                continue
+            count = state.placeholder_counts.get(col, 0)
+            data.append({
+                "column": col,
+                "placeholder_count": count,
+                "total_rows": state.total_rows,
+                "placeholder_percentage": (count / state.total_rows) * 100 if state.total_rows > 0 else 0
+            })
+        return pd.DataFrame(data)
+
+    def _by_date(self, state, wide, name):
+        total_column = 'total_rows' if name == 'placeholder' else None
+        return wide_to_long_by_date(wide, state.rows_by_date, name, total_column)
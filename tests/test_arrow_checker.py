@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from arrow_checker import ArrowDataQualityChecker
+from data_quality_checker import DataQualityChecker
+
+
+def test_null_counts_from_parquet_footer(tmp_path):
+    df = pd.DataFrame({'amount': [1.0, None, 3.0, 4.0], 'label': ['x', None, None, 'y'],
+                       'count': pd.array([1, 2, None, 4], dtype='Int64'), 'id': [1, 2, 3, 4]})
+    path = tmp_path / 'data.parquet'
+    df.to_parquet(path, index=False, row_group_size=2)
+
+    checker = ArrowDataQualityChecker.from_parquet(str(path), only=['nulls'])
+    # Float statistics do not count NaN, so only the float column is read
+    assert checker.table.column_names == ['amount']
+    expected = DataQualityChecker(df).run_all_checks()['nulls']
+    pd.testing.assert_frame_equal(checker.run_all_checks()['nulls'], expected, check_dtype=False)
+
+    ranged = ArrowDataQualityChecker.from_parquet(str(path), only=['nulls'], date_column='id', date_range=(1, 4))
+    assert ranged.footer_nulls is None
+    pd.testing.assert_frame_equal(ranged.run_all_checks()['nulls'], expected, check_dtype=False)
+
+
+def test_outliers_by_date_match_pandas():
+    rng = np.random.default_rng(3)
+    n = 3000
+    df = pd.DataFrame({'date': rng.choice(pd.date_range('2026-01-01', periods=30).strftime('%Y-%m-%d'), n),
+                       'x': rng.normal(0, 1, n), 'count': rng.integers(0, 100, n),
+                       'skewed': np.where(rng.random(n) < .2, np.nan, rng.exponential(1, n))})
+    df.loc[df['date'] == '2026-01-03', 'skewed'] = np.nan
+    results = ArrowDataQualityChecker(df, date_column='date').run_all_checks()['outliers_by_date']
+    expected = DataQualityChecker(df, date_column='date').run_all_checks()['outliers_by_date']
+    pd.testing.assert_frame_equal(results, expected, check_dtype=False)
+
+
+def test_empty_table():
+    df = pd.DataFrame({'date': pd.Series([], dtype=object), 'amount': pd.Series([], dtype=float)})
+    results = ArrowDataQualityChecker(df, date_column='date').run_all_checks()
+    expected = DataQualityChecker(df, date_column='date').run_all_checks()
+    for name in ('column_summary', 'nulls', 'outliers', 'outliers_by_date'):
+        pd.testing.assert_frame_equal(results[name], expected[name], check_dtype=False, obj=name)
+    assert results['nulls']['null_percentage'].isna().all()
@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from data_loader import load_data
+from data_quality_checker import DataQualityChecker
+from streaming_checker import StreamingDataQualityChecker
+from utils.instrumentation import Instrumentation
+
+
+@pytest.fixture
+def nullable_frame():
+    return pd.DataFrame({
+        'date': ['2026-10-01'] * 6 + ['2026-10-02'] * 6,
+        'count': pd.array([1, 2, 3, None, 100, 2, 3, 4, None, 5, 6, 7], dtype='Int64'),
+        'amount': pd.array([1.5, None, 2, 3, 4, 50, 1, 2, 3, 4, 5, None], dtype='Float64'),
+    })
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"workers": 2}, {"workers": 2, "backend": "process"}])
+def test_outliers_on_nullable_columns(nullable_frame, kwargs):
+    results = DataQualityChecker(nullable_frame, date_column='date').run_all_checks(**kwargs)
+    outliers = results['outliers'].set_index('column')['outlier_count']
+    assert outliers.to_dict() == {'count': 1, 'amount': 1}
+    assert len(results['outlier_rows']['count']) == 1
+
+
+def test_streaming_outliers_on_nullable_columns(nullable_frame):
+    chunks = [nullable_frame.iloc[:5], nullable_frame.iloc[5:]]
+    results = StreamingDataQualityChecker(chunks, date_column='date').run_all_checks()
+    expected = DataQualityChecker(nullable_frame, date_column='date').run_all_checks()
+    pd.testing.assert_frame_equal(results['outliers'], expected['outliers'])
+
+
+def test_sketch_outliers_by_date_match_exact_on_small_days(nullable_frame):
+    # Days far below the sketch's capacity keep every value, so both backends agree
+    sketch = DataQualityChecker(nullable_frame, date_column='date', quantile_backend='sketch').run_all_checks()
+    exact = DataQualityChecker(nullable_frame, date_column='date').run_all_checks()
+    assert not exact['outliers_by_date'].empty
+    pd.testing.assert_frame_equal(sketch['outliers_by_date'], exact['outliers_by_date'])
+
+
+def test_streaming_exact_buffers_switch_to_sketches(nullable_frame):
+    chunks = [nullable_frame.iloc[:6], nullable_frame.iloc[6:]]
+    checker = StreamingDataQualityChecker(chunks, date_column='date', numeric_memory_budget=1, distinct_threshold=4)
+    results = checker.run_all_checks()
+    assert checker.state.quantile_backend == 'sketch' and not checker.state.numeric_frames
+    expected = DataQualityChecker(nullable_frame, date_column='date').run_all_checks()
+    pd.testing.assert_frame_equal(results['outliers_by_date'], expected['outliers_by_date'])
+    assert 'unique_values_error' in results['column_summary']
+
+
+def test_streaming_results_have_checker_keys():
+    chunks = [pd.DataFrame({'a': [1, 2], 'b': [1.5, 2.5]}), pd.DataFrame({'a': ['x', 'y'], 'b': [3.5, None]})]
+    results = StreamingDataQualityChecker(chunks).run_all_checks()
+    expected = DataQualityChecker(pd.concat(chunks, ignore_index=True)).run_all_checks()
+    assert set(results) >= set(expected) - {'duplicate_groups'}
+    assert results['anomaly_rows'].checks() == []
+    assert 'outliers' in results['metrics'].to_frame()['stage'].tolist()
+    # Numeric chunks still count towards a column that is text in another chunk
+    assert results['mixed_types'].set_index('column')['type_counts'].to_dict() == {'a': {int: 2, str: 2}}
+
+
+def test_optimized_load_keeps_report_off_the_frame(tmp_path):
+    path = tmp_path / 'data.csv'
+    pd.DataFrame({'a': range(20), 'b': list('xy') * 10}).to_csv(path, index=False)
+    instrumentation = Instrumentation()
+    df = load_data(str(path), 'csv', instrumentation, optimize=True)
+    assert df.attrs == {}
+    DataQualityChecker(df, instrumentation=instrumentation).run_all_checks()
+    load_record = instrumentation.metrics.records[0]
+    assert load_record['kind'] == 'load'
+    assert len(load_record['memory_report']) == 2
@@ -0,0 +1,52 @@
+import getpass
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from data_loader import load_data, run_checks_cached
+from db_handlers import postgres_loader, sql_loader
+from utils.result_cache import ResultCache
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    pd.DataFrame({'a': [1.0, None, 3.0, 3.0], 'b': ['x', '', 'N/A', 'N/A']}).to_sql('t', engine, index=False)
+    return engine
+
+
+@pytest.fixture
+def no_prompts(monkeypatch):
+    def prompt(*args, **kwargs):
+        raise AssertionError("prompted for input")
+    monkeypatch.setattr(getpass, 'getpass', prompt)
+    monkeypatch.setattr('builtins.input', prompt)
+
+
+@pytest.mark.parametrize("source_type", ["postgres", "sqlserver"])
+def test_stream_matches_full_load(engine, no_prompts, source_type):
+    full = load_data('select * from t', source_type, engine=engine)
+    chunks = list(load_data('select * from t', source_type, engine=engine, stream=True, chunk_rows=3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), full)
+
+
+def test_run_checks_cached_uses_engine(engine, no_prompts, tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    results = run_checks_cached('select * from t', 'postgres', cache=cache, engine=engine,
+                                probe="SELECT COUNT(*) FROM t")
+    assert results['nulls'].set_index('column')['null_count'].to_dict() == {'a': 1, 'b': 0}
+    cached = run_checks_cached('select * from t', 'postgres', cache=cache, engine=engine,
+                               probe="SELECT COUNT(*) FROM t")
+    pd.testing.assert_frame_equal(cached['nulls'], results['nulls'])
+
+
+@pytest.mark.parametrize("module", [postgres_loader, sql_loader])
+def test_passed_engine_leaves_prompt_cache_alone(engine, no_prompts, module, monkeypatch):
+    monkeypatch.setattr(module, '_engine', None)
+    monkeypatch.setattr(module, '_cached_query', {})
+    loader = module.load_postgres_data if module is postgres_loader else module.load_sql_server_data
+    assert len(loader('select * from t', engine=engine)) == 4
+    assert len(loader(engine=engine, table='t')) == 4
+    assert module._engine is None and module._cached_query == {}
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from duplicate_detector import detect_duplicates, hash_rows
+
+
+def test_object_values_of_different_types_are_not_duplicates():
+    df = pd.DataFrame({'a': [1, '1', 2.0, '2.0', True, 'True', 1.0, None, np.nan], 'b': 0})
+    report = detect_duplicates({'file': df})
+    assert report.duplicate_rows == df.duplicated().sum() == 3
+    assert sorted(report.rows['row']) == [0, 4, 6, 7, 8]
+
+
+def test_string_hashes_do_not_depend_on_the_rest_of_the_chunk():
+    assert hash_rows(pd.DataFrame({'a': ['x', 'y']}))[0] == hash_rows(pd.DataFrame({'a': ['x', 1]}))[0]
+
+
+def test_large_int64_keys_are_not_duplicates():
+    df = pd.DataFrame({'id': np.arange(10 ** 18, 10 ** 18 + 100_000, dtype='int64')})
+    assert detect_duplicates({'file': df}).duplicate_rows == df.duplicated().sum() == 0
+    keys = pd.DataFrame({'id': np.array([10 ** 18, 10 ** 18 + 1], dtype=object)})
+    assert detect_duplicates({'file': keys}).duplicate_rows == 0
+
+
+def test_int_and_float_chunks_hash_alike():
+    ints = pd.DataFrame({'a': pd.array([1, None, 3], dtype='Int64')})
+    floats = pd.DataFrame({'a': [1.0, np.nan, 3.0]})
+    assert (hash_rows(ints) == hash_rows(floats)).all()
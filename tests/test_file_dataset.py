@@ -0,0 +1,54 @@
+import pandas as pd
+
+from data_loader import load_data
+from file_handlers.file_dataset import FileDataset, is_multi_source
+
+
+def test_urls_are_not_globs():
+    assert not is_multi_source('https://host/data.csv?token=abc')
+    assert not is_multi_source('s3://bucket/data.csv?versionId=1')
+
+
+def test_hive_partitioned_directory(tmp_path):
+    for day, frame in (('2026-10-01', pd.DataFrame({'a': [1, 2]})),
+                       ('2026-10-02', pd.DataFrame({'a': [3], 'b': ['x']}))):
+        (tmp_path / f'date={day}').mkdir()
+        frame.to_csv(tmp_path / f'date={day}' / 'part.csv', index=False)
+    (tmp_path / '_SUCCESS').write_text('')
+
+    dataset = load_data(str(tmp_path))
+    assert is_multi_source(str(tmp_path / 'date=*' / '*.csv'))
+    assert dataset.columns == ['a', 'b', 'date']
+    frame = dataset.to_frame()
+    assert frame['date'].tolist() == ['2026-10-01', '2026-10-01', '2026-10-02']
+    pd.testing.assert_frame_equal(frame, pd.concat(list(dataset), ignore_index=True))
+
+
+def test_files_without_header_are_loaded_once():
+    frames = {'a.json': pd.DataFrame({'a': [1]}), 'b.json': pd.DataFrame({'b': [2]})}
+    loads = []
+
+    def loader(path):
+        loads.append(path)
+        return frames[path].copy()
+
+    dataset = FileDataset(list(frames), loader, columns_reader=lambda path: None, workers=1)
+    assert [list(frame.columns) for frame in dataset] == [['a', 'b'], ['a', 'b']]
+    assert loads == ['a.json', 'b.json']
+
+
+def test_frames_kept_for_columns_are_capped():
+    frames = {name: pd.DataFrame({name[0]: range(100)}) for name in ('a.json', 'b.json', 'c.json')}
+    loads = []
+
+    def loader(path):
+        loads.append(path)
+        return frames[path].copy()
+
+    size = int(frames['a.json'].memory_usage(deep=True).sum())
+    dataset = FileDataset(list(frames), loader, columns_reader=lambda path: None, workers=1, keep_bytes=size)
+    assert dataset.columns == ['a', 'b', 'c']
+    assert list(dataset._loaded) == ['a.json']
+    assert len(list(dataset)) == 3
+    assert loads == ['a.json', 'b.json', 'c.json', 'b.json', 'c.json']
+    assert dataset._loaded_bytes == 0
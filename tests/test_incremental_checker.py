@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_quality_checker import DataQualityChecker
+from incremental_checker import BY_DATE_CHECKS, IncrementalByDateChecker
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 60
+    return pd.DataFrame({
+        'date': np.repeat(['2026-10-01', '2026-10-02', '2026-10-03'], n // 3),
+        'id': 2 ** 60 + np.arange(n, dtype='int64') * 2,
+        'amount': np.where(rng.random(n) < 0.1, np.nan, rng.normal(10, 2, n)).round(2),
+        'label': rng.choice(['a', 'b', '', 'N/A'], n),
+    })
+
+
+def _dates(dates):
+    return [str(date) for date in dates]
+
+
+def _assert_matches_full_run(checker, df):
+    incremental = checker.run(df)
+    full = DataQualityChecker(df, date_column='date').run_all_checks()
+    for key in BY_DATE_CHECKS:
+        pd.testing.assert_frame_equal(incremental[key], full[key], obj=key)
+
+
+def test_matches_full_recompute(tmp_path, frame):
+    checker = IncrementalByDateChecker(str(tmp_path), 'events', 'date')
+    _assert_matches_full_run(checker, frame)
+    assert len(checker.changed_dates) == 3
+
+    appended = pd.concat([frame, frame.tail(5).assign(date='2026-10-04', amount=99.0)], ignore_index=True)
+    _assert_matches_full_run(checker, appended)
+    assert _dates(checker.changed_dates) == ['2026-10-04']
+
+    edited = appended.copy()
+    edited.loc[3, 'amount'] = 500.0
+    _assert_matches_full_run(checker, edited)
+    assert _dates(checker.changed_dates) == ['2026-10-01']
+
+    # Neighbouring integers near 2**60 share a float64, so only an exact hash sees this edit
+    edited.loc[25, 'id'] += 1
+    _assert_matches_full_run(checker, edited)
+    assert _dates(checker.changed_dates) == ['2026-10-02']
+
+    trimmed = edited[edited['date'] != '2026-10-03'].reset_index(drop=True)
+    _assert_matches_full_run(checker, trimmed)
+    assert _dates(checker.changed_dates) == [] and _dates(checker.removed_dates) == ['2026-10-03']
+
+
+def test_unchanged_data_reuses_results(tmp_path, frame):
+    checker = IncrementalByDateChecker(str(tmp_path), 'events', 'date')
+    first = checker.run(frame)
+    second = checker.run(frame.copy())
+    assert _dates(checker.changed_dates) == []
+    for key in BY_DATE_CHECKS:
+        pd.testing.assert_frame_equal(second[key], first[key])
@@ -0,0 +1,86 @@
+import gzip
+import io
+import tarfile
+import zipfile
+
+import pandas as pd
+import pytest
+
+from data_loader import load_data
+from file_handlers.load_compressed import archive_type
+
+
+@pytest.fixture
+def frames():
+    return {'a.csv': pd.DataFrame({'x': [1, 2, 3], 'y': list('abc')}),
+            'b.csv': pd.DataFrame({'x': [4, 5], 'y': list('de')})}
+
+
+def _csv_bytes(frame):
+    return frame.to_csv(index=False).encode()
+
+
+def _write_zip(path, frames):
+    with zipfile.ZipFile(path, 'w') as z:
+        for name, frame in frames.items():
+            z.writestr(name, _csv_bytes(frame))
+
+
+def _write_tar(path, frames, mode='w'):
+    with tarfile.open(path, mode) as tar:
+        for name, frame in frames.items():
+            data = _csv_bytes(frame)
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def _expected(frames):
+    return pd.concat([frame.assign(member=name) for name, frame in frames.items()], ignore_index=True)
+
+
+@pytest.mark.parametrize("name,source_type", [('data.zip', None), ('data.bin', 'zip'), ('data.bin', 'compressed')])
+def test_zip(tmp_path, frames, name, source_type):
+    path = tmp_path / name
+    _write_zip(path, frames)
+    df = load_data(str(path), source_type or 'zip', member_column='member')
+    pd.testing.assert_frame_equal(df, _expected(frames))
+
+
+@pytest.mark.parametrize("name,mode,source_type", [
+    ('data.tar', 'w', 'tar'), ('data.tar.gz', 'w:gz', 'tar'), ('data.tgz', 'w:gz', None),
+    ('data.bin', 'w:bz2', 'tar'), ('data.bin', 'w:xz', 'compressed')])
+def test_tar(tmp_path, frames, name, mode, source_type):
+    path = tmp_path / name
+    _write_tar(path, frames, mode)
+    df = load_data(str(path), source_type, member_column='member')
+    pd.testing.assert_frame_equal(df, _expected(frames))
+
+
+@pytest.mark.parametrize("name,source_type", [('data.csv.gz', None), ('data.csv', 'gzip'), ('data.csv', 'compressed')])
+def test_single_codec(tmp_path, frames, name, source_type):
+    path = tmp_path / name
+    with gzip.open(path, 'wb') as f:
+        f.write(_csv_bytes(frames['a.csv']))
+    assert archive_type(str(path), source_type) == ('single', 'gzip')
+    pd.testing.assert_frame_equal(load_data(str(path), source_type), frames['a.csv'])
+    chunks = load_data(str(path), source_type or 'gzip', stream=True, chunk_rows=2)
+    pd.testing.assert_frame_equal(pd.concat(chunks), frames['a.csv'])
+
+
+@pytest.mark.parametrize("name,source_type", [('data.zip', 'zip'), ('data.tar.gz', 'tar'), ('data.bin', 'tar')])
+def test_stream_members(tmp_path, frames, name, source_type):
+    path = tmp_path / name
+    if source_type == 'zip':
+        _write_zip(path, frames)
+    else:
+        _write_tar(path, frames, 'w:gz')
+    chunks = list(load_data(str(path), source_type, stream=True, chunk_rows=2, member_column='member'))
+    assert [len(chunk) for chunk in chunks] == [2, 1, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), _expected(frames))
+
+
+def test_file_inside(tmp_path, frames):
+    path = tmp_path / 'data.bin'
+    _write_zip(path, frames)
+    pd.testing.assert_frame_equal(load_data(str(path), 'zip', file_inside='b.csv'), frames['b.csv'])
@@ -0,0 +1,61 @@
+import os
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from data_loader import run_checks_cached
+from utils.instrumentation import Instrumentation
+from utils.result_cache import ResultCache, file_fingerprint
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / 'cache'))
+
+
+def test_file_change_invalidates(cache, tmp_path):
+    path = tmp_path / 'data.csv'
+    pd.DataFrame({'a': [1, None]}).to_csv(path, index=False)
+    first = run_checks_cached(str(path), 'csv', cache=cache)
+    assert cache.get(cache.key(file_fingerprint(str(path)), {'loader_kwargs': {}})) is not None
+
+    pd.DataFrame({'a': [1, None, None]}).to_csv(path, index=False)
+    second = run_checks_cached(str(path), 'csv', cache=cache)
+    assert first['nulls']['null_count'].tolist() == [1]
+    assert second['nulls']['null_count'].tolist() == [2]
+
+    cache.invalidate(source=str(path))
+    assert not os.listdir(cache.cache_dir)
+
+
+def test_db_source_changes_are_seen_without_probe(cache, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    pd.DataFrame({'a': [1.0, None]}).to_sql('t', engine, index=False)
+    assert run_checks_cached('select * from t', 'postgres', cache=cache, engine=engine)['nulls']['null_count'][0] == 1
+    pd.DataFrame({'a': [None]}).to_sql('t', engine, index=False, if_exists='append')
+    assert run_checks_cached('select * from t', 'postgres', cache=cache, engine=engine)['nulls']['null_count'][0] == 2
+
+
+def test_eviction_keeps_recent_entries(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'), max_bytes=2500)
+    for i in range(4):
+        cache.put(f"k{i}", b'x' * 1000)
+        os.utime(cache._path(f"k{i}"), (i, i))
+    assert sorted(os.listdir(cache.cache_dir)) == ['k2.pkl', 'k3.pkl']
+    assert cache.size() <= 2500
+
+
+@pytest.mark.parametrize("payload", [b"cno_such_module\nThing\n.", b"cos\nno_such_attribute\n.", b"\x80"])
+def test_stale_entries_are_misses(cache, payload):
+    with open(cache._path('stale'), 'wb') as f:
+        f.write(payload)
+    assert cache.get('stale') is None
+    assert not os.path.exists(cache._path('stale'))
+
+
+def test_keys_ignore_object_addresses(cache):
+    fingerprint = ('file', '/data.csv', 1, 1)
+    assert cache.key(fingerprint, {'instrumentation': Instrumentation()}) == \
+        cache.key(fingerprint, {'instrumentation': Instrumentation()})
+    assert cache.key(fingerprint, {'date_column': 'a'}) != cache.key(fingerprint, {'date_column': 'b'})
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_quality_checker import DataQualityChecker
+from streaming_checker import StreamingDataQualityChecker
+from utils.sketches import HyperLogLog, KLLSketch
+
+
+@pytest.fixture
+def shuffled():
+    return np.random.default_rng(1).permutation(200_000).astype('float64')
+
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+def _max_rank_error(sketch, n):
+    # Values are 0..n-1, so a value's true rank is the value itself
+    return max(abs(sketch.quantile(q) / n - q) for q in QUANTILES)
+
+
+def test_kll_exact_below_capacity():
+    values = np.random.default_rng(0).normal(size=300)
+    sketch = KLLSketch(0.01).update(values[:100]).update(values[100:])
+    assert [sketch.quantile(q) for q in (0.1, 0.5, 0.9)] == pytest.approx(np.quantile(values, [0.1, 0.5, 0.9]))
+
+
+def test_kll_rank_error_within_bound(shuffled):
+    n = len(shuffled)
+    sketch = KLLSketch(0.01, seed=0)
+    for chunk in np.array_split(shuffled, 20):
+        sketch.update(chunk)
+    assert sketch.n == n
+    assert _max_rank_error(sketch, n) <= sketch.error
+    assert max(abs(sketch.rank(x) - x) for x in np.linspace(0, n, 50)) <= sketch.error * n
+    # Memory stays a small multiple of k however many values are seen
+    assert sum(len(level) for level in sketch.levels) < 3 * sketch.k
+
+
+def test_kll_merge_matches_single_stream(shuffled):
+    n = len(shuffled)
+    single = KLLSketch(0.01, seed=0).update(shuffled)
+    parts = [KLLSketch(0.01, seed=i).update(chunk) for i, chunk in enumerate(np.array_split(shuffled, 8))]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert merged.n == n
+    assert _max_rank_error(merged, n) <= merged.error
+    assert max(abs(merged.quantile(q) - single.quantile(q)) for q in QUANTILES) <= 2 * merged.error * n
+
+
+@pytest.mark.parametrize("values", [
+    np.arange(10 ** 18, 10 ** 18 + 100_000, dtype='int64'),
+    np.arange(100_000, dtype='float64') / 7,
+    np.array([f"id-{i}" for i in range(100_000)], dtype=object),
+])
+def test_hyperloglog_estimate_within_error(values):
+    sketch = HyperLogLog(14).update(values)
+    # Three standard errors
+    assert abs(sketch.estimate() / len(values) - 1) < 3 * sketch.relative_error
+
+
+def test_hyperloglog_merge_matches_single_sketch():
+    values = np.arange(10 ** 18, 10 ** 18 + 50_000, dtype='int64')
+    merged = HyperLogLog(12).update(values[:30_000]).merge(HyperLogLog(12).update(values[20_000:]))
+    assert merged.estimate() == HyperLogLog(12).update(values).estimate()
+
+
+def test_auto_distinct_mode():
+    df = pd.DataFrame({'id': np.arange(10 ** 18, 10 ** 18 + 50_000, dtype='int64'), 'flag': np.arange(50_000) % 3})
+    summary = DataQualityChecker(df, approx_distinct='auto', distinct_threshold=1000).run_all_checks()['column_summary']
+    summary = summary.set_index('column')
+    # Above the threshold the sketch answers; below it the count is exact
+    assert summary.loc['flag', ['unique_values', 'unique_values_error']].tolist() == [3, 0.0]
+    error = summary.loc['id', 'unique_values_error']
+    assert error > 0 and abs(summary.loc['id', 'unique_values'] / 50_000 - 1) < 3 * error
+
+    chunks = [df.iloc[i:i + 10_000] for i in range(0, len(df), 10_000)]
+    streamed = StreamingDataQualityChecker(chunks, approx_distinct='auto', distinct_threshold=1000).run_all_checks()
+    streamed = streamed['column_summary'].set_index('column')
+    assert streamed.loc['flag', 'unique_values'] == 3
+    assert abs(streamed.loc['id', 'unique_values'] / 50_000 - 1) < 3 * streamed.loc['id', 'unique_values_error']
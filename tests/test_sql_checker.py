@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from data_quality_checker import DataQualityChecker
+from sql_checker import SQL_CHECKS, SQLDataQualityChecker, day_positions
+
+DAYS = pd.date_range('2026-01-01', periods=4, freq='D')
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    # Several timestamps per day, so text dates cannot be grouped by value
+    stamps = DAYS.repeat(10) + pd.to_timedelta(np.tile(np.arange(10) * 37, 4), unit='min')
+    amount = rng.normal(100, 10, len(stamps))
+    amount[[3, 17]] = [1000, -500]
+    return pd.DataFrame({
+        'stamp': stamps,
+        'amount': amount,
+        'count': rng.integers(0, 50, len(stamps)).astype(float),
+        'label': np.where(np.arange(len(stamps)) % 7 == 0, 'N/A', 'ok'),
+    }).assign(count=lambda df: df['count'].where(np.arange(len(df)) % 9 != 0))
+
+
+def _compare(df, engine, **kwargs):
+    df.to_sql('t', engine, index=False)
+    expected = DataQualityChecker(df, date_column='stamp', **kwargs).run_all_checks()
+    results = SQLDataQualityChecker(engine, table='t', date_column='stamp', **kwargs).run_all_checks()
+    for name in SQL_CHECKS:
+        assert not results[name].empty or expected[name].empty, name
+        pd.testing.assert_frame_equal(results[name].reset_index(drop=True), expected[name].reset_index(drop=True),
+                                      check_dtype=False, obj=name)
+
+
+@pytest.mark.parametrize("date_format", [None, '%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M:%S'])
+def test_sql_checks_match_pandas(frame, tmp_path, date_format):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    if date_format:
+        frame['stamp'] = frame['stamp'].dt.strftime(date_format)
+    _compare(frame, engine)
+
+
+def test_regex_placeholders_match_pandas(frame, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    _compare(frame, engine, placeholders=[r'n/?a', 'ok+'])
+
+
+def test_unbucketable_text_dates_skip_outliers_by_date(frame, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    frame['stamp'] = frame['stamp'].dt.strftime('%d %B %Y %H:%M')
+    frame.to_sql('t', engine, index=False)
+    results = SQLDataQualityChecker(engine, table='t', date_column='stamp').run_all_checks()
+    assert results['outliers_by_date'].empty
+    assert not results['nulls_by_date'].empty
+
+
+def test_day_positions():
+    assert day_positions('%d/%m/%Y %H:%M:%S') == ({'d': (1, 2), 'm': (4, 2), 'Y': (7, 4)}, '__/__/____ __:__:__')
+    assert day_positions('%d %B %Y') is None
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from data_loader import load_data
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "pandas"])
+def test_stream_with_sep(tmp_path, engine):
+    path = tmp_path / 'data.csv'
+    frame = pd.DataFrame({'a': range(5), 'b': list('vwxyz')})
+    frame.to_csv(path, sep=';', index=False)
+    chunks = load_data(str(path), 'csv', stream=True, chunk_rows=2, sep=';', engine=engine)
+    pd.testing.assert_frame_equal(pd.concat(chunks), frame)
+
+
+def test_quoted_newlines_across_blocks(tmp_path):
+    path = tmp_path / 'data.csv'
+    frame = pd.DataFrame({'a': range(6), 'note': ['one\nline', 'x', 'say ""hi""\n\nbye', 'y', 'a,b\nc', 'z']})
+    frame.to_csv(path, index=False)
+    chunks = load_data(str(path), 'csv', stream=True, chunk_rows=4, engine='pyarrow', block_size=16)
+    pd.testing.assert_frame_equal(pd.concat(chunks), frame)
@@ -1,5 +1,7 @@
 import os
 
+from file_handlers.load_compressed import archive_type
+
 def detect_file_type(file_path: str) -> str:
     """
     Detects the type of a file based on its extension.
@@ -8,9 +10,15 @@ def detect_file_type(file_path: str) -> str:
         file_path (str): Path to the file.
 
     Returns:
-        str: File type (e.g., 'csv', 'excel', 'json', 'parquet', 'text', 'xml', 'tsv', 'zip', 'gzip', 'unknown').
+        str: File type (e.g., 'csv', 'excel', 'json', 'parquet', 'text', 'xml', 'tsv', 'zip', 'tar',
+             'gzip', 'bz2', 'xz', 'zstd', 'unknown').
     """
     ext = os.path.splitext(file_path)[1].lower()
+    kind, codec = archive_type(file_path)
+    if kind in ('zip', 'tar'):
+        return kind
+    if kind == 'single':
+        return codec
 
     if ext in ['.csv']:
         return 'csv'
@@ -26,9 +34,5 @@ def detect_file_type(file_path: str) -> str:
         return 'xml'
     elif ext in ['.tsv']:
         return 'tsv'
-    elif ext in ['.zip']:
-        return 'zip'
-    elif ext in ['.gz', '.gzip']:
-        return 'gzip'
     else:
         return 'unknown'
@@ -0,0 +1,162 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MEMORY_MODES = (None, "rss", "tracemalloc")
+
+# Same logger as utils.logger, without importing it (that module creates the log files)
+_logger = logging.getLogger("data_quality_logger")
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+class Metrics:
+    """
+    Structured per-stage metrics: one record per loader call, intermediate or check.
+
+    Each record is a dict with stage, kind, wall_seconds, cpu_seconds,
+    memory_delta_mb, rows and rows_per_sec.
+    """
+
+    def __init__(self, records: list = None):
+        self.records = records if records is not None else []
+
+    def add(self, record: dict):
+        self.records.append(record)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.records, columns=['stage', 'kind', 'wall_seconds', 'cpu_seconds',
+                                                   'memory_delta_mb', 'rows', 'rows_per_sec'])
+
+    def slowest(self, n: int = 5) -> pd.DataFrame:
+        return self.to_frame().nlargest(n, 'wall_seconds')
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        total = sum(r['wall_seconds'] for r in self.records)
+        return f"Metrics({len(self.records)} stages, {total:.3f}s)"
+
+
+class Instrumentation:
+    """
+    Records wall time, CPU time, memory and row throughput of named stages.
+
+    Parameters:
+    - memory: str | 'rss' (growth of the process peak RSS, cheap), 'tracemalloc'
+      (peak Python/numpy allocations during the stage, slower) or None
+    - profiler: callable | profiler(stage) -> context manager wrapped around every
+      stage, e.g. cprofile_hook() or a sampling profiler of your own
+    - log: bool | Emit one line per stage through the data quality logger
+    """
+
+    def __init__(self, memory: str = "rss", profiler=None, log: bool = True):
+        if memory not in MEMORY_MODES:
+            raise ValueError(f"Unsupported memory mode: {memory}")
+        self.memory = memory
+        self.profiler = profiler
+        self.log = log
+        self.metrics = Metrics()
+
+    @contextmanager
+    def stage(self, name: str, kind: str = "check", rows: int = None):
+        """
+        Measure the enclosed block. Yields the record, so rows can be filled in
+        once known (e.g. after a loader returns).
+        """
+        record = {'stage': name, 'kind': kind, 'rows': rows}
+        started_tracing = False
+        if self.memory == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        elif self.memory == "rss":
+            memory_before = _peak_rss_mb()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            with self.profiler(name) if self.profiler else nullcontext():
+                yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall
+            record['cpu_seconds'] = time.process_time() - cpu
+            if self.memory == "tracemalloc":
+                record['memory_delta_mb'] = (tracemalloc.get_traced_memory()[1] - memory_before) / 1024 ** 2
+                if started_tracing:
+                    tracemalloc.stop()
+            elif self.memory == "rss" and memory_before is not None:
+                record['memory_delta_mb'] = _peak_rss_mb() - memory_before
+            else:
+                record['memory_delta_mb'] = None
+            rows = record['rows']
+            record['rows_per_sec'] = rows / record['wall_seconds'] if rows and record['wall_seconds'] else None
+            self.metrics.add(record)
+            if self.log:
+                _logger.info(self.format(record))
+
+    @staticmethod
+    def format(record: dict) -> str:
+        memory = record['memory_delta_mb']
+        throughput = record['rows_per_sec']
+        return (f"[{record['kind']}] {record['stage']}: {record['wall_seconds']:.3f}s wall, "
+                f"{record['cpu_seconds']:.3f}s cpu"
+                + (f", +{memory:.1f} MB" if memory is not None else "")
+                + (f", {throughput:,.0f} rows/s" if throughput else ""))
+
+
+def cprofile_hook(output_dir: str = None, sort: str = "cumulative", limit: int = 20):
+    """
+    Profiler hook running cProfile per stage.
+
+    Parameters:
+    - output_dir: str | Write '<stage>.prof' files here (for snakeviz etc.);
+      when None the top `limit` entries are logged at debug level
+    - sort: str | pstats sort key for the logged listing
+    - limit: int | Number of entries logged
+
+    Returns:
+    - callable | Pass as Instrumentation(profiler=...)
+    """
+    @contextmanager
+    def hook(stage):
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield profile
+        finally:
+            profile.disable()
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+                profile.dump_stats(os.path.join(output_dir, re.sub(r"[^\w.-]+", "_", stage) + ".prof"))
+            else:
+                out = io.StringIO()
+                pstats.Stats(profile, stream=out).sort_stats(sort).print_stats(limit)
+                _logger.debug(f"Profile of {stage}:\n{out.getvalue()}")
+    return hook
+
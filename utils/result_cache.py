@@ -0,0 +1,174 @@
+import glob
+import hashlib
+import os
+import pickle
+import re
+
+from utils.logger import logger
+
+
+def file_fingerprint(path: str, content_hash: bool = False, block_size: int = 1024 ** 2) -> tuple:
+    """
+    Cheap identity of a file: absolute path, size and modification time.
+
+    Parameters:
+    - path: str | File path
+    - content_hash: bool | Also hash the file contents (catches rewrites that keep size and mtime)
+    - block_size: int | Bytes read at a time when hashing
+
+    Returns:
+    - tuple | ('file', path, size, mtime_ns[, digest])
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    fingerprint = ('file', path, stat.st_size, stat.st_mtime_ns)
+    if content_hash:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        fingerprint += (digest.hexdigest(),)
+    return fingerprint
+
+
+def query_fingerprint(query: str, probe=None, engine=None) -> tuple:
+    """
+    Identity of a database source: the query text plus a cheap change probe.
+
+    Parameters:
+    - query: str | Query or table name the data is loaded from
+    - probe: str | callable | SQL returning a change token (e.g.
+      "SELECT COUNT(*), MAX(updated_at) FROM orders") run on engine, or a
+      callable returning one; defaults to the row count of the query (see
+      default_probe), which misses updates that keep the count
+    - engine: sqlalchemy.Engine | Engine the probe SQL runs on
+
+    Returns:
+    - tuple | ('query', normalized query, probe token)
+    """
+    token = None
+    probe = default_probe(query) if probe is None else probe
+    if callable(probe):
+        token = probe()
+    else:
+        if engine is None:
+            raise ValueError("A probe query needs an engine to run on")
+        from sqlalchemy import text
+        with engine.connect() as conn:
+            token = tuple(conn.execute(text(probe)).fetchone() or ())
+    return ('query', " ".join(query.split()), repr(token))
+
+
+def default_probe(query: str) -> str:
+    """Row count of a query (or of a table, for a bare table name) as a change probe."""
+    query = query.strip().rstrip(';')
+    source = query if len(query.split()) == 1 else f"({query}) AS dq_probe"
+    return f"SELECT COUNT(*) FROM {source}"
+
+
+def _stable(value):
+    # Values whose repr is the same in every process; other objects (e.g. an
+    # Instrumentation, whose repr holds its address) are keyed by their type
+    if isinstance(value, dict):
+        return sorted((str(k), _stable(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_stable(v) for v in value]
+        return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+    if value is None or isinstance(value, (str, bytes, bool, int, float)):
+        return value
+    if isinstance(value, re.Pattern):
+        return ('pattern', value.pattern, value.flags)
+    return ('object', f"{type(value).__module__}.{type(value).__qualname__}")
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(repr(value).encode('utf-8')).hexdigest()[:32]
+
+
+class ResultCache:
+    """
+    On-disk cache of check results keyed by source fingerprint and checker configuration.
+
+    Parameters:
+    - cache_dir: str | Directory holding the pickled results
+    - max_bytes: int | Size limit; least recently used entries are evicted past it
+
+    Entries are named '<source>-<key>.pkl' so every cached result of one
+    source (whatever its fingerprint or configuration) can be invalidated at
+    once. Each hit refreshes the entry's mtime, which is what eviction orders by.
+    """
+
+    def __init__(self, cache_dir: str = ".dq_cache", max_bytes: int = 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, fingerprint: tuple, config: dict = None) -> str:
+        """Cache key of a source fingerprint plus checker configuration."""
+        return f"{_digest(fingerprint[:2])}-{_digest((fingerprint, _stable(config or {})))}"
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                results = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError) as e:
+            # Truncated files, or results pickled by code that has since changed
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+        os.utime(path)
+        logger.info(f"Result cache hit: {key}")
+        return results
+
+    def put(self, key: str, results):
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def invalidate(self, key: str = None, source: str = None):
+        """
+        Remove one entry (key) or every entry of a source (file path or query text).
+        """
+        if key is not None:
+            self._remove(self._path(key))
+        if source is not None:
+            kind = 'file' if os.path.exists(source) else 'query'
+            ident = os.path.abspath(source) if kind == 'file' else " ".join(source.split())
+            for path in glob.glob(os.path.join(self.cache_dir, f"{_digest((kind, ident))}-*.pkl")):
+                self._remove(path)
+
+    def clear(self):
+        for path in self._entries():
+            self._remove(path)
+
+    def size(self) -> int:
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in entries)
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= os.path.getsize(path)
+            self._remove(path)
+            logger.info(f"Evicted cache entry {path}")
+
+    def _entries(self):
+        return glob.glob(os.path.join(self.cache_dir, "*.pkl"))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
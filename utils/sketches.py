@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch.
+
+    Parameters:
+    - error: float | Target normalized rank error (e.g. 0.01 = ±1% of rank)
+    - seed: int | Seed for the random compaction offsets (optional)
+
+    The sketch keeps a stack of compactors; items at level h carry weight 2**h.
+    While fewer than `k` items have been seen no compaction happens and
+    quantiles are exact. States built on different chunks, partitions or
+    workers can be combined with `merge`.
+    """
+
+    def __init__(self, error: float = 0.01, seed: int = None):
+        if not 0 < error < 1:
+            raise ValueError(f"error must be in (0, 1), got {error}")
+        self.error = error
+        self.k = max(8, int(np.ceil(3.3 / error)))
+        self.n = 0
+        self.levels = [np.empty(0, dtype='float64')]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype='float64').ravel()
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.n += values.size
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype='float64'))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        if self.n == 0:
+            return np.nan
+        if len(self.levels) == 1:
+            # Nothing compacted yet: answer exactly, with pandas' linear interpolation
+            return float(np.quantile(self.levels[0], q))
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights)
+        idx = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(items[min(idx, len(items) - 1)])
+
+    def rank(self, value: float, inclusive: bool = False) -> float:
+        """Estimated number of items < value (or <= value when inclusive)."""
+        items, weights = self._weighted_items()
+        mask = items <= value if inclusive else items < value
+        return float(weights[mask].sum())
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype='float64'))
+                items = np.sort(self.levels[h])
+                leftover = items[:len(items) % 2]
+                items = items[len(items) % 2:]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[h] = leftover
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lvl), 2 ** h, dtype='float64') for h, lvl in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+
+def hash_numeric(values, hash_key: str = None) -> np.ndarray:
+    """
+    uint64 hash of numeric values that is exact for integers: integers hash as
+    int64 (no float64 rounding above 2**53), and floats holding an integer hash
+    like that integer, so a column read as int in one chunk and float in
+    another hashes alike. Missing values (NaN, NA) all hash alike.
+    """
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    kwargs = {'hash_key': hash_key} if hash_key else {}
+    missing = values.isna().to_numpy()
+    if pd.api.types.is_unsigned_integer_dtype(values.dtype) and isinstance(values.dtype, np.dtype):
+        hashed = pd.util.hash_array(values.to_numpy().view('int64'), **kwargs)
+    elif pd.api.types.is_integer_dtype(values.dtype):
+        hashed = pd.util.hash_array(values.to_numpy(dtype='int64', na_value=0), **kwargs)
+    else:
+        floats = values.to_numpy(dtype='float64', na_value=np.nan)
+        hashed = pd.util.hash_array(floats, **kwargs)
+        integral = np.isfinite(floats) & (floats == np.trunc(floats)) & (np.abs(floats) < 2.0 ** 63)
+        if integral.any():
+            hashed[integral] = pd.util.hash_array(floats[integral].astype('int64'), **kwargs)
+    if missing.any():
+        hashed[missing] = pd.util.hash_array(np.array([np.nan]), **kwargs)[0]
+    return hashed
+
+
+def hash_values(values) -> np.ndarray:
+    """
+    Hash values to uint64 so that equal values hash equally whichever chunk or
+    container they came from (numeric values through hash_numeric, exact for integers).
+    """
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        return hash_numeric(values)
+    if values.dtype != object:
+        values = values.astype(object)
+    return pd.util.hash_array(values.to_numpy())
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    length = np.zeros(x.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = x >= (np.uint64(1) << np.uint64(shift))
+        x = np.where(big, x >> np.uint64(shift), x)
+        length += big.astype(np.uint8) * shift
+    return length + (x > 0)
+
+
+class HyperLogLog:
+    """
+    Mergeable HyperLogLog distinct-count sketch.
+
+    Parameters:
+    - precision: int | log2 of the number of registers (4-18); memory is
+      2**precision bytes and the relative standard error is 1.04 / sqrt(2**precision)
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        """Add non-null values (array-like or Series) to the sketch."""
+        hashes = hash_values(values)
+        if hashes.size:
+            self.update_hashes(hashes)
+        return self
+
+    def update_hashes(self, hashes: np.ndarray):
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.intp)
+        remainder = hashes & ((np.uint64(1) << (np.uint64(64) - p)) - np.uint64(1))
+        rho = (64 - self.precision + 1 - _bit_length(remainder).astype(np.int64)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rho)
+        return self
+
+    def merge(self, other: "HyperLogLog"):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            return m * np.log(m / zeros)
+        return float(raw)